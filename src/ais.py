@@ -0,0 +1,132 @@
+"""
+Auxiliary module allowing to construct AI instances from their short names (as used in :doc:`main` and :doc:`tournament`).
+The short names follow the format:
+
+- ``mcts_<search_time_limit>_<search_steps_limit>_vanilla[_rave[<rave_k>]][_ponder]``, e.g. ``"mcts_5_inf_vanilla"`` or ``"mcts_5_inf_vanilla_ponder"`` (searching also on the opponent's time), 
+  for instances of ``MCTS`` from :doc:`mcts`,
+- ``mctsnc_<search_time_limit>_<search_steps_limit>_<n_trees>_<n_playouts>_<variant>[_rave[<rave_k>]][_<device_memory>g]``, e.g. ``"mctsnc_1_inf_4_128_ocp_thrifty"`` or ``"mctsnc_30_inf_4_256_acp_prodigal_16g"``,
+  for instances of ``MCTSNC`` from :doc:`mctsnc`,
+
+where ``inf`` stands for no limit. Optional token ``rave`` (e.g. ``"mcts_5_inf_vanilla_rave"`` or ``"mctsnc_1_inf_4_128_acp_prodigal_rave500"``) switches on RAVE (AMAF statistics), 
+with the equivalence parameter ``rave_k`` following it (if not given, default of the class). Short name ``"human"`` stands for a human player (no AI instance).
+
+Module :doc:`mctsnc` is imported only when an ``MCTSNC`` instance is actually constructed (its kernels get compiled at import, which requires CUDA),
+hence registries of AIs (see ``make_ais_registry``) can be declared cheaply and matches of ``MCTS`` instances can be played on hosts without CUDA.
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+import sys
+from functools import partial
+from mcts import MCTS
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+HUMAN_SHORTNAME = "human"
+MCTSNC_VARIANTS = ["ocp_thrifty", "ocp_prodigal", "acp_thrifty", "acp_prodigal"] # as in MCTSNC.VARIANTS (module mctsnc not imported here)
+
+def _parse_limit(token):
+    """Returns a float limit parsed from a short name token (``"inf"`` meaning no limit)."""
+    return np.inf if token == "inf" else float(token)
+
+def _parse_rave(token, params):
+    """Updates keyword arguments of a constructor with RAVE settings parsed from a short name token (``"rave"`` or ``"rave<rave_k>"``), raises ``ValueError`` for other tokens."""
+    if not token.startswith("rave"):
+        raise ValueError
+    params["rave"] = True
+    if len(token) > len("rave"):
+        params["rave_k"] = float(token[len("rave"):])
+
+def parse_ai_shortname(shortname):
+    """
+    Parses a short name of an AI and returns a dictionary with the class name and the constructor's keyword arguments it implies.
+
+    Args:
+        shortname (str):
+            short name of an AI, e.g. ``"mcts_5_inf_vanilla"`` or ``"mctsnc_1_inf_4_128_ocp_thrifty"``.
+
+    Returns:
+        spec (dict):
+            dictionary with key ``"class"`` (``"MCTS"`` or ``"MCTSNC"``) and key ``"params"`` (dictionary of keyword arguments for the constructor).
+    """
+    tokens = shortname.split("_")
+    try:
+        if tokens[0] == "mcts" and len(tokens) in [4, 5, 6] and tokens[3] == "vanilla":
+            params = {"search_time_limit": _parse_limit(tokens[1]), "search_steps_limit": _parse_limit(tokens[2]), "vanilla": True}
+            suffix = tokens[4:]
+            if suffix and suffix[-1] == "ponder":
+                params["ponder"] = True
+                suffix = suffix[:-1]
+            if len(suffix) > 1:
+                raise ValueError
+            if suffix:
+                _parse_rave(suffix[0], params)
+            return {"class": "MCTS", "params": params}
+        if tokens[0] == "mctsnc" and len(tokens) in [7, 8, 9]:
+            params = {"search_time_limit": _parse_limit(tokens[1]), "search_steps_limit": _parse_limit(tokens[2]), "n_trees": int(tokens[3]), "n_playouts": int(tokens[4]),
+                      "variant": tokens[5] + "_" + tokens[6]}
+            if params["variant"] not in MCTSNC_VARIANTS:
+                raise ValueError
+            suffix = tokens[7:]
+            if suffix and suffix[-1].endswith("g"):
+                params["device_memory"] = float(suffix[-1][:-1])
+                suffix = suffix[:-1]
+            if len(suffix) > 1:
+                raise ValueError
+            if suffix:
+                _parse_rave(suffix[0], params)
+            return {"class": "MCTSNC", "params": params}
+    except ValueError:
+        pass
+    sys.exit(f"[parse_ai_shortname(): exiting due to unrecognized AI short name: {shortname}]")
+
+def make_ai(shortname, state_class):
+    """
+    Constructs and returns an AI instance defined by its short name, for searches on states of the given class.
+
+    Args:
+        shortname (str):
+            short name of an AI, e.g. ``"mcts_5_inf_vanilla"`` or ``"mctsnc_1_inf_4_128_ocp_thrifty"``, or ``"human"``.
+        state_class (class):
+            class of states (game) the AI is meant for (e.g. ``C4``, ``Gomoku``, ``Kalah``).
+
+    Returns:
+        ai (object):
+            instance of ``MCTS`` or ``MCTSNC`` class, or ``None`` for a human.
+    """
+    if shortname == HUMAN_SHORTNAME:
+        return None
+    spec = parse_ai_shortname(shortname)
+    if spec["class"] == "MCTS":
+        return MCTS(**spec["params"])
+    from mctsnc import MCTSNC # imported on demand (requires CUDA)
+    return MCTSNC(state_class.get_board_shape(), state_class.get_extra_info_memory(), state_class.get_max_actions(), **spec["params"],
+                  action_index_to_name_function=state_class.action_index_to_name)
+
+def make_ais_registry(shortnames, state_class):
+    """
+    Returns a registry of AIs: a dictionary mapping short names to factories (functions with no arguments) constructing AI instances on demand.
+    Short names are parsed (validated) at once, but no AI instance is constructed until its factory is called.
+
+    Args:
+        shortnames (list(str)):
+            short names of AIs, e.g. ``["mcts_5_inf_vanilla", "mctsnc_1_inf_4_128_ocp_thrifty"]``.
+        state_class (class):
+            class of states (game) the AIs are meant for (e.g. ``C4``, ``Gomoku``, ``Kalah``).
+
+    Returns:
+        registry (dict):
+            dictionary mapping short names to factories of AI instances.
+    """
+    for shortname in shortnames:
+        parse_ai_shortname(shortname)
+    return {shortname: partial(make_ai, shortname, state_class) for shortname in shortnames}
+
+def is_mctsnc(ai):
+    """Returns ``True`` if the given AI is an instance of ``MCTSNC`` class (without importing module :doc:`mctsnc` if it has not been imported)."""
+    mctsnc_module = sys.modules.get("mctsnc")
+    return mctsnc_module is not None and isinstance(ai, mctsnc_module.MCTSNC)
@@ -0,0 +1,183 @@
+"""
+Script to benchmark throughput (steps and playouts per second) of search engines - AIs identified by short names (see :doc:`ais`) - on fixed positions of games,
+with a fixed budget of steps (imposed via ``forced_search_steps_limit``), independently of full matches.
+Positions are obtained by a fixed number of random moves (plies) from the initial state, with a fixed seed, hence are the same from run to run.
+For each game, position and engine, the benchmark reports: steps, steps per second, playouts, playouts per second, tree size and mean / maximum depth.
+Results are appended (as a new run, labeled by current git commit) to a JSON file in the benchmarks folder, named by hash strings of ``cpu_and_system_props()``
+and ``gpu_props()``, and compared against the previous run on the same environment, so that regressions between commits are visible.
+Engines that cannot be run on a game (``MCTSNC`` without CUDA or with state sizes exceeding sizes compiled into playout kernels) are skipped.
+
+The following variables allow to define the settings of a benchmark:
+
+.. code-block:: python
+
+    STATE_CLASSES = [C4, Gomoku, Kalah]
+    ENGINES_SHORTNAMES = ["mcts_inf_inf_vanilla", "mctsnc_inf_inf_8_128_ocp_thrifty", "mctsnc_inf_inf_8_128_ocp_prodigal", "mctsnc_inf_inf_8_128_acp_thrifty", "mctsnc_inf_inf_8_128_acp_prodigal"]
+    N_STEPS = {"MCTS": 1000, "MCTSNC": 100} # per class of engine
+    N_WARM_UP_STEPS = 10
+    POSITIONS_PLIES = [0, 10] # numbers of random moves from initial state
+    POSITIONS_SEED = 0
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+from numba import cuda
+from c4 import C4
+from gomoku import Gomoku
+from kalah import Kalah
+from ais import parse_ai_shortname, make_ai
+from mctsnc_game_mechanics import PLAYOUT_BOARD_SHAPE, PLAYOUT_EXTRA_INFO_MEMORY, PLAYOUT_MAX_ACTIONS
+from utils import cpu_and_system_props, gpu_props, hash_str
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+# benchmark settings
+STATE_CLASSES = [C4, Gomoku, Kalah]
+ENGINES_SHORTNAMES = ["mcts_inf_inf_vanilla", "mctsnc_inf_inf_8_128_ocp_thrifty", "mctsnc_inf_inf_8_128_ocp_prodigal", "mctsnc_inf_inf_8_128_acp_thrifty", "mctsnc_inf_inf_8_128_acp_prodigal"]
+N_STEPS = {"MCTS": 1000, "MCTSNC": 100} # per class of engine
+N_WARM_UP_STEPS = 10
+POSITIONS_PLIES = [0, 10] # numbers of random moves from initial state
+POSITIONS_SEED = 0
+
+# folders
+FOLDER_BENCHMARKS = "../benchmarks/"
+
+def benchmark_fpath(c_props, g_props, folder):
+    """Returns the path of the JSON file with benchmark results for given environment (CPU and system properties, GPU properties)."""
+    return folder + f"{hash_str(c_props, 10)}_{hash_str(g_props, 3)}.json"
+
+def make_position(state_class, n_plies, seed):
+    """Returns a fixed position (state) of a game obtained by given number of random moves from the initial state, with given seed."""
+    np.random.seed(seed)
+    state = state_class()
+    for _ in range(n_plies):
+        if state.compute_outcome() is not None:
+            sys.exit(f"[make_position(): exiting due to game finished before ply {n_plies} for: {state_class.class_repr()}]")
+        state = state.take_random_action_playout()
+    state.parent = None
+    state.children = {}
+    return state
+
+def engine_applicable(engine_class, state_class):
+    """Returns ``True`` if an engine of given class can be run on states of given class (``MCTSNC`` requires CUDA and state sizes fitting sizes compiled into playout kernels)."""
+    if engine_class == "MCTS":
+        return True
+    board_shape = state_class.get_board_shape()
+    return cuda.is_available() and board_shape[0] <= PLAYOUT_BOARD_SHAPE[0] and board_shape[1] <= PLAYOUT_BOARD_SHAPE[1] \
+        and state_class.get_extra_info_memory() <= PLAYOUT_EXTRA_INFO_MEMORY and state_class.get_max_actions() <= PLAYOUT_MAX_ACTIONS
+
+def _search(ai, engine_class, position, n_steps):
+    """Runs a search by an AI from a position with forced number of steps (console output of the AI suppressed) and returns its performance information."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        if engine_class == "MCTSNC":
+            ai.run(position.get_board(), position.get_extra_info(), position.get_turn(), n_steps)
+        else:
+            ai.run(position, n_steps)
+    return ai.performance_info
+
+def benchmark_entry(engine_shortname, state_class, n_plies, seed, n_steps, n_warm_up_steps):
+    """Benchmarks an engine on a fixed position and returns a dictionary with results: steps, steps per second, playouts, playouts per second, tree size and depths."""
+    engine_class = parse_ai_shortname(engine_shortname)["class"]
+    ai = make_ai(engine_shortname, state_class)
+    ai.verbose_info = True # performance information needed
+    if engine_class == "MCTSNC":
+        with contextlib.redirect_stdout(io.StringIO()):
+            ai.init_device_side_arrays()
+    _search(ai, engine_class, make_position(state_class, n_plies, seed), n_warm_up_steps) # compilations, caches
+    pi = _search(ai, engine_class, make_position(state_class, n_plies, seed), n_steps)
+    tree_info = pi["trees"] if engine_class == "MCTSNC" else pi["tree"]
+    return {"steps": int(pi["steps"]), "steps_per_second": float(pi["steps_per_second"]), "playouts": int(pi["playouts"]), "playouts_per_second": float(pi["playouts_per_second"]),
+            "tree_size": float(tree_info["mean_size"] if engine_class == "MCTSNC" else tree_info["size"]),
+            "mean_depth": float(tree_info["mean_depth"]), "max_depth": int(tree_info["max_depth"])}
+
+def git_commit_label():
+    """Returns the short hash of current git commit (with ``"+"`` appended if the working tree has changes), or ``"unknown"``."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True).stdout.strip() != ""
+        return commit + ("+" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def run_benchmark(state_classes, engines_shortnames, n_steps, n_warm_up_steps, positions_plies, positions_seed, folder):
+    """
+    Carries out the benchmark for all applicable combinations of games, positions and engines, appends results as a new run to the JSON file for the environment and returns the run.
+
+    Args:
+        state_classes (list(class)):
+            classes of states (games), e.g. ``[C4, Gomoku, Kalah]``.
+        engines_shortnames (list(str)):
+            short names of engines (AIs).
+        n_steps (dict):
+            numbers of steps to be forced per class of engine (``"MCTS"``, ``"MCTSNC"``).
+        n_warm_up_steps (int):
+            number of steps of a warm-up search preceding the measured one.
+        positions_plies (list(int)):
+            numbers of random moves from the initial state defining positions.
+        positions_seed (int):
+            seed for random moves defining positions.
+        folder (str):
+            folder with benchmark results.
+
+    Returns:
+        run (dict):
+            dictionary with label (git commit), date, settings and results (keyed by ``"<game>;<plies>;<engine>"``).
+    """
+    print("BENCHMARK...")
+    t1 = time.time()
+    c_props = cpu_and_system_props()
+    g_props = gpu_props()
+    run = {"label": git_commit_label(), "date": time.strftime("%Y-%m-%d %H:%M:%S"), "n_steps": n_steps, "positions_seed": positions_seed, "results": {}}
+    for state_class in state_classes:
+        for n_plies in positions_plies:
+            make_position(state_class, n_plies, positions_seed) # checks if position is valid (not terminal)
+            for engine_shortname in engines_shortnames:
+                engine_class = parse_ai_shortname(engine_shortname)["class"]
+                key = f"{state_class.class_repr()};{n_plies};{engine_shortname}"
+                if not engine_applicable(engine_class, state_class):
+                    print(f"[{key} skipped: engine not applicable]")
+                    continue
+                entry = benchmark_entry(engine_shortname, state_class, n_plies, positions_seed, n_steps[engine_class], n_warm_up_steps)
+                run["results"][key] = entry
+                print(f"[{key} -> steps/s: {entry['steps_per_second']:.1f}, playouts/s: {entry['playouts_per_second']:.1f}, tree size: {entry['tree_size']:.1f}, "
+                      f"mean/max depth: {entry['mean_depth']:.2f}/{entry['max_depth']}]")
+    fpath = benchmark_fpath(c_props, g_props, folder)
+    benchmark_info = {"cpu_and_system_props": c_props, "gpu_props": g_props, "runs": []}
+    if os.path.isfile(fpath):
+        with open(fpath, "r", encoding="utf-8") as f:
+            benchmark_info = json.load(f)
+    previous_run = benchmark_info["runs"][-1] if len(benchmark_info["runs"]) > 0 else None
+    benchmark_info["runs"].append(run)
+    os.makedirs(folder, exist_ok=True)
+    with open(fpath + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(benchmark_info, f, indent=2)
+    os.replace(fpath + ".tmp", fpath)
+    if previous_run is not None:
+        print(f"COMPARISON WITH PREVIOUS RUN [label: {previous_run['label']}, date: {previous_run['date']}]:")
+        print(comparison_str(previous_run, run))
+    t2 = time.time()
+    print(f"BENCHMARK DONE. [results file: {fpath}, time: {t2 - t1} s]")
+    return run
+
+def comparison_str(run_old, run_new):
+    """Returns a string representation of ratios of playouts per second (new to old) for entries common to two benchmark runs."""
+    lines = []
+    for key, entry in run_new["results"].items():
+        if key in run_old["results"]:
+            ratio = entry["playouts_per_second"] / run_old["results"][key]["playouts_per_second"]
+            lines.append(f"{key}: playouts/s {run_old['results'][key]['playouts_per_second']:.1f} -> {entry['playouts_per_second']:.1f} (x{ratio:.3f})")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    run_benchmark(STATE_CLASSES, ENGINES_SHORTNAMES, N_STEPS, N_WARM_UP_STEPS, POSITIONS_PLIES, POSITIONS_SEED, FOLDER_BENCHMARKS)
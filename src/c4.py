@@ -1,7 +1,6 @@
 import numpy as np
 from mcts import State
-from numba import jit
-from numba import int8
+from utils import lazy_jit
 
 __version__ = "1.0.1"
 __author__ = "Przemysław Klęsk"
@@ -162,7 +161,7 @@ class C4(State):
         return None    
     
     @staticmethod
-    @jit(int8(int8, int8, int8, int8, int8, int8[:, :]), nopython=True, cache=True)  
+    @lazy_jit("int8(int8, int8, int8, int8, int8, int8[:, :])", nopython=True, cache=True)  
     def compute_outcome_job_numba_jit(M, N, turn, last_i, last_j, board):
         """Called by ``compute_outcome_job`` for faster outcomes."""
         last_token = -turn        
@@ -250,6 +249,33 @@ class C4(State):
                 one-dimensional array with additional information associated with this state - fills of columns.        
         """
         return self.column_fills    
+
+    @classmethod
+    def from_position(cls, board, extra_info, turn):
+        """
+        Returns a new state (with no parent) of Connect 4 game representing the position given by its board, fills of columns and turn.
+        
+        Args:
+            board (ndarray[np.int8, ndim=2]):
+                board of the position.
+            extra_info (ndarray[np.int8, ndim=1]):
+                fills of columns.
+            turn {-1, 1}:
+                indicator of the player to act.
+        
+        Returns:
+            state (C4):
+                state representing the position.
+        """
+        state = cls()
+        state.board = np.array(board, dtype=np.int8)
+        state.column_fills = np.array(extra_info, dtype=np.int8)
+        state.turn = turn
+        return state
+    
+    def estimate_moves_left(self):
+        """Returns an estimate of the number of moves left for the player to act - half of empty cells (upper bound, as a game may end earlier)."""
+        return int(np.ceil(np.count_nonzero(self.board == 0) / 2))
     
     @staticmethod    
     def action_name_to_index(action_name):
@@ -0,0 +1,172 @@
+"""
+Auxiliary module with an index (catalog) of experiments, kept as a small SQLite database within the folder of experiments, and a query API over it.
+For each zipped experiment (see ``save_and_zip_experiment`` in :doc:`utils`) the index keeps one row with: the match-up information (short names of AIs,
+parameters implied by them, name of game, number of games), names of CPU and GPU, main statistics, and JSON strings with complete match-up information,
+environment properties and statistics. The index is updated incrementally - only zip files not yet indexed (or modified since) are read.
+
+Queries select experiments by values of index columns, e.g.:
+
+.. code-block:: python
+
+    query_experiments(FOLDER_EXPERIMENTS, game_name="C4_6x7", ai_a_shortname="mcts_5_inf_vanilla", ai_b_variant="ocp_prodigal", ai_b_n_trees=4)
+    query_experiments_array(FOLDER_EXPERIMENTS, "ai_b_n_trees", [1, 2, 4, 8], "ai_b_n_playouts", [32, 64, 128, 256],
+                            game_name="C4_6x7", ai_a_shortname="mcts_5_inf_vanilla", ai_b_search_time_limit=1.0, ai_b_variant="ocp_prodigal")
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+import sqlite3
+import json
+import os
+import sys
+import time
+from utils import unzip_and_load_experiment
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+INDEX_FNAME = "experiments_index.sqlite"
+AI_COLUMNS_TYPES = {"shortname": "TEXT", "class": "TEXT", "search_time_limit": "REAL", "search_steps_limit": "REAL", "n_trees": "INTEGER", "n_playouts": "INTEGER", "variant": "TEXT"}
+INDEX_COLUMNS_TYPES = {
+    "hash_str": "TEXT PRIMARY KEY", "zip_mtime": "REAL",
+    "game_name": "TEXT", "n_games": "INTEGER",
+    **{"ai_a_" + name: sql_type for name, sql_type in AI_COLUMNS_TYPES.items()},
+    **{"ai_b_" + name: sql_type for name, sql_type in AI_COLUMNS_TYPES.items()},
+    "cpu_name": "TEXT", "gpu_name": "TEXT",
+    "score_a_mean": "REAL", "score_b_mean": "REAL",
+    "matchup_info": "TEXT", "cpu_and_system_props": "TEXT", "gpu_props": "TEXT", "stats": "TEXT"
+    }
+
+def index_fpath(folder):
+    """Returns the path of the index database for a folder of experiments."""
+    return folder + INDEX_FNAME
+
+def _connect(folder):
+    """Connects to the index database of a folder of experiments (creating its table if needed) and returns the connection."""
+    connection = sqlite3.connect(index_fpath(folder))
+    columns_sql = ", ".join(f"{name} {sql_type}" for name, sql_type in INDEX_COLUMNS_TYPES.items())
+    connection.execute(f"CREATE TABLE IF NOT EXISTS experiments ({columns_sql})")
+    return connection
+
+def ai_shortname_fields(shortname):
+    """
+    Returns a dictionary with fields implied by a short name of an AI (see :doc:`ais`): class, limits, number of trees and playouts, variant.
+    Fields not applicable (e.g. number of trees for ``MCTS``) or not recognized are ``None``.
+    """
+    fields = {name: None for name in AI_COLUMNS_TYPES}
+    fields["shortname"] = shortname
+    tokens = shortname.split("_")
+    try:
+        if tokens[0] == "mcts" and len(tokens) in [4, 5, 6]:
+            fields.update({"class": "MCTS", "search_time_limit": float(tokens[1]), "search_steps_limit": float(tokens[2]), "variant": "_".join(tokens[3:])})
+        elif tokens[0] == "mctsnc" and len(tokens) in [7, 8, 9]:
+            fields.update({"class": "MCTSNC", "search_time_limit": float(tokens[1]), "search_steps_limit": float(tokens[2]), "n_trees": int(tokens[3]), "n_playouts": int(tokens[4]),
+                           "variant": "_".join(token for token in tokens[5:] if not token.endswith("g"))})
+    except ValueError:
+        pass
+    return fields
+
+def experiment_to_row(experiment_hs, zip_mtime, experiment_info):
+    """Returns a dictionary representing the index row of an experiment given its hash string, modification time of its zip file and the dictionary with its information."""
+    matchup_info = experiment_info["matchup_info"]
+    stats = experiment_info["stats"]
+    row = {"hash_str": experiment_hs, "zip_mtime": zip_mtime, "game_name": matchup_info["game_name"], "n_games": matchup_info["n_games"]}
+    for side in ["a", "b"]:
+        for name, value in ai_shortname_fields(matchup_info[f"ai_{side}_shortname"]).items():
+            row[f"ai_{side}_{name}"] = value
+    row["cpu_name"] = experiment_info["cpu_and_system_props"]["cpu_name"]
+    row["gpu_name"] = experiment_info["gpu_props"]["name"]
+    row["score_a_mean"] = stats["score_a_mean"]
+    row["score_b_mean"] = stats["score_b_mean"]
+    for key in ["matchup_info", "cpu_and_system_props", "gpu_props", "stats"]:
+        row[key] = json.dumps(experiment_info[key])
+    return row
+
+def update_index(folder):
+    """Updates the index of a folder of experiments: adds zip files not yet indexed, reindexes modified ones and removes rows of deleted ones; returns the number of changes."""
+    print(f"UPDATE EXPERIMENTS INDEX... [folder: {folder}]")
+    t1 = time.time()
+    zips_mtimes = {fname[:-len(".zip")]: os.path.getmtime(folder + fname) for fname in os.listdir(folder) if fname.endswith(".zip")}
+    with _connect(folder) as connection:
+        indexed_mtimes = dict(connection.execute("SELECT hash_str, zip_mtime FROM experiments").fetchall())
+        to_remove = [experiment_hs for experiment_hs in indexed_mtimes if experiment_hs not in zips_mtimes]
+        to_add = sorted(experiment_hs for experiment_hs, zip_mtime in zips_mtimes.items() if indexed_mtimes.get(experiment_hs) != zip_mtime)
+        connection.executemany("DELETE FROM experiments WHERE hash_str = ?", [(experiment_hs,) for experiment_hs in to_remove])
+        placeholders = ", ".join("?" for _ in INDEX_COLUMNS_TYPES)
+        for experiment_hs in to_add:
+            row = experiment_to_row(experiment_hs, zips_mtimes[experiment_hs], unzip_and_load_experiment(experiment_hs, folder))
+            connection.execute(f"INSERT OR REPLACE INTO experiments VALUES ({placeholders})", [row[name] for name in INDEX_COLUMNS_TYPES])
+    connection.close()
+    t2 = time.time()
+    print(f"UPDATE EXPERIMENTS INDEX DONE. [added or updated: {len(to_add)}, removed: {len(to_remove)}, time: {t2 - t1} s]")
+    return len(to_add) + len(to_remove)
+
+def query_experiments(folder, ai_shortname=None, update=True, **filters):
+    """
+    Queries the index of a folder of experiments (updating it first) and returns the sorted list of hash strings of experiments matching all given filters.
+
+    Args:
+        folder (str):
+            folder with experiments.
+        ai_shortname (str):
+            short name of an AI that must take part in the experiment (on either side), ``None`` for any, defaults to ``None``.
+        update (bool):
+            flag stating whether the index should be updated before the query, defaults to ``True``.
+        filters (dict):
+            values of index columns to be matched, e.g. ``game_name="C4_6x7"``, ``ai_b_variant="acp_prodigal"``, ``ai_b_n_trees=4``, ``ai_b_n_playouts=256``.
+
+    Returns:
+        experiments_hs (list(str)):
+            hash strings of matching experiments.
+    """
+    for name in filters:
+        if name not in INDEX_COLUMNS_TYPES:
+            sys.exit(f"[query_experiments(): exiting due to unknown index column: {name}]")
+    conditions = [f"{name} = ?" for name in filters]
+    values = list(filters.values())
+    if ai_shortname is not None:
+        conditions.append("(ai_a_shortname = ? OR ai_b_shortname = ?)")
+        values += [ai_shortname, ai_shortname]
+    where_sql = (" WHERE " + " AND ".join(conditions)) if len(conditions) > 0 else ""
+    if update:
+        update_index(folder)
+    with _connect(folder) as connection:
+        experiments_hs = [row[0] for row in connection.execute(f"SELECT hash_str FROM experiments{where_sql} ORDER BY hash_str", values).fetchall()]
+    connection.close()
+    return experiments_hs
+
+def query_experiments_array(folder, rows_column, rows_values, cols_column, cols_values, **filters):
+    """
+    Queries the index of a folder of experiments for a two-dimensional grid of experiments (e.g. numbers of trees against numbers of playouts),
+    each entry required to be matched by exactly one experiment, and returns the array of hash strings.
+
+    Args:
+        folder (str):
+            folder with experiments.
+        rows_column (str):
+            index column varying along rows, e.g. ``"ai_b_n_trees"``.
+        rows_values (list):
+            values of ``rows_column`` for consecutive rows.
+        cols_column (str):
+            index column varying along columns, e.g. ``"ai_b_n_playouts"``.
+        cols_values (list):
+            values of ``cols_column`` for consecutive columns.
+        filters (dict):
+            values of other index columns to be matched (common for all entries).
+
+    Returns:
+        experiments_hs_array (ndarray):
+            two-dimensional array of hash strings with shape ``(len(rows_values), len(cols_values))``.
+    """
+    update_index(folder)
+    experiments_hs_array = np.empty((len(rows_values), len(cols_values)), dtype=object)
+    for i, row_value in enumerate(rows_values):
+        for j, col_value in enumerate(cols_values):
+            experiments_hs = query_experiments(folder, update=False, **filters, **{rows_column: row_value, cols_column: col_value})
+            if len(experiments_hs) != 1:
+                sys.exit(f"[query_experiments_array(): exiting due to {len(experiments_hs)} experiments matching: {rows_column}={row_value}, {cols_column}={col_value}, {filters}]")
+            experiments_hs_array[i, j] = experiments_hs[0]
+    return experiments_hs_array.astype(str)
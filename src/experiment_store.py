@@ -0,0 +1,170 @@
+"""
+Auxiliary module with a columnar store of experiments, meant for fast analyses (see :doc:`plots`).
+For each experiment (zipped .json and .log files, see ``save_and_zip_experiment`` in :doc:`utils`) the store keeps an ``.npz`` file (under the same hash string)
+with the following columns (one-dimensional arrays):
+
+- per-move columns (one row per moves round and side that performed a search): ``"game"``, ``"round"``, ``"side"`` (``1`` - black, ``-1`` - white),
+  ``"steps"``, ``"playouts"``, ``"playouts_per_second"``, ``"time_total"`` [ms], ``"mean_depth"``, ``"max_depth"``,
+  ``"best_index"``, ``"best_n"``, ``"best_n_wins"``, ``"best_q"``, ``"best_ucb"``,
+- per-game columns: ``"games_outcome"``, ``"games_black"``, ``"games_white"`` (string representations of AIs),
+- ``"meta"``: JSON string with the remaining information (match-up, environment and statistics).
+
+Since ``.npz`` files are read lazily, loading a subset of columns does not decompress the others.
+The store is populated by an import of existing zipped experiments (``import_experiments``) or on demand, when columns of a not yet imported experiment are requested;
+an experiment whose zip file is newer than its ``.npz`` file (e.g. rerun under the same hash string) is imported anew.
+Aggregations over many experiments can be distributed across a pool of processes by ``map_experiments``, each worker reducing its experiment to a small summary.
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from utils import unzip_and_load_experiment
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+MOVES_COLUMNS_DTYPES = {
+    "game": np.int16, "round": np.int16, "side": np.int8,
+    "steps": np.int64, "playouts": np.int64, "playouts_per_second": np.float64, "time_total": np.float64, "mean_depth": np.float64, "max_depth": np.float64,
+    "best_index": np.int16, "best_n": np.int64, "best_n_wins": np.int64, "best_q": np.float64, "best_ucb": np.float64
+    }
+GAMES_COLUMNS = ["games_outcome", "games_black", "games_white"]
+SIDES_PREFIXES = {1: "black_", -1: "white_"}
+
+def store_fpath(experiment_hs, folder):
+    """Returns the path of the columnar (``.npz``) file of an experiment given its hash string."""
+    return folder + experiment_hs + ".npz"
+
+def store_is_stale(experiment_hs, folder):
+    """Returns ``True`` if the columnar (``.npz``) file of an experiment is missing or older than its zip file, if present (then the experiment is to be imported anew)."""
+    fpath = store_fpath(experiment_hs, folder)
+    zip_fpath = folder + experiment_hs + ".zip"
+    if not os.path.isfile(fpath):
+        return True
+    return os.path.isfile(zip_fpath) and os.path.getmtime(zip_fpath) > os.path.getmtime(fpath)
+
+def experiment_to_columns(experiment_info):
+    """Returns a dictionary of columns (arrays) representing an experiment given the dictionary with its information (as loaded from zipped .json file)."""
+    moves_columns = {name: [] for name in MOVES_COLUMNS_DTYPES}
+    games_outcome = []
+    games_black = []
+    games_white = []
+    games_infos = experiment_info["games_infos"]
+    for g in range(len(games_infos)):
+        game_info = games_infos[str(g + 1)]
+        games_outcome.append(int(game_info["outcome"]))
+        games_black.append(game_info["black"])
+        games_white.append(game_info["white"])
+        moves_rounds = game_info["moves_rounds"]
+        for m in range(len(moves_rounds)):
+            moves_round = moves_rounds[str(m + 1)]
+            for side, prefix in SIDES_PREFIXES.items():
+                if prefix + "performance_info" not in moves_round:
+                    continue
+                pi = moves_round[prefix + "performance_info"]
+                bai = moves_round[prefix + "best_action_info"]
+                trees_key = "trees" if "trees" in pi else "tree"
+                row = {"game": g + 1, "round": m + 1, "side": side,
+                       "steps": pi["steps"], "playouts": pi["playouts"], "playouts_per_second": pi["playouts_per_second"], "time_total": pi["times_[ms]"]["total"],
+                       "mean_depth": pi[trees_key]["mean_depth"], "max_depth": pi[trees_key]["max_depth"],
+                       "best_index": bai["index"], "best_n": bai["n"], "best_n_wins": bai["n_wins"], "best_q": bai["q"], "best_ucb": bai["ucb"]}
+                for name in MOVES_COLUMNS_DTYPES:
+                    moves_columns[name].append(row[name])
+    columns = {name: np.array(values, dtype=MOVES_COLUMNS_DTYPES[name]) for name, values in moves_columns.items()}
+    columns["games_outcome"] = np.array(games_outcome, dtype=np.int8)
+    columns["games_black"] = np.array(games_black, dtype=str)
+    columns["games_white"] = np.array(games_white, dtype=str)
+    meta = {key: value for key, value in experiment_info.items() if key != "games_infos"}
+    columns["meta"] = np.array(json.dumps(meta))
+    return columns
+
+def import_experiment(experiment_hs, folder):
+    """Imports a zipped experiment given its hash string into the columnar store (writes its ``.npz`` file)."""
+    print(f"IMPORT EXPERIMENT... [hash string: {experiment_hs}]")
+    t1 = time.time()
+    experiment_info = unzip_and_load_experiment(experiment_hs, folder)
+    columns = experiment_to_columns(experiment_info)
+    fpath = store_fpath(experiment_hs, folder)
+    fpath_tmp = fpath + f".{os.getpid()}.tmp" # process-specific, in case of concurrent imports (see map_experiments)
+    with open(fpath_tmp, "wb") as f:
+        np.savez_compressed(f, **columns)
+    os.replace(fpath_tmp, fpath)
+    t2 = time.time()
+    print(f"IMPORT EXPERIMENT DONE. [time: {t2 - t1} s]")
+
+def import_experiments(folder):
+    """Imports all zipped experiments from a folder, not yet present in the columnar store or stale there (see ``store_is_stale``); returns the list of hash strings of imported experiments."""
+    print(f"IMPORT EXPERIMENTS... [folder: {folder}]")
+    t1 = time.time()
+    imported_hs = []
+    for fname in sorted(os.listdir(folder)):
+        if fname.endswith(".zip"):
+            experiment_hs = fname[:-len(".zip")]
+            if store_is_stale(experiment_hs, folder):
+                import_experiment(experiment_hs, folder)
+                imported_hs.append(experiment_hs)
+    t2 = time.time()
+    print(f"IMPORT EXPERIMENTS DONE. [imported: {len(imported_hs)}, time: {t2 - t1} s]")
+    return imported_hs
+
+def load_experiment_columns(experiment_hs, columns, folder):
+    """
+    Loads requested columns of an experiment from the columnar store (importing the experiment first, if not yet present in the store or stale there).
+
+    Args:
+        experiment_hs (str):
+            hash string of the experiment.
+        columns (list(str)):
+            names of columns to be loaded (see the module's description).
+        folder (str):
+            folder with experiments.
+
+    Returns:
+        columns_dict (dict):
+            dictionary mapping names of columns to arrays (``"meta"`` mapped to a dictionary).
+    """
+    fpath = store_fpath(experiment_hs, folder)
+    if store_is_stale(experiment_hs, folder):
+        import_experiment(experiment_hs, folder)
+    columns_dict = {}
+    with np.load(fpath) as npz:
+        for name in columns:
+            columns_dict[name] = json.loads(str(npz[name])) if name == "meta" else npz[name]
+    return columns_dict
+
+def map_experiments(function, experiments_hs_array, folder, n_workers=None):
+    """
+    Applies a function to each experiment from an array of hash strings in a pool of processes and returns the array of results (of the same shape).
+    The function is meant to load the columns it needs and reduce them to a summary, so that only small results are sent back to the main process.
+
+    Args:
+        function (callable):
+            module-level function (picklable, possibly wrapped by ``functools.partial``) called as ``function(experiment_hs, folder)``.
+        experiments_hs_array (ndarray):
+            array (of any shape) of hash strings of experiments.
+        folder (str):
+            folder with experiments.
+        n_workers (int):
+            number of processes, ``None`` for the number of CPUs, defaults to ``None``.
+
+    Returns:
+        results (ndarray):
+            array of objects (results of function) with the same shape as ``experiments_hs_array``.
+    """
+    experiments_hs_array = np.asarray(experiments_hs_array)
+    print(f"MAP EXPERIMENTS... [experiments: {experiments_hs_array.size}, workers: {n_workers if n_workers is not None else os.cpu_count()}]")
+    t1 = time.time()
+    results = np.empty(experiments_hs_array.shape, dtype=object)
+    experiments_hs_flat = experiments_hs_array.ravel()
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        for k, result in enumerate(executor.map(function, experiments_hs_flat, [folder] * experiments_hs_flat.size)):
+            results.flat[k] = result
+    t2 = time.time()
+    print(f"MAP EXPERIMENTS DONE. [time: {t2 - t1} s]")
+    return results
@@ -1,5 +1,6 @@
 import numpy as np
-from mctsnc import MCTSNC
+from ais import is_mctsnc
+from time_manager import TimeManager
 
 __version__ = "1.0.1"
 __author__ = "Przemysław Klęsk"
@@ -22,6 +23,13 @@ class GameRunner:
             total of games in a match (for informative purposes).
         experiment_info_old (dict):
             dictionary allowing to reproduce a former experiment (allows to force the limit of steps rather than time on an AI instance) or ``None`` for a new experiment, , defaults to ``None``.
+        game_clock (float):
+            total time [s] for all moves of each AI in the game, allocated to moves by time managers (see :doc:`time_manager`), or ``None`` for fixed per-move limits of AIs, defaults to ``None``.
+        opening_book (OpeningBook):
+            opening book (see :doc:`opening_book`) consulted before searches of AIs (book hits played at once and reported in moves rounds information) or ``None`` for no book, defaults to ``None``.
+        search_cache (SearchCache):
+            cache of search results across games (see :doc:`search_cache`) consulted before searches of AIs (cache hits played at once and reported in moves rounds information)
+            or ``None`` for no cache, defaults to ``None``; not used when reproducing an experiment (recorded cache hits then replayed as they were).
             
     Attributes:
         OUTCOME_MESSAGES (list):
@@ -30,7 +38,7 @@ class GameRunner:
     
     OUTCOME_MESSAGES = ["SECOND PLAYER WINS", "DRAW", "FIRST PLAYER WINS"]
     
-    def __init__(self, game_class, black_ai, white_ai, game_index, n_games, experiment_info_old=None):
+    def __init__(self, game_class, black_ai, white_ai, game_index, n_games, experiment_info_old=None, game_clock=None, opening_book=None, search_cache=None):
         """
         Constructor ``GameRunner`` instances.
          
@@ -47,6 +55,13 @@ class GameRunner:
                 total of games in a match (for informative purposes).
             experiment_info_old (dict):
                 dictionary allowing to reproduce a former experiment (allows to force the limit of steps rather than time on an AI instance) or ``None`` for a new experiment, , defaults to ``None``.
+            game_clock (float):
+                total time [s] for all moves of each AI in the game, allocated to moves by time managers (see :doc:`time_manager`), or ``None`` for fixed per-move limits of AIs, defaults to ``None``.
+            opening_book (OpeningBook):
+                opening book (see :doc:`opening_book`) consulted before searches of AIs (book hits played at once and reported in moves rounds information) or ``None`` for no book, defaults to ``None``.
+            search_cache (SearchCache):
+                cache of search results across games (see :doc:`search_cache`) consulted before searches of AIs (cache hits played at once and reported in moves rounds information)
+                or ``None`` for no cache, defaults to ``None``; not used when reproducing an experiment (recorded cache hits then replayed as they were).
         """        
         self.game_class = game_class
         self.black_ai = black_ai
@@ -54,24 +69,52 @@ class GameRunner:
         self.game_index = game_index
         self.n_games = n_games
         self.experiment_info_old = experiment_info_old
+        self.game_clock = game_clock
+        self.opening_book = opening_book
+        self.search_cache = search_cache
+    
+    @staticmethod
+    def _ponder_start(ai, game):
+        """Starts pondering (see ``MCTS.ponder_start``) of an AI on the current game state while the human opponent picks a move, if the AI is an ``MCTS`` instance with pondering enabled."""
+        if ai and not is_mctsnc(ai) and ai.ponder:
+            ai.ponder_start(game)
+            
+    @staticmethod
+    def _ponder_stop(ai):
+        """Stops pondering of an AI (if started), before the human opponent's move is taken on the game state shared with the AI's tree."""
+        if ai and not is_mctsnc(ai):
+            ai.ponder_stop()
         
     def run(self):
         """Carries out a game."""
         game = self.game_class()   
         print(game)
+        time_managed = self.game_clock is not None and self.experiment_info_old is None # reproduced experiments force limits of steps
+        black_time_manager = TimeManager(self.game_clock) if time_managed and self.black_ai else None
+        white_time_manager = TimeManager(self.game_clock) if time_managed and self.white_ai else None
         outcome = 0
         game_info = {"black": str(self.black_ai), "white": str(self.white_ai), "initial_state": str(game), "moves_rounds": {}, "outcome": None, "outcome_message": None}                
+        if self.opening_book is not None:
+            game_info["opening_book"] = str(self.opening_book)
+            game_info["book_hits"] = {"black": 0, "white": 0}
+        search_cache = self.search_cache if self.experiment_info_old is None else None # reproduced experiments need exact searches
+        game_info_old = self.experiment_info_old["games_infos"][str(self.game_index)] if self.experiment_info_old is not None else None
+        if search_cache is not None or (game_info_old is not None and "cache_hits" in game_info_old):
+            game_info["cache_hits"] = {"black": 0, "white": 0}
         move_count = 0                       
         while True:
             print(f"\nMOVES ROUND: {move_count + 1} [game: {self.game_index}/{self.n_games}]")
             forced_search_steps_limit = np.inf
             moves_round_info = {}                     
+            moves_round_info_old = game_info_old["moves_rounds"][str(move_count + 1)] if game_info_old is not None else None
             if not self.black_ai:
                 move_valid = False
                 escaped = False
                 while not (move_valid or escaped):
+                    self._ponder_start(self.white_ai, game)
                     try:
                         move_name = input("FIRST PLAYER, PICK YOUR MOVE: ")
+                        self._ponder_stop(self.white_ai)
                         move_index = self.game_class.action_name_to_index(move_name)
                         game_moved = game.take_action(move_index)
                         if game_moved is not None:
@@ -84,17 +127,38 @@ class GameRunner:
                 if escaped:
                     break
             else:
-                if self.experiment_info_old is not None:
-                    forced_search_steps_limit = self.experiment_info_old["games_infos"][str(self.game_index)]["moves_rounds"][str(move_count + 1)]["black_performance_info"]["steps"] 
-                if isinstance(self.black_ai, MCTSNC):
-                    move_index = self.black_ai.run(game.get_board(), game.get_extra_info(), game.get_turn(), forced_search_steps_limit)
+                book_entry = self.opening_book.lookup(game) if self.opening_book is not None else None
+                cache_key = search_cache.make_key(game, self.black_ai) if search_cache is not None and book_entry is None else None
+                cached_actions_info = search_cache.get(cache_key) if cache_key is not None else None
+                if moves_round_info_old is not None and "black_cache_hit" in moves_round_info_old: # cache hits of a reproduced experiment replayed as recorded (no search)
+                    cached_actions_info = {"best": moves_round_info_old["black_cache_hit"]}
+                if book_entry is not None:
+                    move_index = book_entry["index"]
+                    moves_round_info["black_book_hit"] = book_entry
+                    game_info["book_hits"]["black"] += 1
+                    print(f"BOOK MOVE. [q: {book_entry['q']}, n: {book_entry['n']}, n_root: {book_entry['n_root']}]")
+                elif cached_actions_info is not None:
+                    move_index = cached_actions_info["best"]["index"]
+                    moves_round_info["black_cache_hit"] = cached_actions_info["best"]
+                    game_info["cache_hits"]["black"] += 1
+                    print(f"CACHED MOVE. [q: {cached_actions_info['best']['q']}, n: {cached_actions_info['best']['n']}, n_root: {cached_actions_info['best']['n_root']}]")
                 else:
-                    move_index = self.black_ai.run(game, forced_search_steps_limit)
+                    if self.experiment_info_old is not None:
+                        forced_search_steps_limit = moves_round_info_old["black_performance_info"]["steps"]
+                    if black_time_manager is not None:
+                        move_index, moves_round_info["black_time_allocation"] = black_time_manager.search(self.black_ai, game)
+                    elif is_mctsnc(self.black_ai):
+                        move_index = self.black_ai.run(game.get_board(), game.get_extra_info(), game.get_turn(), forced_search_steps_limit)
+                    else:
+                        move_index = self.black_ai.run(game, forced_search_steps_limit)
                 move_name = self.game_class.action_index_to_name(move_index)
                 print(f"MOVE PLAYED: {move_name}")
                 game = game.take_action(move_index)
-                moves_round_info["black_best_action_info"] = self.black_ai.actions_info["best"]
-                moves_round_info["black_performance_info"] = self.black_ai.performance_info                
+                if book_entry is None and cached_actions_info is None:
+                    moves_round_info["black_best_action_info"] = self.black_ai.actions_info["best"]
+                    moves_round_info["black_performance_info"] = self.black_ai.performance_info                
+                    if cache_key is not None:
+                        search_cache.put(cache_key, self.black_ai.actions_info)
             print(str(game), flush=True)                                                
             outcome = game.compute_outcome()
             if outcome is not None:
@@ -108,8 +172,10 @@ class GameRunner:
                 move_valid = False
                 escaped = False
                 while not (move_valid or escaped):
+                    self._ponder_start(self.black_ai, game)
                     try:
                         move_name = input("SECOND PLAYER, PICK YOUR MOVE: ")
+                        self._ponder_stop(self.black_ai)
                         move_index = self.game_class.action_name_to_index(move_name)
                         game_moved = game.take_action(move_index)
                         if game_moved is not None:
@@ -122,17 +188,38 @@ class GameRunner:
                 if escaped:
                     break                
             else:
-                if self.experiment_info_old is not None:
-                    forced_search_steps_limit = self.experiment_info_old["games_infos"][str(self.game_index)]["moves_rounds"][str(move_count + 1)]["white_performance_info"]["steps"]                
-                if isinstance(self.white_ai, MCTSNC):
-                    move_index = self.white_ai.run(game.get_board(), game.get_extra_info(), game.get_turn(), forced_search_steps_limit)
+                book_entry = self.opening_book.lookup(game) if self.opening_book is not None else None
+                cache_key = search_cache.make_key(game, self.white_ai) if search_cache is not None and book_entry is None else None
+                cached_actions_info = search_cache.get(cache_key) if cache_key is not None else None
+                if moves_round_info_old is not None and "white_cache_hit" in moves_round_info_old: # cache hits of a reproduced experiment replayed as recorded (no search)
+                    cached_actions_info = {"best": moves_round_info_old["white_cache_hit"]}
+                if book_entry is not None:
+                    move_index = book_entry["index"]
+                    moves_round_info["white_book_hit"] = book_entry
+                    game_info["book_hits"]["white"] += 1
+                    print(f"BOOK MOVE. [q: {book_entry['q']}, n: {book_entry['n']}, n_root: {book_entry['n_root']}]")
+                elif cached_actions_info is not None:
+                    move_index = cached_actions_info["best"]["index"]
+                    moves_round_info["white_cache_hit"] = cached_actions_info["best"]
+                    game_info["cache_hits"]["white"] += 1
+                    print(f"CACHED MOVE. [q: {cached_actions_info['best']['q']}, n: {cached_actions_info['best']['n']}, n_root: {cached_actions_info['best']['n_root']}]")
                 else:
-                    move_index = self.white_ai.run(game, forced_search_steps_limit)
+                    if self.experiment_info_old is not None:
+                        forced_search_steps_limit = moves_round_info_old["white_performance_info"]["steps"]
+                    if white_time_manager is not None:
+                        move_index, moves_round_info["white_time_allocation"] = white_time_manager.search(self.white_ai, game)
+                    elif is_mctsnc(self.white_ai):
+                        move_index = self.white_ai.run(game.get_board(), game.get_extra_info(), game.get_turn(), forced_search_steps_limit)
+                    else:
+                        move_index = self.white_ai.run(game, forced_search_steps_limit)
                 move_name = self.game_class.action_index_to_name(move_index)
                 print(f"MOVE PLAYED: {move_name}")
                 game = game.take_action(move_index)
-                moves_round_info["white_best_action_info"] = self.white_ai.actions_info["best"]            
-                moves_round_info["white_performance_info"] = self.white_ai.performance_info                
+                if book_entry is None and cached_actions_info is None:
+                    moves_round_info["white_best_action_info"] = self.white_ai.actions_info["best"]            
+                    moves_round_info["white_performance_info"] = self.white_ai.performance_info                
+                    if cache_key is not None:
+                        search_cache.put(cache_key, self.white_ai.actions_info)
             print(str(game), flush=True)                                        
             game_info["moves_rounds"][str(move_count + 1)] = moves_round_info  
             outcome = game.compute_outcome()
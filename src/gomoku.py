@@ -1,7 +1,6 @@
 import numpy as np
 from mcts import State
-from numba import jit
-from numba import int8
+from utils import lazy_jit
 
 __version__ = "1.0.1"
 __author__ = "Przemysław Klęsk"
@@ -17,12 +16,15 @@ class Gomoku(State):
         N (int): 
             number of columns in the board, defaults to ``15``.
         SYMBOLS (List):
-            list of strings representing stone symbols (black, white) or ``"."`` for empty cell. 
-    """        
+            list of strings representing stone symbols (black, white) or ``"."`` for empty cell.
+        MOVES_LEFT_CAP (int):
+            cap on estimates of the number of moves left in a game (see ``estimate_moves_left``), defaults to ``30``.
+    """
     
     M = 15
     N = 15
     SYMBOLS = ["\u25CB", "+", "\u25CF"] # or: [['O', '+', 'X']
+    MOVES_LEFT_CAP = 30
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -159,7 +161,7 @@ class Gomoku(State):
         return None        
 
     @staticmethod
-    @jit(int8(int8, int8, int8, int8, int8, int8[:, :]), nopython=True, cache=True)  
+    @lazy_jit("int8(int8, int8, int8, int8, int8, int8[:, :])", nopython=True, cache=True)  
     def compute_outcome_job_numba_jit(M, N, turn, last_i, last_j, board):
         """Called by ``compute_outcome_job`` for faster outcomes."""
         last_token = -turn        
@@ -239,6 +241,32 @@ class Gomoku(State):
     
     def get_extra_info(self):
         return None
+
+    @classmethod
+    def from_position(cls, board, extra_info, turn):
+        """
+        Returns a new state (with no parent) of Gomoku game representing the position given by its board and turn (no additional information used).
+        
+        Args:
+            board (ndarray[np.int8, ndim=2]):
+                board of the position.
+            extra_info (``None``):
+                not used.
+            turn {-1, 1}:
+                indicator of the player to act.
+        
+        Returns:
+            state (Gomoku):
+                state representing the position.
+        """
+        state = cls()
+        state.board = np.array(board, dtype=np.int8)
+        state.turn = turn
+        return state
+    
+    def estimate_moves_left(self):
+        """Returns an estimate of the number of moves left for the player to act - half of empty cells, capped by ``Gomoku.MOVES_LEFT_CAP`` (games rarely fill a large board)."""
+        return int(min(np.ceil(np.count_nonzero(self.board == 0) / 2), Gomoku.MOVES_LEFT_CAP))
    
     @staticmethod
     def action_name_to_index(action_name):
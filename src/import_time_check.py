@@ -0,0 +1,93 @@
+"""
+Script to check the import time (cold start) of modules needed for CPU-only usage (e.g. a human vs ``MCTS`` game) against a budget.
+Each module is imported in a fresh Python process (several times, the minimum time taken) and it is also checked that no heavy modules
+(``numba``, ``cpuinfo``, ``psutil``, ``mctsnc``) get imported along - those are meant to be imported on demand (see ``lazy_jit`` in :doc:`utils` and :doc:`ais`).
+The script exits with an error message if any module exceeds the budget or pulls in a heavy module.
+
+The following variables allow to define the settings:
+
+.. code-block:: python
+
+    MODULES = ["utils", "mcts", "c4", "gomoku", "kalah", "ais", "game_runner", "match_runner", "main"]
+    HEAVY_MODULES = ["numba", "cpuinfo", "psutil", "mctsnc"]
+    IMPORT_TIME_BUDGET = 0.4 # [s]
+    N_REPETITIONS = 3
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+# settings
+MODULES = ["utils", "mcts", "c4", "gomoku", "kalah", "ais", "game_runner", "match_runner", "main"]
+HEAVY_MODULES = ["numba", "cpuinfo", "psutil", "mctsnc"]
+IMPORT_TIME_BUDGET = 0.4 # [s]
+N_REPETITIONS = 3
+
+_IMPORT_CODE = """
+import json, sys, time
+t1 = time.perf_counter()
+import {module}
+t2 = time.perf_counter()
+print(json.dumps({{"time": t2 - t1, "heavy_modules": [name for name in {heavy_modules} if name in sys.modules]}}))
+"""
+
+def import_time(module, heavy_modules, n_repetitions):
+    """Imports a module in fresh Python processes and returns the minimum import time [s] and the list of heavy modules imported along."""
+    src_folder = os.path.dirname(os.path.abspath(__file__))
+    code = _IMPORT_CODE.format(module=module, heavy_modules=repr(heavy_modules))
+    times = []
+    for _ in range(n_repetitions):
+        result = subprocess.run([sys.executable, "-c", code], cwd=src_folder, capture_output=True, text=True)
+        if result.returncode != 0:
+            sys.exit(f"[import_time(): exiting due to error when importing module: {module}]\n{result.stderr}")
+        info = json.loads(result.stdout.strip().splitlines()[-1])
+        times.append(info["time"])
+    return min(times), info["heavy_modules"]
+
+def import_time_check(modules, heavy_modules, import_time_budget, n_repetitions):
+    """
+    Checks import times of modules against a budget and that no heavy modules get imported along; exits with an error message on failure.
+
+    Args:
+        modules (list(str)):
+            names of modules to be checked.
+        heavy_modules (list(str)):
+            names of modules that must not be imported along.
+        import_time_budget (float):
+            maximum allowed import time [s] for each module.
+        n_repetitions (int):
+            number of imports (fresh processes) per module, the minimum time taken.
+
+    Returns:
+        times (dict):
+            dictionary mapping names of modules to import times [s].
+    """
+    print(f"IMPORT TIME CHECK... [budget: {import_time_budget} s]")
+    t1 = time.time()
+    times = {}
+    failures = []
+    for module in modules:
+        times[module], heavy_imported = import_time(module, heavy_modules, n_repetitions)
+        print(f"[{module} -> import time: {times[module]:.3f} s{f', heavy modules imported: {heavy_imported}' if heavy_imported else ''}]")
+        if times[module] > import_time_budget:
+            failures.append(f"{module} exceeds budget ({times[module]:.3f} s)")
+        if heavy_imported:
+            failures.append(f"{module} imports {heavy_imported}")
+    if failures:
+        sys.exit(f"[import_time_check(): exiting due to failures: {'; '.join(failures)}]")
+    t2 = time.time()
+    print(f"IMPORT TIME CHECK DONE. [time: {t2 - t1} s]")
+    return times
+
+if __name__ == "__main__":
+    import_time_check(MODULES, HEAVY_MODULES, IMPORT_TIME_BUDGET, N_REPETITIONS)
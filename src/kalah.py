@@ -1,7 +1,6 @@
 import numpy as np
 from mcts import State
-from numba import jit
-from numba import int8
+from utils import lazy_jit
 
 __version__ = "1.0.0"
 __author__ = ""
@@ -96,7 +95,7 @@ class Kalah(State):
 
         self.board[player_row, action_index] = 0
 
-        counter = int8(np.copy(self.turn))
+        counter = np.int8(self.turn)
         while stones != 0:
             idx = action_index + counter
             if idx == Kalah.POLE:
@@ -188,7 +187,7 @@ class Kalah(State):
         return None    
    
     @staticmethod
-    @jit(int8(int8[:,:], int8[:]), nopython=True, cache=True)  
+    @lazy_jit("int8(int8[:,:], int8[:])", nopython=True, cache=True)  
     def compute_outcome_job_numba_jit(board,magazyn):
         """Called by ``compute_outcome_job`` for faster outcomes."""  
         if np.sum(board[1,:])==0:
@@ -252,6 +251,22 @@ class Kalah(State):
         extra[3] = self.bonus2
         extra[4] = self.steal
         return extra
+
+    @classmethod
+    def from_position(cls, board, extra_info, turn):
+        """Returns a new state (with no parent) representing the position given by its board, extra information (stores, bonus and steal flags, as from ``get_extra_info``) and turn."""
+        state = cls()
+        state.board = np.array(board, dtype=np.int8)
+        state.magazyn = np.array(extra_info[:2], dtype=np.int8)
+        state.bonus1 = bool(extra_info[2])
+        state.bonus2 = bool(extra_info[3])
+        state.steal = bool(extra_info[4])
+        state.turn = turn
+        return state
+    
+    def estimate_moves_left(self):
+        """Returns an estimate of the number of moves left for the player to act, based on the stones left in pits (roughly three stones per move of a player)."""
+        return int(np.ceil(np.sum(self.board, dtype=np.int32) / 3))
     
     @staticmethod    
     def action_name_to_index(action_name):   
@@ -0,0 +1,204 @@
+"""
+Script to cross-check and benchmark implementations of Kalah rules, meant as a safety net (and a baseline) for optimizations of the hot rules code.
+There are the following implementations of taking actions and computing outcomes, which are driven move by move in lockstep by random games:
+
+- ``"kalah_numba"``: ``Kalah.take_action_job`` and ``Kalah.compute_outcome_job_numba_jit`` (see :doc:`kalah`), as used by ``MCTS`` (see :doc:`mcts`),
+- ``"kalah_python"``: ``Kalah.take_action_job`` and pure Python function underlying ``Kalah.compute_outcome_job_numba_jit``,
+- ``"device_python"``: pure Python functions underlying CUDA device functions ``take_action_kallah`` and ``compute_outcome_kallah`` (see :doc:`mctsnc_game_mechanics`), as used by ``MCTSNC``,
+- ``"device_njit"``: the above functions compiled for CPU by ``numba.njit``.
+
+After each move, boards, stores, bonus move flags, turns and outcomes are compared across implementations - the script exits reporting the first difference found.
+Then, the recorded sequence of moves is replayed by each implementation separately and the numbers of moves per second are reported.
+No GPU is needed - device functions are called (or compiled) via their ``py_func`` attributes.
+
+The following variables allow to define the settings:
+
+.. code-block:: python
+
+    N_MOVES = 10**6
+    SEED = 0
+    IMPLEMENTATIONS = ["kalah_numba", "kalah_python", "device_python", "device_njit"]
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+import sys
+import time
+from numba import njit
+from kalah import Kalah
+from mctsnc_game_mechanics import take_action_kallah, compute_outcome_kallah
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+# settings
+N_MOVES = 10**6
+SEED = 0
+IMPLEMENTATIONS = ["kalah_numba", "kalah_python", "device_python", "device_njit"]
+
+PASS_ACTION = Kalah.POLE # action taken by the opponent of a player having a bonus move (ignored by ``Kalah.take_action_job``)
+NEW_GAME = -1 # entry in sequences of actions marking the start of a new game
+
+# pure Python functions underlying jit-compiled ones
+compute_outcome_job_python = Kalah.compute_outcome_job_numba_jit.py_func
+take_action_kallah_python = take_action_kallah.py_func
+compute_outcome_kallah_python = compute_outcome_kallah.py_func
+
+# device functions compiled for CPU
+take_action_kallah_njit = njit(take_action_kallah_python)
+compute_outcome_kallah_njit = njit(compute_outcome_kallah_python)
+
+def _new_device_state():
+    """Returns a new (initial) state for device functions: list with board, extra information and turn."""
+    kalah = Kalah()
+    extra_info = np.zeros(Kalah.get_extra_info_memory(), dtype=np.int8)
+    extra_info[:5] = kalah.get_extra_info()
+    return [kalah.get_board().copy(), extra_info, kalah.get_turn()]
+
+def _new_state(implementation):
+    """Returns a new (initial) state for given implementation."""
+    if implementation.startswith("kalah"):
+        return Kalah()
+    return _new_device_state()
+
+def _step(implementation, state, action):
+    """Takes an action on a state (in place) using given implementation and returns the outcome (``None`` for an ongoing game)."""
+    if implementation == "kalah_numba":
+        state.take_action_job(action)
+        outcome = Kalah.compute_outcome_job_numba_jit(state.board, state.magazyn)
+    elif implementation == "kalah_python":
+        state.take_action_job(action)
+        outcome = compute_outcome_job_python(state.board, state.magazyn)
+    else:
+        board, extra_info, turn = state
+        m, n = board.shape
+        if implementation == "device_python":
+            take_action_kallah_python(m, n, board, extra_info, turn, action)
+            outcome = compute_outcome_kallah_python(m, n, board, extra_info, -turn, action)
+        else:
+            take_action_kallah_njit(m, n, board, extra_info, turn, action)
+            outcome = compute_outcome_kallah_njit(m, n, board, extra_info, -turn, action)
+        state[2] = -turn
+    return None if outcome == -2 else int(outcome)
+
+def _canonical(implementation, state, outcome):
+    """Returns a canonical representation of a state (with its outcome) for comparisons across implementations."""
+    if implementation.startswith("kalah"):
+        return (state.board.tolist(), state.magazyn.tolist(), int(state.bonus1), int(state.turn), outcome)
+    board, extra_info, turn = state
+    return (board.tolist(), extra_info[:2].tolist(), int(extra_info[2]), int(turn), outcome)
+
+def _random_action(state, rng):
+    """Returns a random legal action for a state of ``Kalah`` class (the pass action if the opponent has a bonus move)."""
+    if state.bonus1:
+        return PASS_ACTION
+    return int(rng.choice(np.flatnonzero(state.board[state.get_player_row()])))
+
+def rules_check(n_moves, seed, implementations):
+    """
+    Drives random games move by move through all given implementations in lockstep, comparing states and outcomes after each move; exits on the first difference.
+
+    Args:
+        n_moves (int):
+            total number of moves (over consecutive games).
+        seed (int):
+            seed for random moves.
+        implementations (list(str)):
+            names of implementations, the first one being the reference that moves are drawn for (must be ``"kalah_numba"`` or ``"kalah_python"``).
+
+    Returns:
+        actions (ndarray[np.int8]):
+            sequence of actions taken, with ``NEW_GAME`` entries marking starts of consecutive games.
+    """
+    print(f"RULES CHECK... [moves: {n_moves}, seed: {seed}, implementations: {implementations}]")
+    t1 = time.time()
+    rng = np.random.RandomState(seed)
+    actions = []
+    n_games = 0
+    states = None
+    for i in range(n_moves):
+        if states is None:
+            states = [_new_state(implementation) for implementation in implementations]
+            actions.append(NEW_GAME)
+            n_games += 1
+        action = _random_action(states[0], rng)
+        actions.append(action)
+        outcomes = [_step(implementation, state, action) for implementation, state in zip(implementations, states)]
+        canonicals = [_canonical(implementation, state, outcome) for implementation, state, outcome in zip(implementations, states, outcomes)]
+        for implementation, canonical in zip(implementations[1:], canonicals[1:]):
+            if canonical != canonicals[0]:
+                sys.exit(f"[rules_check(): exiting due to difference found at move {i} (game {n_games}, action: {action}) -> "
+                         f"{implementations[0]}: {canonicals[0]}, {implementation}: {canonical}]")
+        if outcomes[0] is not None:
+            states = None
+    t2 = time.time()
+    print(f"RULES CHECK DONE. [games: {n_games}, no differences found, time: {t2 - t1} s]")
+    return np.array(actions, dtype=np.int8)
+
+@njit(cache=True)
+def _replay_device_njit(actions, board_initial, extra_info_initial):
+    """Replays a sequence of actions using device functions compiled for CPU and returns the number of moves taken."""
+    m, n = board_initial.shape
+    board = board_initial.copy()
+    extra_info = extra_info_initial.copy()
+    turn = 1
+    n_moves = 0
+    for action in actions:
+        if action == NEW_GAME:
+            board[:, :] = board_initial
+            extra_info[:] = extra_info_initial
+            turn = 1
+            continue
+        take_action_kallah_njit(m, n, board, extra_info, turn, action)
+        compute_outcome_kallah_njit(m, n, board, extra_info, -turn, action)
+        turn = -turn
+        n_moves += 1
+    return n_moves
+
+def _replay(implementation, actions):
+    """Replays a sequence of actions using given implementation and returns the number of moves taken."""
+    if implementation == "device_njit":
+        board, extra_info, _ = _new_device_state()
+        return _replay_device_njit(actions, board, extra_info)
+    n_moves = 0
+    state = None
+    for action in actions.tolist():
+        if action == NEW_GAME:
+            state = _new_state(implementation)
+            continue
+        _step(implementation, state, action)
+        n_moves += 1
+    return n_moves
+
+def rules_benchmark(actions, implementations):
+    """
+    Replays a sequence of actions (as returned by ``rules_check``) by each of given implementations and reports the numbers of moves per second.
+
+    Args:
+        actions (ndarray[np.int8]):
+            sequence of actions, with ``NEW_GAME`` entries marking starts of consecutive games.
+        implementations (list(str)):
+            names of implementations.
+
+    Returns:
+        moves_per_second (dict):
+            dictionary mapping names of implementations to numbers of moves per second.
+    """
+    print(f"RULES BENCHMARK... [implementations: {implementations}]")
+    _replay_device_njit(actions[:1], *_new_device_state()[:2]) # compilation
+    moves_per_second = {}
+    for implementation in implementations:
+        t1 = time.perf_counter()
+        n_moves = _replay(implementation, actions)
+        t2 = time.perf_counter()
+        moves_per_second[implementation] = n_moves / (t2 - t1)
+        print(f"[{implementation} -> moves: {n_moves}, moves/s: {moves_per_second[implementation]:.1f}, time: {t2 - t1} s]")
+    print("RULES BENCHMARK DONE.")
+    return moves_per_second
+
+if __name__ == "__main__":
+    actions = rules_check(N_MOVES, SEED, IMPLEMENTATIONS)
+    rules_benchmark(actions, IMPLEMENTATIONS)
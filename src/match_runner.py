@@ -0,0 +1,365 @@
+"""
+Auxiliary module with functions carrying out a match (an experiment) of multiple games between two AIs (or human vs AI), used by :doc:`main` and :doc:`tournament`.
+Games can be played sequentially in the current process or distributed across a pool of processes, each worker owning its own copies of AI instances.
+In both cases the CPU-side random generator is reseeded at the start of each game with a seed depending only on the seeds of AIs and the index of game,
+so that a given game is played identically regardless of the process it is carried out by (for searches limited by steps).
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+import io
+import os
+import sys
+import time
+import contextlib
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from ais import is_mctsnc
+from game_runner import GameRunner
+from sprt import sprt_decision
+from utils import cpu_and_system_props, gpu_props, dict_to_str, Logger, experiment_hash_str, ExperimentWriter, unzip_and_load_experiment, append_game_checkpoint, load_game_checkpoints, reset_game_checkpoints
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+LINE_SEPARATOR = 208 * "="
+
+_worker_match = None # (game_class, ai_a, ai_b, n_games, experiment_info_old, game_clock, opening_book, search_cache) owned by a worker process
+
+def game_seed(ai_a, ai_b, game_index):
+    """Returns the seed for CPU-side random generator used in a game of given index (depends only on seeds of AIs and the index)."""
+    seeds = [ai.seed for ai in [ai_a, ai_b] if ai is not None]
+    return (sum(seeds) + game_index) % 2**32
+
+def play_game(game_class, ai_a, ai_b, game_index, n_games, experiment_info_old=None, game_clock=None, opening_book=None, search_cache=None):
+    """
+    Carries out a single game of a match. AI A plays as the first (black) player in odd-numbered games, AI B in even-numbered ones.
+    The CPU-side random generator is seeded for each game (see ``game_seed``), unless a former experiment recorded without per-game seeds (no such marker in its statistics) is reproduced.
+
+    Args:
+        game_class (class):
+            class object allowing to instantiate the initial state of some two-person game.
+        ai_a (object):
+            reference to AI instance (``MCTS`` or ``MCTSNC``) of player A or ``None`` for human.
+        ai_b (object):
+            reference to AI instance (``MCTS`` or ``MCTSNC``) of player B or ``None`` for human.
+        game_index (int):
+            index of game within the match (numbering from 1).
+        n_games (int):
+            total of games in the match.
+        experiment_info_old (dict):
+            dictionary allowing to reproduce a former experiment or ``None`` for a new experiment, defaults to ``None``.
+        game_clock (float):
+            total time [s] for all moves of each AI in a game, allocated to moves by time managers (see :doc:`time_manager`), or ``None`` for fixed per-move limits of AIs, defaults to ``None``.
+        opening_book (OpeningBook):
+            opening book (see :doc:`opening_book`) consulted before searches of AIs or ``None`` for no book, defaults to ``None``.
+        search_cache (SearchCache):
+            cache of search results across games (see :doc:`search_cache`) consulted before searches of AIs or ``None`` for no cache, defaults to ``None``.
+
+    Returns:
+        outcome (int):
+            outcome of the game, ``1`` if first (black) player wins, ``-1`` if second (white) player wins, ``0`` for a draw.
+        game_info (dict):
+            dictionary with information on the game (as returned by ``GameRunner.run()``).
+    """
+    print(f"\n\n\nGAME {game_index}/{n_games}:")
+    ai_a_starts = game_index % 2 == 1
+    black_player_ai = ai_a if ai_a_starts else ai_b
+    white_player_ai = ai_b if ai_a_starts else ai_a
+    print(f"BLACK: {black_player_ai if black_player_ai else 'human'}")
+    print(f"WHITE: {white_player_ai if white_player_ai else 'human'}")
+    if experiment_info_old is None or experiment_info_old["stats"].get("per_game_seeds", False): # former experiments recorded without per-game seeds replayed with the generator seeded once (by AIs)
+        np.random.seed(game_seed(ai_a, ai_b, game_index))
+    game_runner = GameRunner(game_class, black_player_ai, white_player_ai, game_index, n_games, experiment_info_old, game_clock, opening_book, search_cache)
+    return game_runner.run()
+
+def play_games(game_class, ai_a, ai_b, n_games, experiment_info_old=None, first_game_index=1, game_clock=None, opening_book=None, search_cache=None):
+    """
+    Generator carrying out games of a match sequentially in the current process.
+
+    Args:
+        game_class (class):
+            class object allowing to instantiate the initial state of some two-person game.
+        ai_a (object):
+            reference to AI instance of player A or ``None`` for human.
+        ai_b (object):
+            reference to AI instance of player B or ``None`` for human.
+        n_games (int):
+            total of games in the match.
+        experiment_info_old (dict):
+            dictionary allowing to reproduce a former experiment or ``None`` for a new experiment, defaults to ``None``.
+        first_game_index (int):
+            index of the first game to be played (numbering from 1; greater when a match is resumed), defaults to ``1``.
+        game_clock (float):
+            total time [s] for all moves of each AI in a game, allocated to moves by time managers (see :doc:`time_manager`), or ``None`` for fixed per-move limits of AIs, defaults to ``None``.
+        opening_book (OpeningBook):
+            opening book (see :doc:`opening_book`) consulted before searches of AIs or ``None`` for no book, defaults to ``None``.
+        search_cache (SearchCache):
+            cache of search results across games (see :doc:`search_cache`) consulted before searches of AIs or ``None`` for no cache, defaults to ``None``.
+
+    Yields:
+        (game_index, outcome, game_info) (tuple(int, int, dict)):
+            index of game, its outcome and information, in the order of games.
+    """
+    for game_index in range(first_game_index, n_games + 1):
+        outcome, game_info = play_game(game_class, ai_a, ai_b, game_index, n_games, experiment_info_old, game_clock, opening_book, search_cache)
+        yield game_index, outcome, game_info
+
+def _init_worker(game_class, ai_a, ai_b, n_games, experiment_info_old, game_clock, opening_book, search_cache):
+    """Initializer of a worker process - memorizes the worker's own copies of AI instances and match settings, and warms them up (compiled functions loaded from cache)."""
+    global _worker_match
+    if search_cache is not None and not search_cache.read_only: # inherited (forked) rather than pickled
+        search_cache = search_cache.read_only_copy()
+    _worker_match = (game_class, ai_a, ai_b, n_games, experiment_info_old, game_clock, opening_book, search_cache)
+    game_class.warm_up()
+    ai_a.warm_up(game_class)
+    ai_b.warm_up(game_class)
+
+def _play_game_in_worker(game_index):
+    """Carries out a game within a worker process, capturing its console output; returns the outcome, game information, the output and new entries of the search cache (if any)."""
+    game_class, ai_a, ai_b, n_games, experiment_info_old, game_clock, opening_book, search_cache = _worker_match
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        outcome, game_info = play_game(game_class, ai_a, ai_b, game_index, n_games, experiment_info_old, game_clock, opening_book, search_cache)
+    new_cache_entries = search_cache.take_new_entries() if search_cache is not None else []
+    return outcome, game_info, output.getvalue(), new_cache_entries
+
+def play_games_parallel(game_class, ai_a, ai_b, n_games, n_workers=None, experiment_info_old=None, first_game_index=1, game_clock=None, opening_book=None, search_cache=None):
+    """
+    Generator carrying out games of a match concurrently by a pool of processes, each worker owning its own copies of AI instances (CPU-based AIs only, i.e. ``MCTS``).
+    Results are yielded in the order of games, as soon as consecutive games are finished; console output of each game (captured within a worker) is printed just before its results are yielded,
+    so that logs look as if produced by a sequential run. Closing the generator early cancels games not yet started.
+    Workers get read-only copies of the search cache (if any); entries they add are sent back with results of games and merged into the given cache, 
+    whose file stays closed while the pool runs (see :doc:`search_cache`).
+
+    Args:
+        game_class (class):
+            class object allowing to instantiate the initial state of some two-person game.
+        ai_a (MCTS):
+            reference to AI instance of player A.
+        ai_b (MCTS):
+            reference to AI instance of player B.
+        n_games (int):
+            total of games in the match.
+        n_workers (int):
+            number of worker processes, ``None`` for the number of CPUs, defaults to ``None``.
+        experiment_info_old (dict):
+            dictionary allowing to reproduce a former experiment or ``None`` for a new experiment, defaults to ``None``.
+        first_game_index (int):
+            index of the first game to be played (numbering from 1; greater when a match is resumed), defaults to ``1``.
+        game_clock (float):
+            total time [s] for all moves of each AI in a game, allocated to moves by time managers (see :doc:`time_manager`), or ``None`` for fixed per-move limits of AIs, defaults to ``None``.
+        opening_book (OpeningBook):
+            opening book (see :doc:`opening_book`) consulted before searches of AIs or ``None`` for no book, defaults to ``None``.
+        search_cache (SearchCache):
+            cache of search results across games (see :doc:`search_cache`) consulted before searches of AIs or ``None`` for no cache, defaults to ``None``.
+
+    Yields:
+        (game_index, outcome, game_info) (tuple(int, int, dict)):
+            index of game, its outcome and information, in the order of games.
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count()
+    if search_cache is not None:
+        search_cache.suspend_file() # workers open the file for reading
+    executor = ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(game_class, ai_a, ai_b, n_games, experiment_info_old, game_clock, opening_book, search_cache))
+    try:
+        futures = [(game_index, executor.submit(_play_game_in_worker, game_index)) for game_index in range(first_game_index, n_games + 1)]
+        for game_index, future in futures:
+            outcome, game_info, output, new_cache_entries = future.result()
+            if search_cache is not None:
+                search_cache.merge(new_cache_entries)
+            print(output, end="", flush=True)
+            yield game_index, outcome, game_info
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        if search_cache is not None:
+            search_cache.resume_file()
+
+def make_matchup_info(game_class, ai_a_shortname, ai_a, ai_b_shortname, ai_b, n_games, game_clock=None, opening_book=None, search_cache=None):
+    """Returns a dictionary describing a match-up (basis for the hash string of an experiment); the game clock, the opening book and the search cache are included only if given (hash strings of former experiments unchanged)."""
+    matchup_info = {
+        "ai_a_shortname": ai_a_shortname, "ai_a_instance": str(ai_a), 
+        "ai_b_shortname": ai_b_shortname, "ai_b_instance": str(ai_b),
+        "game_name": game_class.class_repr(),
+        "n_games": n_games}
+    if game_clock is not None:
+        matchup_info["game_clock"] = game_clock
+    if opening_book is not None:
+        matchup_info["opening_book"] = str(opening_book)
+    if search_cache is not None:
+        matchup_info["search_cache"] = str(search_cache)
+    return matchup_info
+
+def run_match(game_class, ai_a_shortname, ai_a, ai_b_shortname, ai_b, n_games, folder, reproduce_experiment=False, n_workers=1, sprt_params=None, resume=False, game_clock=None, opening_book=None, search_cache=None):
+    """
+    Carries out a match (an experiment) of multiple games between two AIs (or human vs AI). 
+    Unless the experiment is reproduced or a human participates, the console output is logged and, once the match is finished, the experiment is saved and zipped 
+    (.json and .log files) under its hash string.
+    If parameters of the sequential probability ratio test are given (see :doc:`sprt`), the test is evaluated after each game (with respect to scores of AI A)
+    and the match is stopped as soon as a decision is reached; the test's outcome is then recorded under key ``"sprt"`` in the statistics.
+    Each finished game is checkpointed (appended to a JSON lines file next to the log) so that an interrupted match can be resumed: 
+    then, completed games are taken from the checkpoint file, and the remaining ones are played (with the same per-game seeds) and logged in continuation.
+    Before the first game, the game and both AIs are warmed up (see ``warm_up`` methods), so that compilations do not land in the first searches; warm-up times are recorded in the statistics.
+
+    Args:
+        game_class (class):
+            class object allowing to instantiate the initial state of some two-person game.
+        ai_a_shortname (str):
+            short name of AI A (``"human"`` for human player).
+        ai_a (object):
+            reference to AI instance (``MCTS`` or ``MCTSNC``) of player A or ``None`` for human.
+        ai_b_shortname (str):
+            short name of AI B (``"human"`` for human player).
+        ai_b (object):
+            reference to AI instance (``MCTS`` or ``MCTSNC``) of player B or ``None`` for human.
+        n_games (int):
+            total of games in the match.
+        folder (str):
+            folder with experiments.
+        reproduce_experiment (bool):
+            flag indicating whether a former experiment is to be reproduced (then its limits of steps are forced on AIs), defaults to ``False``.
+        n_workers (int):
+            number of processes playing games in parallel (applicable only to CPU-based AIs, i.e. ``MCTS``, and not to reproductions of experiments recorded without per-game seeds), defaults to ``1``.
+        sprt_params (dict):
+            parameters of the sequential probability ratio test for early stopping (keys: ``"elo0"``, ``"elo1"``, ``"alpha"``, ``"beta"``, ``"min_games"``) or ``None`` 
+            if all games are to be played, defaults to ``None``.
+        resume (bool):
+            flag indicating whether the match is to be resumed from its checkpoint file (if one exists), defaults to ``False``.
+        game_clock (float):
+            total time [s] for all moves of each AI in a game, allocated to moves by time managers (see :doc:`time_manager`), or ``None`` for fixed per-move limits of AIs, defaults to ``None``.
+        opening_book (OpeningBook):
+            opening book (see :doc:`opening_book`) consulted before searches of AIs or ``None`` for no book, defaults to ``None``.
+        search_cache (SearchCache):
+            cache of search results across games (see :doc:`search_cache`) consulted before searches of AIs or ``None`` for no cache, defaults to ``None``.
+
+    Returns:
+        experiment_hs (str):
+            hash string of the experiment.
+        experiment_info (dict):
+            dictionary with information on the experiment (match-up, environment, games and statistics); 
+            games are included only if the experiment is not saved (reproduction or human participant), otherwise they are streamed into the zip file as they finish.
+    """
+    human_participant = ai_a is None or ai_b is None
+    if human_participant:
+        reproduce_experiment = False
+    matchup_info = make_matchup_info(game_class, ai_a_shortname, ai_a, ai_b_shortname, ai_b, n_games, game_clock, opening_book, search_cache)
+    outcomes = np.zeros(n_games, dtype=np.int8)
+    scores_a = np.zeros(n_games)
+    c_props = cpu_and_system_props()
+    g_props = gpu_props()
+    experiment_hs = experiment_hash_str(matchup_info, c_props, g_props)
+    experiment_info = {"matchup_info":  matchup_info, "cpu_and_system_props": c_props, "gpu_props": g_props, "games_infos": {}, "stats": {}}
+    checkpointing = not (reproduce_experiment or human_participant)
+    games_resumed = load_game_checkpoints(experiment_hs, folder) if checkpointing and resume else []
+    if checkpointing:
+        reset_game_checkpoints(experiment_hs, folder, games_resumed) # drops stale or incomplete entries
+        logger = Logger(f"{folder}{experiment_hs}.log")    
+        sys.stdout = logger
+    
+    print("MCTS-NC EXPERIMENT..." + f"{' [to be reproduced]' if reproduce_experiment else ''}" + f"{f' [resumed after game: {len(games_resumed)}]' if games_resumed else ''}", flush=True)
+    t1 = time.time()    
+
+    experiment_info_old = None
+    if reproduce_experiment:  
+        experiment_info_old = unzip_and_load_experiment(experiment_hs, folder)
+    
+    print(f"HASH STRING: {experiment_hs}")    
+    print(LINE_SEPARATOR)
+    print(f"MATCH-UP:\n{dict_to_str(matchup_info)}")
+    print(LINE_SEPARATOR)
+    print(f"CPU AND SYSTEM PROPS:\n{dict_to_str(c_props)}")
+    print(f"GPU PROPS:\n{dict_to_str(g_props)}")
+    print(LINE_SEPARATOR)        
+
+    if is_mctsnc(ai_a):        
+        ai_a.init_device_side_arrays()
+        print(LINE_SEPARATOR)
+    if is_mctsnc(ai_b):        
+        ai_b.init_device_side_arrays()
+        print(LINE_SEPARATOR)        
+    print("WARM-UP...") # compilations and first-call costs kept away from the first searches 
+    warm_up_time_game = game_class.warm_up()
+    warm_up_time_a = ai_a.warm_up(game_class) if ai_a is not None else 0.0
+    warm_up_time_b = ai_b.warm_up(game_class) if ai_b is not None else 0.0
+    print(f"WARM-UP DONE. [time of game: {warm_up_time_game} s, time of A: {warm_up_time_a} s, time of B: {warm_up_time_b} s]")
+    print(LINE_SEPARATOR)
+    
+    score_a = 0.0
+    score_b = 0.0
+    n_games_played = 0
+    sprt_info = None
+    
+    writer = ExperimentWriter(experiment_hs, folder, matchup_info, c_props, g_props) if checkpointing else None # games are streamed into zip file (not kept in memory)
+    first_game_index = len(games_resumed) + 1
+    if n_workers > 1 and experiment_info_old is not None and not experiment_info_old["stats"].get("per_game_seeds", False):
+        print(f"[games played sequentially rather than by {n_workers} workers: reproduced experiment recorded without per-game seeds relies on a single random stream]")
+        n_workers = 1
+    if n_workers > 1 and not (human_participant or is_mctsnc(ai_a) or is_mctsnc(ai_b)):
+        games = play_games_parallel(game_class, ai_a, ai_b, n_games, n_workers, experiment_info_old, first_game_index, game_clock, opening_book, search_cache)
+    else:
+        games = play_games(game_class, ai_a, ai_b, n_games, experiment_info_old, first_game_index, game_clock, opening_book, search_cache)
+    for game_index, outcome, game_info in itertools.chain(games_resumed, games):
+        if checkpointing and game_index >= first_game_index:
+            append_game_checkpoint(experiment_hs, game_index, outcome, game_info, folder)
+        i = game_index - 1
+        ai_a_starts = i % 2 == 0
+        if writer is not None:
+            writer.write_game(game_index, game_info)
+        else:
+            experiment_info["games_infos"][str(game_index)] = game_info
+        outcomes[i] = outcome
+        outcome_normed = 0.5 * (outcome + 1.0) # to: 0.0 - loss, 0.5 - draw, 1.0 - win
+        score_a += outcome_normed if ai_a_starts else 1.0 - outcome_normed
+        score_b += 1.0 - outcome_normed if ai_a_starts else outcome_normed
+        print(f"[score so far for A -> total: {score_a}, mean: {score_a / (i + 1)} ({ai_a if ai_a else 'human'})]")
+        print(f"[score so far for B -> total: {score_b}, mean: {score_b / (i + 1)} ({ai_b if ai_b else 'human'})]")
+        n_games_played = game_index
+        scores_a[i] = outcome_normed if ai_a_starts else 1.0 - outcome_normed
+        if sprt_params is not None:
+            sprt_info = sprt_decision(scores_a[:n_games_played], sprt_params["elo0"], sprt_params["elo1"], sprt_params["alpha"], sprt_params["beta"], sprt_params.get("min_games", 1))
+            print(f"[SPRT so far -> llr: {sprt_info['llr']}, bounds: ({sprt_info['lower_bound']}, {sprt_info['upper_bound']}), decision: {sprt_info['decision']}]")
+        print(LINE_SEPARATOR)
+        sys.stdout.flush() # game end
+        if sprt_info is not None and sprt_info["decision"] is not None:
+            print(f"MATCH STOPPED EARLY BY SPRT. [games played: {n_games_played}/{n_games}, accepted hypothesis: {sprt_info['decision']}]")
+            print(LINE_SEPARATOR)
+            break
+    games.close()
+    outcomes = outcomes[:n_games_played]
+    
+    print(f"OUTCOMES: {outcomes}")
+    outcomes = np.array(outcomes, dtype=np.int8)    
+    n_wins_white = np.sum(outcomes == -1)
+    n_draws = np.sum(outcomes == 0)
+    n_wins_black = np.sum(outcomes == 1)
+    print(f"COUNTS -> WHITE WINS (-1): {n_wins_white}, DRAWS (0): {n_draws}, BLACK WINS (+1): {n_wins_black}")
+    print(f"FREQUENCIES -> WHITE WINS (-1): {n_wins_white / n_games_played}, DRAWS (0): {n_draws / n_games_played}, BLACK WINS (+1): {n_wins_black / n_games_played}")
+    print(LINE_SEPARATOR)
+    
+    experiment_info["stats"]["score_a_total"] = score_a
+    experiment_info["stats"]["score_a_mean"] = score_a / n_games_played
+    experiment_info["stats"]["score_b_total"] = score_b
+    experiment_info["stats"]["score_b_mean"] = score_b / n_games_played
+    experiment_info["stats"]["white_wins_count"] = int(n_wins_white) # needed for serialization to json
+    experiment_info["stats"]["white_wins_freq"] = n_wins_white / n_games_played
+    experiment_info["stats"]["black_wins_count"] = int(n_wins_black) # needed for serialization to json
+    experiment_info["stats"]["black_wins_freq"] = n_wins_black / n_games_played
+    experiment_info["stats"]["warm_up_time_game"] = warm_up_time_game
+    experiment_info["stats"]["warm_up_time_a"] = warm_up_time_a
+    experiment_info["stats"]["warm_up_time_b"] = warm_up_time_b
+    experiment_info["stats"]["per_game_seeds"] = True # marker for reproductions (see play_game)
+    if sprt_params is not None:
+        experiment_info["stats"]["sprt"] = {**sprt_params, **sprt_info}
+    
+    t2 = time.time()
+    print(f"MCTS-NC EXPERIMENT DONE. [time: {t2 - t1} s]")
+    
+    if checkpointing:
+        sys.stdout = sys.__stdout__
+        logger.close()
+        writer.close(experiment_info["stats"])
+    return experiment_hs, experiment_info
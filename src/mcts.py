@@ -19,6 +19,9 @@ For public methods full docstrings are provided (with arguments and returns desc
 """
 
 import numpy as np
+import contextlib
+import io
+import threading
 import time
 from utils import dict_to_str
 
@@ -56,6 +59,8 @@ class State:
         self.win_flag = False
         self.n = 0
         self.n_wins = 0
+        self.n_amaf = 0 # AMAF (all-moves-as-first) statistics of the action leading to this state, used by RAVE
+        self.n_wins_amaf = 0
         self.parent = parent
         self.children = {}
         self.outcome_computed = False # has outcome value been already prepared within last call of get_outcome  
@@ -109,6 +114,15 @@ class State:
             self.children[key]._subtree_depths(d + 1, depths)
         return depths
     
+    def _depth(self):
+        """Returns depth of this state (number of ancestors up to the root)."""
+        d = 0
+        state = self.parent
+        while state:
+            d += 1
+            state = state.parent
+        return d
+    
     def get_turn(self):
         """
         Returns {-1, 1} indicating whose turn it is: -1 for the minimizing player, 1 for the maximizing player.
@@ -225,6 +239,41 @@ class State:
                 one-dimensional array with any additional information associated with this state.        
         """        
         return None
+    
+    @classmethod
+    def from_position(cls, board, extra_info, turn):
+        """
+        [To be implemented in subclasses only when positions received from outside (e.g. by :doc:`move_server`) are to be searched using ``MCTS``.]
+        
+        Should return a new state (with no parent) representing the position given by its board, additional information and turn, 
+        i.e. the inverse of ``get_board``, ``get_extra_info``, ``get_turn``.
+        
+        Args:
+            board (ndarray[np.int8, ndim=2]):
+                board of the position.
+            extra_info (ndarray[np.int8, ndim=1] or ``None``):
+                additional information associated with the position.
+            turn {-1, 1}:
+                indicator of the player to act.
+        
+        Returns:
+            state (State):
+                state representing the position.
+        """
+        pass
+    
+    def estimate_moves_left(self):
+        """
+        [To be optionally implemented in subclasses.]
+        
+        Should return a rough estimate of the number of moves left in the game for the player to act (e.g. implied by empty cells or stones left), used by :doc:`time_manager` 
+        to spread the remaining game clock over moves; ``None`` means no estimate (a default horizon is then used).
+        
+        Returns:
+            moves_left (int):
+                estimated number of moves left for the player to act.
+        """
+        return None
             
     def expand(self):
         """        
@@ -317,6 +366,30 @@ class State:
         """        
         pass
     
+
+    @classmethod
+    def warm_up(cls, n_games=1):
+        """
+        Plays random games (from the initial state till the end), so that functions compiled lazily (e.g. numba-jitted outcome functions, see ``lazy_jit`` in :doc:`utils`)
+        get compiled or loaded from cache before any timed search. The state of numpy's global random generator is restored afterwards.
+        
+        Args:
+            n_games (int):
+                number of random games to be played, defaults to ``1``.
+        
+        Returns:
+            warm_up_time (float):
+                time of warm-up [s].
+        """
+        random_state = np.random.get_state()
+        t1 = time.perf_counter()
+        for _ in range(n_games):
+            state = cls()
+            while state.compute_outcome() is None:
+                state = state.take_random_action_playout()
+        t2 = time.perf_counter()
+        np.random.set_state(random_state)
+        return t2 - t1
                                  
 class MCTS:
     """
@@ -330,12 +403,18 @@ class MCTS:
     DEFAULT_SEED = 0
     DEFAULT_VERBOSE_DEBUG = False
     DEFAULT_VERBOSE_INFO = True
+    DEFAULT_WARM_UP_STEPS = 10
+    DEFAULT_PONDER = False
+    DEFAULT_RAVE = False
+    DEFAULT_RAVE_K = 1000.0
+    PONDER_STEPS_LIMIT = 10**6 # bound on steps (hence on tree growth) of a single pondering
     
     def __init__(self, 
                  search_time_limit=DEFAULT_SEARCH_TIME_LIMIT, search_steps_limit=DEFAULT_SEARCH_STEPS_LIMIT,
                  vanilla=DEFAULT_VANILLA,                  
                  ucb_c=DEFAULT_UCB_C, seed=DEFAULT_SEED,
-                 verbose_debug=DEFAULT_VERBOSE_DEBUG, verbose_info=DEFAULT_VERBOSE_INFO):
+                 verbose_debug=DEFAULT_VERBOSE_DEBUG, verbose_info=DEFAULT_VERBOSE_INFO,
+                 tracer=None, ponder=DEFAULT_PONDER, rave=DEFAULT_RAVE, rave_k=DEFAULT_RAVE_K):
         """
         Constructor of ``MCTS`` instances.
          
@@ -350,6 +429,16 @@ class MCTS:
                 debug verbosity flag, if ``True`` then detailed information about each kernel invocation are printed to console (in each iteration), defaults to ``False``.
             verbose_info (bool): 
                 verbosity flag, if ``True`` then standard information on actions and performance are printed to console (after a full run), defaults to ``True``.            
+            tracer (Tracer):
+                tracer recording stages of search steps (see :doc:`tracing`), ``None`` for no tracing, defaults to ``None``.
+            ponder (bool):
+                flag indicating whether the search may continue on the opponent's time (see ``ponder_start``), used by :doc:`game_runner` in games against a human, defaults to ``False``.
+            rave (bool):
+                flag indicating whether RAVE (rapid action value estimation) is used: AMAF (all-moves-as-first) statistics, recorded for actions played anywhere below a state
+                (in the tree and in playouts) by the player to act, are blended into action-value estimates at selection stage, defaults to ``False``.
+            rave_k (float):
+                equivalence parameter of the RAVE schedule - the weight of AMAF estimates is ``sqrt(rave_k / (3 * n + rave_k))`` for an action taken ``n`` times 
+                (one half at ``n = rave_k / 3``), defaults to ``1000.0``.
         """        
         self.search_time_limit = search_time_limit
         self.search_steps_limit = search_steps_limit
@@ -359,6 +448,14 @@ class MCTS:
         np.random.seed(self.seed)
         self.verbose_debug = verbose_debug
         self.verbose_info = verbose_info
+        self.tracer = tracer
+        self.ponder = ponder
+        self.rave = rave
+        self.rave_k = rave_k
+        self.ponder_root = None
+        self.ponder_steps = 0
+        self._ponder_thread = None
+        self._ponder_stop_event = threading.Event()
 
     def __str__(self):         
         """
@@ -367,7 +464,7 @@ class MCTS:
         Returns:
             str: string representation of this ``MCTS`` instance.
         """           
-        return f"MCTS(search_time_limit={self.search_time_limit}, search_steps_limit={self.search_steps_limit}, vanilla={self.vanilla}, ucb_c={self.ucb_c}, seed: {self.seed})"
+        return f"MCTS(search_time_limit={self.search_time_limit}, search_steps_limit={self.search_steps_limit}, vanilla={self.vanilla}, ucb_c={self.ucb_c}{f', rave_k={self.rave_k}' if self.rave else ''}, seed: {self.seed})"
         
     def __repr__(self):
         """
@@ -425,6 +522,9 @@ class MCTS:
             n = children[key].n
             n_wins = children[key].n_wins        
             q = n_wins / n if n > 0 else 0.0 # 2nd case does not affect ucb
+            if self.rave and children[key].n_amaf > 0:
+                beta = np.sqrt(self.rave_k / (3 * n + self.rave_k))
+                q = (1.0 - beta) * q + beta * children[key].n_wins_amaf / children[key].n_amaf
             ucb = q + self.ucb_c * np.sqrt(np.log(n_root) / n) if n > 0 else np.inf 
             entry = {}
             entry["name"] = children[key].__class__.action_index_to_name(key)
@@ -433,6 +533,9 @@ class MCTS:
             entry["n"] = n
             entry["n_wins"] = n_wins
             entry["q"] = n_wins / n if n > 0 else np.nan
+            if self.rave:
+                entry["n_amaf"] = children[key].n_amaf
+                entry["q_amaf"] = children[key].n_wins_amaf / children[key].n_amaf if children[key].n_amaf > 0 else np.nan
             entry["ucb"] = ucb
             actions_info[key] = entry
         if best_action_entry:
@@ -479,9 +582,86 @@ class MCTS:
         self.best_q = self.best_n_wins / self.best_n if self.best_n > 0 else np.nan                      
         return self.best_action
         
+    def warm_up(self, state_class, n_steps=DEFAULT_WARM_UP_STEPS):
+        """
+        Warms up the search for states of given class, before any timed search (e.g. before a match): plays a random game (see ``State.warm_up``) and runs a short search from the initial state
+        (console output suppressed, tracer detached). The state of numpy's global random generator is restored afterwards.
+        
+        Args:
+            state_class (class):
+                class of states (game) to be searched.
+            n_steps (int):
+                number of steps of the warm-up search, defaults to ``10``.
+        
+        Returns:
+            warm_up_time (float):
+                time of warm-up [s].
+        """
+        random_state = np.random.get_state()
+        tracer = self.tracer
+        self.tracer = None
+        t1 = time.perf_counter()
+        state_class.warm_up()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.run(state_class(), n_steps)
+        t2 = time.perf_counter()
+        self.tracer = tracer
+        np.random.set_state(random_state)
+        return t2 - t1
+        
+    def ponder_start(self, state):
+        """
+        Starts pondering - searching on the opponent's time: steps of the search are carried out from the given state (the position after our move) in a background thread,
+        until ``ponder_stop`` is called (at the latest, by the next ``run``). If the next ``run`` is called on that state or on one of its children (the position after the opponent's move),
+        then the statistics gathered while pondering are kept (also for a vanilla search), so that the search effectively gets the opponent's thinking time on top of its own budget.
+        Tree states shared with the game (see ``State.take_action``) must not be touched by other code while pondering, i.e. ``ponder_stop`` should be called before the opponent's move is taken.
+        Pondering is meant for games against a human - against another AI in the same process it would compete with the opponent's search for the interpreter.
+        
+        Args:
+            state (State):
+                state (position after our move) to be searched while the opponent thinks; nothing happens for a terminal state.
+        """
+        self.ponder_stop()
+        if state.compute_outcome() is not None:
+            return
+        print("MCTS PONDER...")
+        state.parent = None
+        self.ponder_root = state
+        self.ponder_steps = 0
+        self.time_select = 0.0 # accumulated by steps, reset again by next run
+        self.time_expand = 0.0        
+        self.time_playout = 0.0
+        self.time_backup = 0.0    
+        self._ponder_stop_event.clear()
+        self._ponder_thread = threading.Thread(target=self._ponder, daemon=True)
+        self._ponder_thread.start()
+        
+    def ponder_stop(self):
+        """
+        Stops pondering (if started) and waits for the background thread to finish its current step. 
+        
+        Returns:
+            self.ponder_steps (int):
+                number of steps carried out while pondering.
+        """
+        if self._ponder_thread is None:
+            return self.ponder_steps
+        self._ponder_stop_event.set()
+        self._ponder_thread.join()
+        self._ponder_thread = None
+        print(f"MCTS PONDER DONE. [steps: {self.ponder_steps}, n_root: {self.ponder_root.n}]")
+        return self.ponder_steps
+    
+    def _ponder(self):
+        """Carries out steps of the search from the pondered state until stopped (target of the background thread)."""
+        while not self._ponder_stop_event.is_set() and self.ponder_steps < MCTS.PONDER_STEPS_LIMIT:
+            self._step(self.ponder_root)
+            self.ponder_steps += 1
+        
     def run(self, root, forced_search_steps_limit=np.inf):
         """
         Runs the standard, referential implementation of Monte Carlo Tree Search (on CPU, single-threaded).
+        Equivalent to ``start``, calls of ``step`` until the computational budget is used, and ``stop``.
         
         Args:
             root (State):
@@ -492,11 +672,40 @@ class MCTS:
             self.best_action (int):
                 best action resulting from search.                        
         """
+        self.ponder_stop()
         print("MCTS RUN...")
-        t1 = time.time()
+        self.start(root)
+        while True:
+            t2_loop = time.perf_counter_ns()
+            if forced_search_steps_limit < np.inf:
+                if self.steps >= forced_search_steps_limit:
+                    break
+            elif self.steps >= self.search_steps_limit or (t2_loop - self._t1_loop) * 1e-9 >= self.search_time_limit:
+                break            
+            self.step()
+        self.stop()
+        best_action_label = str(self.best_action)
+        best_action_label += f" ({type(self.root).action_index_to_name(self.best_action)})"
+        print(f"MCTS RUN DONE. [time: {self.time_total} s; best action: {best_action_label}, best win_flag: {self.best_win_flag}, best n: {self.best_n}, best n_wins: {self.best_n_wins}, best q: {self.best_q}]")                      
+        return self.best_action
+    
+    def start(self, root):
+        """
+        Starts an anytime (step-wise) search from the given root state, with no computational budget imposed: steps are carried out by calls of ``step``, 
+        the best action found so far can be queried at any moment by ``current_best`` (or ``current_actions_info``) and the search is finished by ``stop``.
+        Hence, a caller can interleave several searches (e.g. in one event loop) and decide on its own when to stop each of them.
+        
+        Args:
+            root (State):
+                root state from which the search starts.
+        """
+        self.ponder_stop()
+        self._t1 = time.time()
+        pondered = self.ponder_root is not None and (root is self.ponder_root or root.parent is self.ponder_root) # statistics from pondering kept even if vanilla
+        self.ponder_root = None
         self.root = root
         self.root.parent = None
-        if self.vanilla:
+        if self.vanilla and not pondered:
             self.root.n = 0                       
             self.root.children = {}
         
@@ -511,82 +720,129 @@ class MCTS:
         self.time_playout = 0.0
         self.time_backup = 0.0    
         self.steps = 0
-                
-        t1_loop = time.time()
-        while True:
-            t2_loop = time.time()
-            if forced_search_steps_limit < np.inf:
-                if self.steps >= forced_search_steps_limit:
-                    break
-            elif self.steps >= self.search_steps_limit or t2_loop - t1_loop >= self.search_time_limit:
-                break            
-            state = self.root
-            
-            # selection
-            if self.verbose_debug:
-                print(f"[MCTS._select()...]")            
-            t1_select = time.time()
-            state = self._select(state)
-            t2_select = time.time()
-            if self.verbose_debug:
-                print(f"[MCTS._select() done; time: {t2_select - t1_select} s]")            
-            self.time_select += t2_select - t1_select
-            
-            # expansion
-            if self.verbose_debug:
-                print(f"[MCTS._expand()...]")
-            t1_expand = time.time()
-            state = self._expand(state)
-            t2_expand = time.time()
-            if self.verbose_debug:
-                print(f"[MCTS._expand() done; time: {t2_expand - t1_expand} s]")            
-            self.time_expand += t2_expand - t1_expand            
-            
-            # playout
-            if self.verbose_debug:
-                print(f"[MCTS._playout()...]")
-            t1_playout = time.time()
-            playout_root = state
-            state = self._playout(state)
-            t2_playout = time.time()
-            if self.verbose_debug:
-                print(f"[MCTS._playout() done; time: {t2_playout - t1_playout} s]")                        
-            self.time_playout += t2_playout - t1_playout                            
-            
-            # backup
-            if self.verbose_debug:
-                print(f"[MCTS._backup()...]")           
-            t1_backup = time.time()
-            self._backup(state, playout_root)
-            t2_backup = time.time()
-            if self.verbose_debug:
-                print(f"[MCTS._backup() done; time: {t2_backup - t1_backup} s]")            
-            self.time_backup += t2_backup - t1_backup                                
-            
-            self.steps += 1  
-        self.time_loop = time.time() - t1_loop
+        self._t1_loop = time.perf_counter_ns() # stages timed in [ns] (clock shared with tracer)
+        
+    def step(self, n_steps=1):
+        """
+        Carries out steps of the search started by ``start``.
+        
+        Args:
+            n_steps (int):
+                number of steps to be carried out, defaults to ``1``.
+        
+        Returns:
+            self.steps (int):
+                total number of steps carried out since ``start``.
+        """
+        for _ in range(n_steps):
+            self._step(self.root, self.tracer)
+            self.steps += 1
+        return self.steps
+    
+    def current_best(self):
+        """
+        Returns the best action found so far by the search started by ``start`` (using the same criteria as the final decision, see ``_best_action``), ``None`` if no root action has been expanded yet.
+        Cheap to call mid-search - only the children of the root are looked at.
+        
+        Returns:
+            self.best_action (int):
+                best action found so far.
+        """
+        return self._best_action(self.root.children, self._make_actions_info(self.root.children))
+    
+    def current_actions_info(self):
+        """
+        Returns a snapshot of information on root actions (as in ``actions_info`` attribute, with the ``"best"`` entry) for the search started by ``start``, 
+        ``None`` if no root action has been expanded yet. Cheap to call mid-search - only the children of the root are looked at.
+        
+        Returns:
+            actions_info (dict):
+                dictionary with information on root actions.
+        """
+        if len(self.root.children) == 0:
+            return None
+        return self._make_actions_info(self.root.children, best_action_entry=True)
+        
+    def stop(self):
+        """
+        Finishes the search started by ``start``: finds the best action and prepares information on actions (``actions_info`` attribute) and on performance (``performance_info`` attribute, if ``verbose_info``).
+        
+        Returns:
+            self.best_action (int):
+                best action resulting from search.
+        """
+        self.time_loop = (time.perf_counter_ns() - self._t1_loop) * 1e-9
 
         if self.verbose_debug:
             print(f"[MCTS._reduce_over_actions()...]")        
         t1_reduce_over_actions = time.time()        
         self._reduce_over_actions()
-        best_action_label = str(self.best_action)
-        best_action_label += f" ({type(self.root).action_index_to_name(self.best_action)})"
         t2_reduce_over_actions = time.time()
         if self.verbose_debug:
             print(f"[MCTS._reduce_over_actions() done; time: {t2_reduce_over_actions - t1_reduce_over_actions} s]")        
         self.time_reduce_over_actions = t2_reduce_over_actions - t1_reduce_over_actions     
         
         t2 = time.time()    
-        self.time_total = t2 - t1
+        self.time_total = t2 - self._t1
         
         if self.verbose_info:
             print(f"[actions info:\n{dict_to_str(self.root_actions_info)}]")
             print(f"[performance info:\n{dict_to_str(self._make_performance_info())}]")
-                                             
-        print(f"MCTS RUN DONE. [time: {self.time_total} s; best action: {best_action_label}, best win_flag: {self.best_win_flag}, best n: {self.best_n}, best n_wins: {self.best_n_wins}, best q: {self.best_q}]")                      
         return self.best_action
     
+    def _step(self, root, tracer=None):
+        """Performs a single step of the search (selection, expansion, playout, backup) from the given root, recording its stages if a tracer is given."""
+        state = root
+        
+        # selection
+        if self.verbose_debug:
+            print(f"[MCTS._select()...]")            
+        t1_select = time.perf_counter_ns()
+        state = self._select(state)
+        t2_select = time.perf_counter_ns()
+        if self.verbose_debug:
+            print(f"[MCTS._select() done; time: {(t2_select - t1_select) * 1e-9} s]")            
+        self.time_select += (t2_select - t1_select) * 1e-9
+        if tracer is not None:
+            tracer.record("select", t1_select, t2_select, self.steps, state._depth())
+        
+        # expansion
+        if self.verbose_debug:
+            print(f"[MCTS._expand()...]")
+        t1_expand = time.perf_counter_ns()
+        state = self._expand(state)
+        t2_expand = time.perf_counter_ns()
+        if self.verbose_debug:
+            print(f"[MCTS._expand() done; time: {(t2_expand - t1_expand) * 1e-9} s]")            
+        self.time_expand += (t2_expand - t1_expand) * 1e-9
+        if tracer is not None:
+            tracer.record("expand", t1_expand, t2_expand, self.steps, len(state.parent.children) if state.parent else 0)
+        
+        # playout
+        if self.verbose_debug:
+            print(f"[MCTS._playout()...]")
+        t1_playout = time.perf_counter_ns()
+        playout_root = state
+        state = self._playout(state)
+        t2_playout = time.perf_counter_ns()
+        if self.verbose_debug:
+            print(f"[MCTS._playout() done; time: {(t2_playout - t1_playout) * 1e-9} s]")                        
+        self.time_playout += (t2_playout - t1_playout) * 1e-9
+        if tracer is not None:
+            tracer.record("playout", t1_playout, t2_playout, self.steps, state._depth() - playout_root._depth())
+        
+        # backup
+        if self.verbose_debug:
+            print(f"[MCTS._backup()...]")           
+        t1_backup = time.perf_counter_ns()
+        self._backup(state, playout_root)
+        t2_backup = time.perf_counter_ns()
+        if self.verbose_debug:
+            print(f"[MCTS._backup() done; time: {(t2_backup - t1_backup) * 1e-9} s]")            
+        self.time_backup += (t2_backup - t1_backup) * 1e-9
+        if tracer is not None:
+            tracer.record("backup", t1_backup, t2_backup, self.steps, playout_root._depth() + 1)
+    
     def _select(self, state):
         """Performs the selection stage and returns the selected state."""
         while len(state.children) > 0:
@@ -604,24 +860,38 @@ class MCTS:
         return state
     
     def _playout(self, state):
-        """Performs the playout stage and returns the reached terminal state."""
+        """Performs the playout stage and returns the reached terminal state; if RAVE is used, records pairs (turn, action) played in the playout (for AMAF statistics)."""
+        if self.rave:
+            self._playout_moves = set()
         while True:
             outcome = state.compute_outcome()
             if outcome is not None:
-                break        
+                break
+            turn = state.turn
             state = state.take_random_action_playout()
+            if self.rave:
+                self._playout_moves.add((turn, state.last_action_index))
         return state        
     
     def _backup(self, state, playout_root):
-        """Calls ``compute_outcome`` method on the terminal state (``state``), and suitably backs up the outcome to ancestors of the playout root."""
+        """Calls ``compute_outcome`` method on the terminal state (``state``), and suitably backs up the outcome to ancestors of the playout root (if RAVE is used, also to AMAF statistics of their children)."""
         outcome = state.compute_outcome()
         state = playout_root
         del state.children # getting rid of playout branch
         state.children = {}
+        moves = self._playout_moves if self.rave else None # pairs (turn, action) played below current state
         while state:
             state.n += 1
             if state.turn == -outcome:
                 state.n_wins += 1
+            if self.rave:
+                for key, child in state.children.items():
+                    if (state.turn, key) in moves:
+                        child.n_amaf += 1
+                        if child.turn == -outcome:
+                            child.n_wins_amaf += 1
+                if state.parent:
+                    moves.add((state.parent.turn, state.last_action_index))
             state = state.parent
             
     def _reduce_over_actions(self):
@@ -162,11 +162,16 @@ from numba import void, int8, int16, int32, int64, float32, boolean
 from numba.cuda.random import create_xoroshiro128p_states, xoroshiro128p_uniform_float32, xoroshiro128p_type 
 import time
 import math
+import contextlib
+import io
 from numba.core.errors import NumbaPerformanceWarning
 import warnings
 from mctsnc_game_mechanics import is_action_legal, take_action, legal_actions_playout, take_action_playout, compute_outcome
+from mctsnc_game_mechanics import PLAYOUT_BOARD_SHAPE, PLAYOUT_EXTRA_INFO_MEMORY, PLAYOUT_MAX_ACTIONS
 from utils import dict_to_str
 import json
+import zipfile
+import struct
 
 __version__ = "1.0.1"
 __author__ = "Przemysław Klęsk"
@@ -174,6 +179,8 @@ __email__ = "pklesk@zut.edu.pl"
 
 #warnings.simplefilter("ignore", category=NumbaPerformanceWarning)
 
+PLAYOUT_LEGAL_ACTIONS_WITH_COUNT_LENGTH = PLAYOUT_MAX_ACTIONS + 1 # compile-time constant for local arrays in playout kernels 
+
 # the class
 class MCTSNC:
     """
@@ -192,6 +199,9 @@ class MCTSNC:
     DEFAULT_SEED = 0 
     DEFAULT_VERBOSE_DEBUG = False
     DEFAULT_VERBOSE_INFO = True
+    DEFAULT_WARM_UP_STEPS = 10
+    DEFAULT_RAVE = False
+    DEFAULT_RAVE_K = 1000.0
     MAX_STATE_BOARD_SHAPE = (32, 32)
     MAX_STATE_EXTRA_INFO_MEMORY = 4096
     MAX_STATE_MAX_ACTIONS = 512            
@@ -205,7 +215,7 @@ class MCTSNC:
                  n_trees=DEFAULT_N_TREES, n_playouts=DEFAULT_N_PLAYOUTS, variant=DEFAULT_VARIANT, device_memory=DEFAULT_DEVICE_MEMORY,                   
                  ucb_c=DEFAULT_UCB_C, seed=DEFAULT_SEED,
                  verbose_debug=DEFAULT_VERBOSE_DEBUG, verbose_info=DEFAULT_VERBOSE_INFO,
-                 action_index_to_name_function=None):
+                 action_index_to_name_function=None, tracer=None, rave=DEFAULT_RAVE, rave_k=DEFAULT_RAVE_K):
         """
         Constructor of ``MCTSNC`` instances.
          
@@ -236,6 +246,13 @@ class MCTSNC:
                 verbosity flag, if ``True`` then standard information on actions and performance are printed to console (after a full run), defaults to ``True``.
             action_index_to_name_function (callable):
                 pointer to user-provided function converting action indexes to a human-friendly names (e.g. ``"e2:e4"`` for chess), defaults to ``None``.            
+            tracer (Tracer):
+                tracer recording stages of search steps (see :doc:`tracing`), ``None`` for no tracing, defaults to ``None``.
+            rave (bool):
+                flag indicating whether RAVE (rapid action value estimation) is used: AMAF (all-moves-as-first) statistics of tree nodes, recorded during playouts and along selected paths, 
+                are blended into action-value estimates at selection stage, defaults to ``False``.
+            rave_k (float):
+                equivalence parameter of the RAVE schedule - the weight of AMAF estimates is ``sqrt(rave_k / (3 * n + rave_k))`` for a node visited ``n`` times, defaults to ``1000.0``.
         """
         self._set_cuda_constants()
         if not self.cuda_available:
@@ -276,8 +293,14 @@ class MCTSNC:
         self.verbose_debug = verbose_debug 
         self._validate_param("verbose_debug", bool, False, False, False, True, self.DEFAULT_VERBOSE_DEBUG)
         self.verbose_info = verbose_info 
-        self._validate_param("verbose_info", bool, False, False, False, True, self.DEFAULT_VERBOSE_INFO)        
+        self._validate_param("verbose_info", bool, False, False, False, True, self.DEFAULT_VERBOSE_INFO)
+        self.rave = rave
+        self._validate_param("rave", bool, False, False, False, True, self.DEFAULT_RAVE)
+        self.rave_k = rave_k
+        self._validate_param("rave_k", float, True, 0.0, False, np.inf, self.DEFAULT_RAVE_K)
+        self.tracer = tracer        
         self.action_index_to_name_function = action_index_to_name_function                                                                  
+        self._search = None # generator of the search in progress (see start)
     
     def _set_cuda_constants(self):
         """Investigates (via ``numba`` module) if CUDA-based computations are available and, if so, sets suitable constants."""
@@ -306,7 +329,7 @@ class MCTSNC:
         Returns:
             str: string representation of this ``MCTSNC`` instance.
         """   
-        return f"MCTSNC(search_time_limit={self.search_time_limit}, search_steps_limit={self.search_steps_limit}, n_trees={self.n_trees}, n_playouts={self.n_playouts}, variant='{self.variant}', device_memory={np.round(self.device_memory / 1024**3, 2)}, ucb_c={self.ucb_c}, seed: {self.seed})"
+        return f"MCTSNC(search_time_limit={self.search_time_limit}, search_steps_limit={self.search_steps_limit}, n_trees={self.n_trees}, n_playouts={self.n_playouts}, variant='{self.variant}', device_memory={np.round(self.device_memory / 1024**3, 2)}, ucb_c={self.ucb_c}{f', rave_k={self.rave_k}' if self.rave else ''}, seed: {self.seed})"
         
     def __repr__(self):
         """
@@ -325,7 +348,10 @@ class MCTSNC:
         """
         if self.verbose_info:
             print(f"[MCTSNC._init_device_side_arrays()... for {self}]")
-        t1_dev_arrays = time.time()
+        if self.state_board_shape[0] > PLAYOUT_BOARD_SHAPE[0] or self.state_board_shape[1] > PLAYOUT_BOARD_SHAPE[1] or self.state_extra_info_memory > PLAYOUT_EXTRA_INFO_MEMORY \
+            or self.state_max_actions > PLAYOUT_MAX_ACTIONS:
+            sys.exit(f"[MCTSNC.init_device_side_arrays(): exiting due to state sizes exceeding playout sizes compiled into kernels (see PLAYOUT_* constants in mctsnc_game_mechanics)]")
+        t1_dev_arrays = time.perf_counter()
         # dtypes 
         node_index_dtype = np.int32
         node_index_bytes = node_index_dtype().itemsize # 4 B
@@ -356,6 +382,9 @@ class MCTSNC:
                                         + node_index_bytes * (self.MAX_TREE_DEPTH + 2) # tree size, tree node selected, tree actions expanded * (self.state_max_actions + 2), playout outcomes * 2, selected path          
         if "acp" in self.variant: # playout all children
             per_tree_additional_memory += playout_outcomes_bytes * self.state_max_actions * 2  # playout children outcomes            
+        if self.rave:
+            per_state_additional_memory += 2 * ns_bytes # AMAF ns, ns_wins
+            per_tree_additional_memory += playout_outcomes_bytes * 2 * self.state_max_actions * 2 # playout AMAF counts and wins per player and action
         per_state_memory = board_element_bytes * np.prod(self.state_board_shape) + extra_info_element_bytes * self.state_extra_info_memory \
                             + node_index_bytes * (1 + self.state_max_actions) + per_state_additional_memory # board, extra info, tree array entry (parent, children nodes), additional memory
         self.max_tree_size = (int(self.device_memory) - self.n_trees * per_tree_additional_memory) // (per_state_memory * self.n_trees)
@@ -389,14 +418,16 @@ class MCTSNC:
         self.dev_trees_actions_expanded = cuda.device_array((self.n_trees, self.state_max_actions + 2), dtype=action_index_dtype) # +2 because 2 last entries inform about: child picked randomly for playouts, number of actions (children) expanded            
         self.dev_trees_playout_outcomes = cuda.device_array((self.n_trees, 2), dtype=playout_outcomes_dtype) # each row stores counts of: -1 wins and +1 wins, respectively (for given tree) 
         self.dev_trees_playout_outcomes_children = None
-        self.dev_random_generators_expand_1 = None         
-        self.dev_random_generators_playout = None
-        if "ocp" in self.variant:
-            self.dev_random_generators_expand_1 = create_xoroshiro128p_states(self.n_trees * self.tpb_e1, seed=self.seed)
-            self.dev_random_generators_playout = create_xoroshiro128p_states(self.n_trees * self.n_playouts, seed=self.seed)
-        else: # "acp"
-            self.dev_random_generators_playout = create_xoroshiro128p_states(self.n_trees * self.state_max_actions * self.n_playouts, seed=self.seed)                    
+        self._init_random_generators()
+        if "acp" in self.variant:
             self.dev_trees_playout_outcomes_children = cuda.device_array((self.n_trees, self.state_max_actions, 2), dtype=playout_outcomes_dtype) # for each (playable) action, each row stores counts of: -1 wins and +1 wins, respectively (for given tree)
+        self.dev_trees_amaf_ns = None
+        self.dev_trees_amaf_ns_wins = None
+        self.dev_trees_playout_amaf = cuda.to_device(np.zeros((1, 1, 1, 1), dtype=playout_outcomes_dtype)) # fake array (playout kernels record AMAF statistics only for RAVE)
+        if self.rave:
+            self.dev_trees_amaf_ns = cuda.device_array((self.n_trees, self.max_tree_size), dtype=ns_dtype)
+            self.dev_trees_amaf_ns_wins = cuda.device_array((self.n_trees, self.max_tree_size), dtype=ns_dtype)
+            self.dev_trees_playout_amaf = cuda.to_device(np.zeros((self.n_trees, 2, self.state_max_actions, 2), dtype=playout_outcomes_dtype)) # for each player (-1, +1) and action: count of playouts with the action played by the player and wins of the player among them (zeroed after each backup)
         self.dev_root_actions_expanded = cuda.device_array(self.state_max_actions + 2, dtype=action_index_dtype)                    
         self.dev_root_ns = cuda.device_array(self.state_max_actions, dtype=ns_extended_dtype) # all entries the same regardless of root action (overhead for convenience)
         self.dev_actions_win_flags = cuda.device_array(self.state_max_actions, dtype=flag_dtype)
@@ -406,14 +437,55 @@ class MCTSNC:
         self.dev_best_win_flag = cuda.device_array(1, dtype=flag_dtype)                
         self.dev_best_n = cuda.device_array(1, dtype=ns_extended_dtype)
         self.dev_best_n_wins = cuda.device_array(1, dtype=ns_extended_dtype)                 
-        t2_dev_arrays = time.time()
+        t2_dev_arrays = time.perf_counter()
         if self.verbose_info:
             print(f"[MCTSNC._init_device_side_arrays() done; time: {t2_dev_arrays - t1_dev_arrays} s, per_state_memory: {per_state_memory} B,  calculated max_tree_size: {self.max_tree_size}]")
         
+    def _init_random_generators(self):
+        """Creates (or re-creates) states of device-side random generators, seeded with ``self.seed``."""
+        self.dev_random_generators_expand_1 = None         
+        self.dev_random_generators_playout = None
+        if "ocp" in self.variant:
+            self.dev_random_generators_expand_1 = create_xoroshiro128p_states(self.n_trees * self.tpb_e1, seed=self.seed)
+            self.dev_random_generators_playout = create_xoroshiro128p_states(self.n_trees * self.n_playouts, seed=self.seed)
+        else: # "acp"
+            self.dev_random_generators_playout = create_xoroshiro128p_states(self.n_trees * self.state_max_actions * self.n_playouts, seed=self.seed)
+    
+    def warm_up(self, state_class, n_steps=DEFAULT_WARM_UP_STEPS):
+        """
+        Warms up the search for states of given class, before any timed search (e.g. before a match), so that first-call costs (loading of kernels onto device, first transfers, 
+        jit compilations at host side) do not land in the first search: runs a short search from the initial state (console output suppressed, tracer detached).
+        Afterwards, states of device-side random generators are re-created, so that subsequent searches are the same as without warm-up.
+        Requires device arrays to be allocated first (see ``init_device_side_arrays``).
+        
+        Args:
+            state_class (class):
+                class of states (game) to be searched.
+            n_steps (int):
+                number of steps of the warm-up search, defaults to ``10``.
+        
+        Returns:
+            warm_up_time (float):
+                time of warm-up [s].
+        """
+        tracer = self.tracer
+        self.tracer = None
+        t1 = time.perf_counter()
+        state_class.warm_up()
+        root = state_class()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.run(root.get_board(), root.get_extra_info(), root.get_turn(), n_steps)
+        self._init_random_generators()
+        cuda.synchronize()
+        t2 = time.perf_counter()
+        self.tracer = tracer
+        return t2 - t1
+        
     def run(self, root_board, root_extra_info, root_turn, forced_search_steps_limit=np.inf):
         """
         Runs the Monte Carlo Tree Search on GPU involving multiple concurrent trees and playouts.                 
         Computations are carried out according to the formerly chosen algorithmic variant, i.e. one of {``"ocp_thrifty"``, ``"ocp_prodigal"``, ``"acp_thrifty``, ``"acp_prodigal``}, defaults to ``"acp_prodigal"``}.
+        Equivalent to ``start``, calls of ``step`` until the computational budget is used, and ``stop``.
         
         Args:
             root_board (ndarray): 
@@ -429,14 +501,107 @@ class MCTSNC:
                 best action resulting from search.
         """
         print(f"MCTSNC RUN... [{self}]")        
-        run_method = getattr(self, "_run_" + self.variant)
-        run_method(root_board, root_extra_info, root_turn, forced_search_steps_limit)
+        self.start(root_board, root_extra_info, root_turn)
+        while True:
+            t2_loop = time.perf_counter()            
+            if forced_search_steps_limit < np.inf: 
+                if self.steps >= forced_search_steps_limit:
+                    break
+            elif self.steps >= self.search_steps_limit or t2_loop - self._t1_loop >= self.search_time_limit:
+                break
+            self.step()
+        self.stop()
         best_action_label = str(self.best_action)
         if self.action_index_to_name_function is not None:
             best_action_label += f" ({self.action_index_to_name_function(self.best_action)})"
         print(f"MCTSNC RUN DONE. [time: {self.time_total} s; best action: {best_action_label}, best win_flag: {self.best_win_flag}, best n: {self.best_n}, best n_wins: {self.best_n_wins}, best q: {self.best_q}]")
         return self.best_action
     
+    def start(self, root_board, root_extra_info, root_turn):
+        """
+        Starts an anytime (step-wise) search from the given root state, with no computational budget imposed: trees are reset at once, steps are carried out by calls of ``step``, 
+        the best action found so far can be queried at any moment by ``current_best`` (or ``current_actions_info``) and the search is finished by ``stop``.
+        Hence, a caller can interleave several searches (e.g. in one event loop) and decide on its own when to stop each of them. 
+        Device-side arrays are shared by searches of one instance - only one search per instance can be in progress (a search not stopped is abandoned by the next ``start``).
+        
+        Args:
+            root_board (ndarray): 
+                two-dimensional array with board (or other representation) of root state from which the search starts.
+            root_extra_info (ndarray): 
+                any additional information of root state not implied by the contents of the board itself, or technical information useful to generate legal actions faster.
+            root_turn {-1, 1}:
+                indicator of the player, minimizing or maximizing, to act first at root state.
+        """
+        self._t1 = time.perf_counter()
+        self.root_turn = root_turn
+        self._search = getattr(self, "_search_" + self.variant)(root_board, root_extra_info, root_turn)
+        next(self._search) # reset
+        
+    def step(self, n_steps=1):
+        """
+        Carries out steps of the search started by ``start`` (each step: selections, expansions, playouts and backups in all trees).
+        
+        Args:
+            n_steps (int):
+                number of steps to be carried out, defaults to ``1``.
+        
+        Returns:
+            self.steps (int):
+                total number of steps carried out since ``start``.
+        """
+        if self._search is None:
+            sys.exit("[MCTSNC.step(): exiting due to no search in progress (start not called)]")
+        for _ in range(n_steps):
+            next(self._search)
+        return self.steps
+    
+    def current_best(self):
+        """
+        Returns the best action found so far by the search started by ``start`` (using the same criteria as the final decision), ``None`` if no step has been carried out yet.
+        Cheap to call mid-search - only the reductions over trees and over root actions are performed (trees stay intact on the device side).
+        
+        Returns:
+            self.best_action (int):
+                best action found so far.
+        """
+        if self.steps == 0:
+            return None
+        getattr(self, "_reduce_" + self.variant.split("_")[1])()
+        return self.best_action
+    
+    def current_actions_info(self):
+        """
+        Returns a snapshot of information on root actions (as in ``actions_info`` attribute, with the ``"best"`` entry) for the search started by ``start``, 
+        ``None`` if no step has been carried out yet. Cheap to call mid-search - only the reductions and a transfer of arrays indexed by root actions take place.
+        
+        Returns:
+            actions_info (dict):
+                dictionary with information on root actions.
+        """
+        if self.current_best() is None:
+            return None
+        return getattr(self, "_make_actions_info_" + self.variant.split("_")[1])()
+    
+    def stop(self):
+        """
+        Finishes the search started by ``start``: finds the best action and prepares information on actions (``actions_info`` attribute) and on performance (``performance_info`` attribute, if ``verbose_info``).
+        
+        Returns:
+            self.best_action (int):
+                best action resulting from search.
+        """
+        self.time_loop = time.perf_counter() - self._t1_loop
+        self._search.close()
+        self._search = None
+        thrifty_or_prodigal = self.variant.split("_")[1]
+        getattr(self, "_reduce_" + thrifty_or_prodigal)()
+        t2 = time.perf_counter()
+        self.time_total = t2 - self._t1
+        if self.verbose_info:
+            print(f"[actions info:\n{dict_to_str(getattr(self, '_make_actions_info_' + thrifty_or_prodigal)())}]")
+            print(f"[performance info:\n{dict_to_str(self._make_performance_info())}]")
+        return self.best_action
+    
     def _flatten_trees_actions_expanded_thrifty(self, trees_actions_expanded):
         """Uses information from array ``trees_actions_expanded`` of shape ``(self.n_trees, self.state_max_actions + 2)`` and converts it to another array where the number of rows corresponds to the total of expanded legal actions in all trees. Each row contains a pair of indexes for: action and tree. The approach allows to allocate exact number of needed CUDA blocks for further operations."""            
         actions_expanded_cumsum = np.cumsum(trees_actions_expanded[:, -1])
@@ -567,12 +732,17 @@ class MCTSNC:
         self.actions_info = actions_info
         return actions_info
                                                    
-    def _run_ocp_thrifty(self, root_board, root_extra_info, root_turn, forced_search_steps_limit=np.inf):
-        """Runs computations for algorithmic variant: ``"ocp_thrifty"``."""
-        t1 = time.time()
-        
+    def _trace_step(self, t1_select, t2_select, t1_expand, t2_expand, t1_playout, t2_playout, t1_backup, t2_backup, n_expanded=-1):
+        """Records stages of the current step (given their starts and ends from ``time.perf_counter``) into the tracer."""
+        self.tracer.record_s("select", t1_select, t2_select, self.steps)
+        self.tracer.record_s("expand", t1_expand, t2_expand, self.steps, n_expanded)
+        self.tracer.record_s("playout", t1_playout, t2_playout, self.steps, self.n_trees * self.n_playouts)
+        self.tracer.record_s("backup", t1_backup, t2_backup, self.steps)
+
+    def _search_ocp_thrifty(self, root_board, root_extra_info, root_turn):
+        """Generator of computations for algorithmic variant: ``"ocp_thrifty"`` - resets trees and then carries out consecutive steps, yielding after the reset and after each step."""
         # reset
-        t1_reset = time.time()
+        t1_reset = time.perf_counter()
         bpg = self.n_trees
         tpb = self.tpb_r
         dev_root_board = cuda.to_device(root_board)
@@ -585,7 +755,7 @@ class MCTSNC:
                                 self.dev_trees, self.dev_trees_sizes, self.dev_trees_depths, self.dev_trees_turns, self.dev_trees_leaves, self.dev_trees_terminals, self.dev_trees_ns, self.dev_trees_ns_wins, 
                                 self.dev_trees_boards, self.dev_trees_extra_infos)
         cuda.synchronize()    
-        t2_reset = time.time()
+        t2_reset = time.perf_counter()
         if self.verbose_debug:
             print(f"[MCTSNC._reset() done; time: {t2_reset - t1_reset} s]")
             
@@ -596,35 +766,35 @@ class MCTSNC:
         self.steps = 0
         trees_actions_expanded = np.empty((self.n_trees, self.state_max_actions + 2), dtype=np.int16) # needed at host side for thrifty variants
         
-        t1_loop = time.time()
+        self._t1_loop = time.perf_counter()
+        yield # trees reset
         while True:
-            t2_loop = time.time()            
-            if forced_search_steps_limit < np.inf: 
-                if self.steps >= forced_search_steps_limit:
-                    break
-            elif self.steps >= self.search_steps_limit or t2_loop - t1_loop >= self.search_time_limit:
-                break
             if self.verbose_debug:
-                print(f"[step: {self.steps + 1} starting, time used so far: {t2_loop - t1_loop} s]")     
+                print(f"[step: {self.steps + 1} starting, time used so far: {time.perf_counter() - self._t1_loop} s]")
             
             # selections
-            t1_select = time.time()
+            t1_select = time.perf_counter()
             bpg = self.n_trees
             tpb = self.tpb_s
             if self.verbose_debug:
                 print(f"[MCTSNC._select()...; bpg: {bpg}, tpb: {tpb}]")
-            MCTSNC._select[bpg, tpb](self.ucb_c, 
-                                     self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, 
-                                     self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
+            if self.rave:
+                MCTSNC._select_rave[bpg, tpb](self.ucb_c, self.rave_k, 
+                                              self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, self.dev_trees_amaf_ns, self.dev_trees_amaf_ns_wins, 
+                                              self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
+            else:
+                MCTSNC._select[bpg, tpb](self.ucb_c, 
+                                         self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, 
+                                         self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
             cuda.synchronize()
-            t2_select = time.time()
+            t2_select = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._select() done; time: {t2_select - t1_select} s]")
             self.time_select += t2_select - t1_select
             
             # expansions            
-            t1_expand = time.time()
-            t1_expand_1 = time.time()
+            t1_expand = time.perf_counter()
+            t1_expand_1 = time.perf_counter()
             bpg = self.n_trees
             tpb = self.tpb_e1
             if self.verbose_debug:
@@ -638,10 +808,10 @@ class MCTSNC:
             if self.steps == 0:                
                 MCTSNC._memorize_root_actions_expanded[1, self.state_max_actions + 2](self.dev_trees_actions_expanded, self.dev_root_actions_expanded)                            
                 cuda.synchronize()
-            t2_expand_1 = time.time()            
+            t2_expand_1 = time.perf_counter()            
             if self.verbose_debug:
                 print(f"[MCTSNC._expand_1_ocp_thrifty() done; time: {t2_expand_1 - t1_expand_1} s]")
-            t1_expand_2 = time.time()            
+            t1_expand_2 = time.perf_counter()            
             trees_actions_expanded_flat = self._flatten_trees_actions_expanded_thrifty(trees_actions_expanded)
             bpg = trees_actions_expanded_flat.shape[0] # thrifty number of blocks
             tpb = self.tpb_e2
@@ -652,14 +822,14 @@ class MCTSNC:
                                                self.dev_trees_boards, self.dev_trees_extra_infos,                                               
                                                self.dev_trees_nodes_selected, dev_trees_actions_expanded_flat)
             cuda.synchronize()
-            t2_expand_2 = time.time()
+            t2_expand_2 = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._expand_2_thrifty() done; time: {t2_expand_2 - t1_expand_2} s]")
-            t2_expand = time.time()
+            t2_expand = time.perf_counter()
             self.time_expand += t2_expand - t1_expand
             
             # playouts
-            t1_playout = time.time()
+            t1_playout = time.perf_counter()
             bpg = self.n_trees
             tpb = self.n_playouts
             if self.verbose_debug:
@@ -667,15 +837,16 @@ class MCTSNC:
             MCTSNC._playout_ocp[bpg, tpb](self.dev_trees, self.dev_trees_turns, self.dev_trees_terminals, self.dev_trees_outcomes, 
                                           self.dev_trees_boards, self.dev_trees_extra_infos, 
                                           self.dev_trees_nodes_selected, self.dev_trees_actions_expanded, 
-                                          self.dev_random_generators_playout, self.dev_trees_playout_outcomes)
+                                          self.dev_random_generators_playout, self.dev_trees_playout_outcomes, 
+                                          self.rave, self.dev_trees_playout_amaf)
             cuda.synchronize()
-            t2_playout = time.time()
+            t2_playout = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._playout_ocp() done; time: {t2_playout - t1_playout} s]")
             self.time_playout += t2_playout - t1_playout
             
             # backups
-            t1_backup = time.time()  
+            t1_backup = time.perf_counter()  
             bpg = self.n_trees            
             tpb = self.tpb_b2                     
             if self.verbose_debug:
@@ -684,65 +855,32 @@ class MCTSNC:
                                          self.dev_trees, self.dev_trees_turns, self.dev_trees_ns, self.dev_trees_ns_wins, 
                                          self.dev_trees_nodes_selected, self.dev_trees_selected_paths, self.dev_trees_actions_expanded, self.dev_trees_playout_outcomes)                                
             cuda.synchronize()            
-            t2_backup = time.time()
+            if self.rave:
+                t1_backup_rave = time.perf_counter()
+                bpg = self.n_trees
+                tpb = self.tpb_b1
+                if self.verbose_debug:
+                    print(f"[MCTSNC._backup_rave()...; bpg: {bpg}, tpb: {tpb}]")
+                MCTSNC._backup_rave[bpg, tpb](self.n_playouts, False, 
+                                              self.dev_trees, self.dev_trees_turns, self.dev_trees_selected_paths, self.dev_trees_actions_expanded, self.dev_trees_playout_outcomes, 
+                                              self.dev_trees_playout_amaf, self.dev_trees_amaf_ns, self.dev_trees_amaf_ns_wins)
+                cuda.synchronize()
+                t2_backup_rave = time.perf_counter()
+                if self.verbose_debug:
+                    print(f"[MCTSNC._backup_rave() done; time: {t2_backup_rave - t1_backup_rave} s]")
+            t2_backup = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._backup() done; time: {t2_backup - t1_backup} s]")
             self.time_backup += t2_backup - t1_backup                                        
+            if self.tracer is not None:
+                self._trace_step(t1_select, t2_select, t1_expand, t2_expand, t1_playout, t2_playout, t1_backup, t2_backup, int(np.sum(trees_actions_expanded[:, -1])))
             self.steps += 1
-        self.time_loop = time.time() - t1_loop
-            
-        # sum reduction over trees for each root action        
-        t1_reduce_over_trees = time.time()
-        root_actions_expanded = np.empty_like(self.dev_root_actions_expanded)
-        self.dev_root_actions_expanded.copy_to_host(ary=root_actions_expanded)
-        n_root_actions = int(root_actions_expanded[-1]) 
-        bpg = n_root_actions
-        tpb = self.tpb_rot
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_trees_thrifty()...; bpg: {bpg}, tpb: {tpb}]")
-        MCTSNC._reduce_over_trees_thrifty[bpg, tpb](self.dev_trees, self.dev_trees_terminals, self.dev_trees_outcomes,
-                                                    self.dev_trees_ns, self.dev_trees_ns_wins, 
-                                                    self.dev_root_actions_expanded, root_turn,
-                                                    self.dev_root_ns, self.dev_actions_win_flags, self.dev_actions_ns, self.dev_actions_ns_wins)
-        cuda.synchronize()
-        t2_reduce_over_trees = time.time()
-        self.time_reduce_over_trees = t2_reduce_over_trees - t1_reduce_over_trees
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_trees_thrifty() done; time: {self.time_reduce_over_trees} s]")
-            
-        # max-argmax reduction over root actions
-        t1_reduce_over_actions = time.time() 
-        bpg = 1
-        tpb = self.tpb_roa
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_actions_thrifty()...; bpg: {bpg}, tpb: {tpb}]")                                                
-        MCTSNC._reduce_over_actions_thrifty[bpg, tpb](n_root_actions, 
-                                                      self.dev_actions_win_flags, self.dev_actions_ns, self.dev_actions_ns_wins, 
-                                                      self.dev_best_action, self.dev_best_win_flag, self.dev_best_n, self.dev_best_n_wins)
-        self.best_action = self.dev_best_action.copy_to_host()[0]
-        self.best_win_flag = self.dev_best_win_flag.copy_to_host()[0]                
-        self.best_n = self.dev_best_n.copy_to_host()[0]
-        self.best_n_wins = self.dev_best_n_wins.copy_to_host()[0]
-        self.best_q = self.best_n_wins / self.best_n if self.best_n > 0 else np.nan        
-        cuda.synchronize()
-        self.best_action = root_actions_expanded[self.best_action]
-        t2_reduce_over_actions = time.time()
-        self.time_reduce_over_actions = t2_reduce_over_actions - t1_reduce_over_actions 
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_actions_thrifty() done; time: {self.time_reduce_over_actions} s]")                
-        t2 = time.time()
-        self.time_total = t2 - t1
-        
-        if self.verbose_info:
-            print(f"[actions info:\n{dict_to_str(self._make_actions_info_thrifty())}]")
-            print(f"[performance info:\n{dict_to_str(self._make_performance_info())}]")
-                         
-    def _run_ocp_prodigal(self, root_board, root_extra_info, root_turn, forced_search_steps_limit=np.inf):
-        """Runs computations for algorithmic variant: ``"ocp_prodigal"``."""
-        t1 = time.time()
-        
+            yield # step done
+
+    def _search_ocp_prodigal(self, root_board, root_extra_info, root_turn):
+        """Generator of computations for algorithmic variant: ``"ocp_prodigal"`` - resets trees and then carries out consecutive steps, yielding after the reset and after each step."""
         # reset
-        t1_reset = time.time()
+        t1_reset = time.perf_counter()
         bpg = self.n_trees
         tpb = self.tpb_r
         dev_root_board = cuda.to_device(root_board)
@@ -755,7 +893,7 @@ class MCTSNC:
                                 self.dev_trees, self.dev_trees_sizes, self.dev_trees_depths, self.dev_trees_turns, self.dev_trees_leaves, self.dev_trees_terminals, self.dev_trees_ns, self.dev_trees_ns_wins, 
                                 self.dev_trees_boards, self.dev_trees_extra_infos)
         cuda.synchronize()    
-        t2_reset = time.time()
+        t2_reset = time.perf_counter()
         if self.verbose_debug:
             print(f"[MCTSNC._reset() done; time: {t2_reset - t1_reset} s]")
             
@@ -765,35 +903,35 @@ class MCTSNC:
         self.time_backup = 0.0    
         self.steps = 0
         
-        t1_loop = time.time()
+        self._t1_loop = time.perf_counter()
+        yield # trees reset
         while True:
-            t2_loop = time.time()
-            if forced_search_steps_limit < np.inf: 
-                if self.steps >= forced_search_steps_limit:
-                    break                        
-            elif self.steps >= self.search_steps_limit or t2_loop - t1_loop >= self.search_time_limit:
-                break
             if self.verbose_debug:
-                print(f"[step: {self.steps + 1} starting, time used so far: {t2_loop - t1_loop} s]")     
+                print(f"[step: {self.steps + 1} starting, time used so far: {time.perf_counter() - self._t1_loop} s]")
             
             # selections
-            t1_select = time.time()
+            t1_select = time.perf_counter()
             bpg = self.n_trees
             tpb = self.tpb_s
             if self.verbose_debug:
                 print(f"[MCTSNC._select()...; bpg: {bpg}, tpb: {tpb}]")
-            MCTSNC._select[bpg, tpb](self.ucb_c, 
-                                     self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, 
-                                     self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
+            if self.rave:
+                MCTSNC._select_rave[bpg, tpb](self.ucb_c, self.rave_k, 
+                                              self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, self.dev_trees_amaf_ns, self.dev_trees_amaf_ns_wins, 
+                                              self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
+            else:
+                MCTSNC._select[bpg, tpb](self.ucb_c, 
+                                         self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, 
+                                         self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
             cuda.synchronize()
-            t2_select = time.time()
+            t2_select = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._select() done; time: {t2_select - t1_select} s]")
             self.time_select += t2_select - t1_select
             
             # expansions             
-            t1_expand = time.time()
-            t1_expand_1 = time.time()
+            t1_expand = time.perf_counter()
+            t1_expand_1 = time.perf_counter()
             bpg = self.n_trees
             tpb = self.tpb_e1
             if self.verbose_debug:
@@ -806,10 +944,10 @@ class MCTSNC:
             if self.steps == 0:                
                 MCTSNC._memorize_root_actions_expanded[1, self.state_max_actions + 2](self.dev_trees_actions_expanded, self.dev_root_actions_expanded)
                 cuda.synchronize()
-            t2_expand_1 = time.time()            
+            t2_expand_1 = time.perf_counter()            
             if self.verbose_debug:
                 print(f"[MCTSNC._expand_1_ocp_progial() done; time: {t2_expand_1 - t1_expand_1} s]")
-            t1_expand_2 = time.time()            
+            t1_expand_2 = time.perf_counter()            
             bpg = (self.n_trees, self.state_max_actions) # prodigal number of blocks
             tpb = self.tpb_e2
             if self.verbose_debug:
@@ -818,14 +956,14 @@ class MCTSNC:
                                                 self.dev_trees_boards, self.dev_trees_extra_infos,                                               
                                                 self.dev_trees_nodes_selected, self.dev_trees_actions_expanded)
             cuda.synchronize()
-            t2_expand_2 = time.time()
+            t2_expand_2 = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._expand_2_prodigal() done; time: {t2_expand_2 - t1_expand_2} s]")
-            t2_expand = time.time()
+            t2_expand = time.perf_counter()
             self.time_expand += t2_expand - t1_expand
             
             # playouts
-            t1_playout = time.time()
+            t1_playout = time.perf_counter()
             bpg = self.n_trees 
             tpb = self.n_playouts
             if self.verbose_debug:
@@ -833,15 +971,16 @@ class MCTSNC:
             MCTSNC._playout_ocp[bpg, tpb](self.dev_trees, self.dev_trees_turns, self.dev_trees_terminals, self.dev_trees_outcomes, 
                                             self.dev_trees_boards, self.dev_trees_extra_infos, 
                                             self.dev_trees_nodes_selected, self.dev_trees_actions_expanded, 
-                                            self.dev_random_generators_playout, self.dev_trees_playout_outcomes)
+                                            self.dev_random_generators_playout, self.dev_trees_playout_outcomes, 
+                                            self.rave, self.dev_trees_playout_amaf)
             cuda.synchronize()
-            t2_playout = time.time()
+            t2_playout = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._playout_ocp() done; time: {t2_playout - t1_playout} s]")
             self.time_playout += t2_playout - t1_playout
             
             # backups
-            t1_backup = time.time()
+            t1_backup = time.perf_counter()
             bpg = self.n_trees            
             tpb = self.tpb_b2                     
             if self.verbose_debug:
@@ -850,60 +989,32 @@ class MCTSNC:
                                          self.dev_trees, self.dev_trees_turns, self.dev_trees_ns, self.dev_trees_ns_wins, 
                                          self.dev_trees_nodes_selected, self.dev_trees_selected_paths, self.dev_trees_actions_expanded, self.dev_trees_playout_outcomes)                                
             cuda.synchronize()            
-            t2_backup = time.time()
+            if self.rave:
+                t1_backup_rave = time.perf_counter()
+                bpg = self.n_trees
+                tpb = self.tpb_b1
+                if self.verbose_debug:
+                    print(f"[MCTSNC._backup_rave()...; bpg: {bpg}, tpb: {tpb}]")
+                MCTSNC._backup_rave[bpg, tpb](self.n_playouts, False, 
+                                              self.dev_trees, self.dev_trees_turns, self.dev_trees_selected_paths, self.dev_trees_actions_expanded, self.dev_trees_playout_outcomes, 
+                                              self.dev_trees_playout_amaf, self.dev_trees_amaf_ns, self.dev_trees_amaf_ns_wins)
+                cuda.synchronize()
+                t2_backup_rave = time.perf_counter()
+                if self.verbose_debug:
+                    print(f"[MCTSNC._backup_rave() done; time: {t2_backup_rave - t1_backup_rave} s]")
+            t2_backup = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._backup() done; time: {t2_backup - t1_backup} s]")
             self.time_backup += t2_backup - t1_backup                                        
+            if self.tracer is not None:
+                self._trace_step(t1_select, t2_select, t1_expand, t2_expand, t1_playout, t2_playout, t1_backup, t2_backup, -1)
             self.steps += 1
-        self.time_loop = time.time() - t1_loop
-            
-        # sum reduction over trees for each root action        
-        t1_reduce_over_trees = time.time() 
-        bpg = self.state_max_actions
-        tpb = self.tpb_rot
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_trees_prodigal()...; bpg: {bpg}, tpb: {tpb}]")
-        MCTSNC._reduce_over_trees_prodigal[bpg, tpb](self.dev_trees, self.dev_trees_terminals, self.dev_trees_outcomes,
-                                                     self.dev_trees_ns, self.dev_trees_ns_wins, 
-                                                     self.dev_root_actions_expanded, root_turn,
-                                                     self.dev_root_ns, self.dev_actions_win_flags, self.dev_actions_ns, self.dev_actions_ns_wins)
-        cuda.synchronize()
-        t2_reduce_over_trees = time.time()
-        self.time_reduce_over_trees = t2_reduce_over_trees - t1_reduce_over_trees
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_trees_prodigal() done; time: {self.time_reduce_over_trees} s]")
-            
-        # max-argmax reduction over root actions
-        t1_reduce_over_actions = time.time() 
-        bpg = 1
-        tpb = self.tpb_roa
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_actions_prodigal()...; bpg: {bpg}, tpb: {tpb}]")                                                
-        MCTSNC._reduce_over_actions_prodigal[bpg, tpb](self.dev_actions_win_flags, self.dev_actions_ns, self.dev_actions_ns_wins, 
-                                                       self.dev_best_action, self.dev_best_win_flag, self.dev_best_n, self.dev_best_n_wins)        
-        self.best_action = self.dev_best_action.copy_to_host()[0]
-        self.best_win_flag = self.dev_best_win_flag.copy_to_host()[0]                
-        self.best_n = self.dev_best_n.copy_to_host()[0]
-        self.best_n_wins = self.dev_best_n_wins.copy_to_host()[0]
-        self.best_q = self.best_n_wins / self.best_n if self.best_n > 0 else np.nan        
-        cuda.synchronize()
-        t2_reduce_over_actions = time.time()
-        self.time_reduce_over_actions = t2_reduce_over_actions - t1_reduce_over_actions 
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_actions_prodigal() done; time: {self.time_reduce_over_actions} s]")                
-        t2 = time.time()
-        self.time_total = t2 - t1
-        
-        if self.verbose_info:
-            print(f"[actions info:\n{dict_to_str(self._make_actions_info_prodigal())}]")
-            print(f"[performance info:\n{dict_to_str(self._make_performance_info())}]")
-                                                  
-    def _run_acp_thrifty(self, root_board, root_extra_info, root_turn, forced_search_steps_limit=np.inf):
-        """Runs computations for algorithmic variant: ``"acp_thrifty"``."""
-        t1 = time.time()
-        
+            yield # step done
+
+    def _search_acp_thrifty(self, root_board, root_extra_info, root_turn):
+        """Generator of computations for algorithmic variant: ``"acp_thrifty"`` - resets trees and then carries out consecutive steps, yielding after the reset and after each step."""
         # reset
-        t1_reset = time.time()
+        t1_reset = time.perf_counter()
         bpg = self.n_trees
         tpb = self.tpb_r
         dev_root_board = cuda.to_device(root_board)
@@ -916,7 +1027,7 @@ class MCTSNC:
                                 self.dev_trees, self.dev_trees_sizes, self.dev_trees_depths, self.dev_trees_turns, self.dev_trees_leaves, self.dev_trees_terminals, self.dev_trees_ns, self.dev_trees_ns_wins, 
                                 self.dev_trees_boards, self.dev_trees_extra_infos)
         cuda.synchronize()    
-        t2_reset = time.time()
+        t2_reset = time.perf_counter()
         if self.verbose_debug:
             print(f"[MCTSNC._reset() done; time: {t2_reset - t1_reset} s]")
             
@@ -927,35 +1038,35 @@ class MCTSNC:
         self.steps = 0        
         trees_actions_expanded = np.empty((self.n_trees, self.state_max_actions + 2), dtype=np.int16)
         
-        t1_loop = time.time()
+        self._t1_loop = time.perf_counter()
+        yield # trees reset
         while True:
-            t2_loop = time.time()
-            if forced_search_steps_limit < np.inf: 
-                if self.steps >= forced_search_steps_limit:
-                    break            
-            elif self.steps >= self.search_steps_limit or t2_loop - t1_loop >= self.search_time_limit:
-                break
             if self.verbose_debug:
-                print(f"[step: {self.steps + 1} starting, time used so far: {t2_loop - t1_loop} s]")     
+                print(f"[step: {self.steps + 1} starting, time used so far: {time.perf_counter() - self._t1_loop} s]")
             
             # selections
-            t1_select = time.time()
+            t1_select = time.perf_counter()
             bpg = self.n_trees
             tpb = self.tpb_s
             if self.verbose_debug:
                 print(f"[MCTSNC._select()...; bpg: {bpg}, tpb: {tpb}]")
-            MCTSNC._select[bpg, tpb](self.ucb_c, 
-                                     self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, 
-                                     self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
+            if self.rave:
+                MCTSNC._select_rave[bpg, tpb](self.ucb_c, self.rave_k, 
+                                              self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, self.dev_trees_amaf_ns, self.dev_trees_amaf_ns_wins, 
+                                              self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
+            else:
+                MCTSNC._select[bpg, tpb](self.ucb_c, 
+                                         self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, 
+                                         self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
             cuda.synchronize()
-            t2_select = time.time()
+            t2_select = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._select() done; time: {t2_select - t1_select} s]")
             self.time_select += t2_select - t1_select
                                         
             # expansions
-            t1_expand = time.time()           
-            t1_expand_1 = time.time()
+            t1_expand = time.perf_counter()           
+            t1_expand_1 = time.perf_counter()
             bpg = self.n_trees
             tpb = self.tpb_e1
             if self.verbose_debug:
@@ -969,10 +1080,10 @@ class MCTSNC:
             if self.steps == 0:            
                 MCTSNC._memorize_root_actions_expanded[1, self.state_max_actions + 2](self.dev_trees_actions_expanded, self.dev_root_actions_expanded)                            
                 cuda.synchronize()
-            t2_expand_1 = time.time()
+            t2_expand_1 = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._expand_1_acp_thrifty() done; time: {t2_expand_1 - t1_expand_1} s]")
-            t1_expand_2 = time.time()            
+            t1_expand_2 = time.perf_counter()            
             trees_actions_expanded_flat = self._flatten_trees_actions_expanded_thrifty(trees_actions_expanded)
             bpg = trees_actions_expanded_flat.shape[0] # thrifty number of blocks                                
             tpb = self.tpb_e2
@@ -983,14 +1094,14 @@ class MCTSNC:
                                                self.dev_trees_boards, self.dev_trees_extra_infos,                                               
                                                self.dev_trees_nodes_selected, dev_trees_actions_expanded_flat)
             cuda.synchronize()
-            t2_expand_2 = time.time()
+            t2_expand_2 = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._expand_2_thrifty() done; time: {t2_expand_2 - t1_expand_2} s]")
-            t2_expand = time.time()
+            t2_expand = time.perf_counter()
             self.time_expand += t2_expand - t1_expand
             
             # playouts
-            t1_playout = time.time()
+            t1_playout = time.perf_counter()
             bpg = trees_actions_expanded_flat.shape[0] # thrifty number of blocks
             tpb = self.n_playouts
             if self.verbose_debug:
@@ -998,16 +1109,17 @@ class MCTSNC:
             MCTSNC._playout_acp_thrifty[bpg, tpb](self.dev_trees, self.dev_trees_turns, self.dev_trees_terminals, self.dev_trees_outcomes, 
                                                   self.dev_trees_boards, self.dev_trees_extra_infos, 
                                                   self.dev_trees_nodes_selected, self.dev_trees_actions_expanded, dev_trees_actions_expanded_flat,
-                                                  self.dev_random_generators_playout, self.dev_trees_playout_outcomes, self.dev_trees_playout_outcomes_children)
+                                                  self.dev_random_generators_playout, self.dev_trees_playout_outcomes, self.dev_trees_playout_outcomes_children, 
+                                                  self.rave, self.dev_trees_playout_amaf)
             cuda.synchronize()
-            t2_playout = time.time()
+            t2_playout = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._playout_acp_thrifty() done; time: {t2_playout - t1_playout} s]")
             self.time_playout += t2_playout - t1_playout
             
             # backups
-            t1_backup = time.time()
-            t1_backup_1 = time.time()
+            t1_backup = time.perf_counter()
+            t1_backup_1 = time.perf_counter()
             bpg = self.n_trees
             tpb = self.tpb_b1                     
             if self.verbose_debug:
@@ -1016,10 +1128,10 @@ class MCTSNC:
                                                    self.dev_trees, self.dev_trees_turns, self.dev_trees_ns, self.dev_trees_ns_wins, 
                                                    self.dev_trees_nodes_selected, self.dev_trees_actions_expanded, self.dev_trees_playout_outcomes, self.dev_trees_playout_outcomes_children)
             cuda.synchronize()            
-            t2_backup_1 = time.time()            
+            t2_backup_1 = time.perf_counter()            
             if self.verbose_debug:
                 print(f"[MCTSNC._backup_1_acp_thrifty() done; time: {t2_backup_1 - t1_backup_1} s]")            
-            t1_backup_2 = time.time()
+            t1_backup_2 = time.perf_counter()
             bpg = self.n_trees
             tpb = self.tpb_b2            
             if self.verbose_debug:
@@ -1029,66 +1141,33 @@ class MCTSNC:
                                            self.dev_trees_selected_paths, self.dev_trees_actions_expanded, 
                                            self.dev_trees_playout_outcomes)
             cuda.synchronize()                                    
-            t2_backup_2 = time.time()        
+            t2_backup_2 = time.perf_counter()        
             if self.verbose_debug:
                 print(f"[MCTSNC._backup_2_acp() done; time: {t2_backup_2 - t1_backup_2} s]")
-            t2_backup = time.time()
+            if self.rave:
+                t1_backup_rave = time.perf_counter()
+                bpg = self.n_trees
+                tpb = self.tpb_b1
+                if self.verbose_debug:
+                    print(f"[MCTSNC._backup_rave()...; bpg: {bpg}, tpb: {tpb}]")
+                MCTSNC._backup_rave[bpg, tpb](self.n_playouts, True, 
+                                              self.dev_trees, self.dev_trees_turns, self.dev_trees_selected_paths, self.dev_trees_actions_expanded, self.dev_trees_playout_outcomes, 
+                                              self.dev_trees_playout_amaf, self.dev_trees_amaf_ns, self.dev_trees_amaf_ns_wins)
+                cuda.synchronize()
+                t2_backup_rave = time.perf_counter()
+                if self.verbose_debug:
+                    print(f"[MCTSNC._backup_rave() done; time: {t2_backup_rave - t1_backup_rave} s]")
+            t2_backup = time.perf_counter()
             self.time_backup += t2_backup - t1_backup
+            if self.tracer is not None:
+                self._trace_step(t1_select, t2_select, t1_expand, t2_expand, t1_playout, t2_playout, t1_backup, t2_backup, int(np.sum(trees_actions_expanded[:, -1])))
             self.steps += 1
-        self.time_loop = time.time() - t1_loop
-                    
-        # sum reduction over trees for each root action        
-        t1_reduce_over_trees = time.time()
-        root_actions_expanded = np.empty_like(self.dev_root_actions_expanded)
-        self.dev_root_actions_expanded.copy_to_host(ary=root_actions_expanded)
-        n_root_actions = int(root_actions_expanded[-1])  
-        bpg = n_root_actions
-        tpb = self.tpb_rot
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_trees_thrifty()...; bpg: {bpg}, tpb: {tpb}]")
-        MCTSNC._reduce_over_trees_thrifty[bpg, tpb](self.dev_trees, self.dev_trees_terminals, self.dev_trees_outcomes,
-                                                    self.dev_trees_ns, self.dev_trees_ns_wins, 
-                                                    self.dev_root_actions_expanded, root_turn,
-                                                    self.dev_root_ns, self.dev_actions_win_flags, self.dev_actions_ns, self.dev_actions_ns_wins)
-        cuda.synchronize()
-        t2_reduce_over_trees = time.time()
-        self.time_reduce_over_trees = t2_reduce_over_trees - t1_reduce_over_trees
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_trees_thrifty() done; time: {self.time_reduce_over_trees} s]")
-            
-        # max-argmax reduction over root actions
-        t1_reduce_over_actions = time.time() 
-        bpg = 1
-        tpb = self.tpb_roa
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_actions_thrifty()...; bpg: {bpg}, tpb: {tpb}]")                                                
-        MCTSNC._reduce_over_actions_thrifty[bpg, tpb](n_root_actions, 
-                                                      self.dev_actions_win_flags, self.dev_actions_ns, self.dev_actions_ns_wins, 
-                                                      self.dev_best_action, self.dev_best_win_flag, self.dev_best_n, self.dev_best_n_wins)        
-        self.best_action = self.dev_best_action.copy_to_host()[0]
-        self.best_win_flag = self.dev_best_win_flag.copy_to_host()[0]                
-        self.best_n = self.dev_best_n.copy_to_host()[0]
-        self.best_n_wins = self.dev_best_n_wins.copy_to_host()[0]
-        self.best_q = self.best_n_wins / self.best_n if self.best_n > 0 else np.nan        
-        cuda.synchronize()
-        self.best_action = root_actions_expanded[self.best_action]
-        t2_reduce_over_actions = time.time()
-        self.time_reduce_over_actions = t2_reduce_over_actions - t1_reduce_over_actions 
-        if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_actions_thrifty() done; time: {self.time_reduce_over_actions} s]")                
-        t2 = time.time()
-        self.time_total = t2 - t1
-        
-        if self.verbose_info:
-            print(f"[actions info:\n{dict_to_str(self._make_actions_info_thrifty())}]")
-            print(f"[performance info:\n{dict_to_str(self._make_performance_info())}]")
-            
-    def _run_acp_prodigal(self, root_board, root_extra_info, root_turn, forced_search_steps_limit=np.inf):
-        """Runs computations for algorithmic variant: ``"acp_prodigal"``."""
-        t1 = time.time()    
-        
+            yield # step done
+
+    def _search_acp_prodigal(self, root_board, root_extra_info, root_turn):
+        """Generator of computations for algorithmic variant: ``"acp_prodigal"`` - resets trees and then carries out consecutive steps, yielding after the reset and after each step."""
         # reset
-        t1_reset = time.time()
+        t1_reset = time.perf_counter()
         bpg = self.n_trees
         tpb = self.tpb_r
         dev_root_board = cuda.to_device(root_board)
@@ -1101,7 +1180,7 @@ class MCTSNC:
                                 self.dev_trees, self.dev_trees_sizes, self.dev_trees_depths, self.dev_trees_turns, self.dev_trees_leaves, self.dev_trees_terminals, self.dev_trees_ns, self.dev_trees_ns_wins, 
                                 self.dev_trees_boards, self.dev_trees_extra_infos)
         cuda.synchronize()    
-        t2_reset = time.time()
+        t2_reset = time.perf_counter()
         if self.verbose_debug:
             print(f"[MCTSNC._reset() done; time: {t2_reset - t1_reset} s]")
         
@@ -1111,35 +1190,35 @@ class MCTSNC:
         self.time_backup = 0.0
         self.steps = 0
         
-        t1_loop = time.time()
+        self._t1_loop = time.perf_counter()
+        yield # trees reset
         while True:
-            t2_loop = time.time()
-            if forced_search_steps_limit < np.inf: 
-                if self.steps >= forced_search_steps_limit:
-                    break            
-            elif self.steps >= self.search_steps_limit or t2_loop - t1_loop >= self.search_time_limit:
-                break
             if self.verbose_debug:
-                print(f"[step: {self.steps + 1} starting, time used so far: {t2_loop - t1_loop} s]")     
+                print(f"[step: {self.steps + 1} starting, time used so far: {time.perf_counter() - self._t1_loop} s]")
         
             # selections
-            t1_select = time.time()
+            t1_select = time.perf_counter()
             bpg = self.n_trees
             tpb = self.tpb_s
             if self.verbose_debug:
                 print(f"[MCTSNC._select()...; bpg: {bpg}, tpb: {tpb}]")
-            MCTSNC._select[bpg, tpb](self.ucb_c, 
-                                     self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, 
-                                     self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
+            if self.rave:
+                MCTSNC._select_rave[bpg, tpb](self.ucb_c, self.rave_k, 
+                                              self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, self.dev_trees_amaf_ns, self.dev_trees_amaf_ns_wins, 
+                                              self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
+            else:
+                MCTSNC._select[bpg, tpb](self.ucb_c, 
+                                         self.dev_trees, self.dev_trees_leaves, self.dev_trees_ns, self.dev_trees_ns_wins, 
+                                         self.dev_trees_nodes_selected, self.dev_trees_selected_paths)
             cuda.synchronize()                     
-            t2_select = time.time()
+            t2_select = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._select() done; time: {t2_select - t1_select} s]")
             self.time_select += t2_select - t1_select                                    
             
             # expansions
-            t1_expand = time.time()                        
-            t1_expand_1 = time.time()
+            t1_expand = time.perf_counter()                        
+            t1_expand_1 = time.perf_counter()
             bpg = self.n_trees
             tpb = self.tpb_e1
             if self.verbose_debug:
@@ -1152,10 +1231,10 @@ class MCTSNC:
             if self.steps == 0:                
                 MCTSNC._memorize_root_actions_expanded[1, self.state_max_actions + 2](self.dev_trees_actions_expanded, self.dev_root_actions_expanded)                            
                 cuda.synchronize()
-            t2_expand_1 = time.time()
+            t2_expand_1 = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._expand_1_acp_prodigal() done; time: {t2_expand_1 - t1_expand_1} s]")                                
-            t1_expand_2 = time.time()
+            t1_expand_2 = time.perf_counter()
             bpg = (self.n_trees, self.state_max_actions) # prodigal number of blocks    
             tpb = self.tpb_e2 
             if self.verbose_debug:
@@ -1164,14 +1243,14 @@ class MCTSNC:
                                                 self.dev_trees_boards, self.dev_trees_extra_infos,                                               
                                                 self.dev_trees_nodes_selected, self.dev_trees_actions_expanded)
             cuda.synchronize()            
-            t2_expand_2 = time.time()
+            t2_expand_2 = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._expand_2_prodigal() done; time: {t2_expand_2 - t1_expand_2} s]")
-            t2_expand = time.time()
+            t2_expand = time.perf_counter()
             self.time_expand += t2_expand - t1_expand
                         
             # playouts
-            t1_playout = time.time()
+            t1_playout = time.perf_counter()
             bpg = (self.n_trees, self.state_max_actions) # prodigal number of blocks
             tpb = self.n_playouts
             if self.verbose_debug:
@@ -1179,16 +1258,17 @@ class MCTSNC:
             MCTSNC._playout_acp_prodigal[bpg, tpb](self.dev_trees, self.dev_trees_turns, self.dev_trees_terminals, self.dev_trees_outcomes, 
                                                    self.dev_trees_boards, self.dev_trees_extra_infos, 
                                                    self.dev_trees_nodes_selected, self.dev_trees_actions_expanded, 
-                                                   self.dev_random_generators_playout, self.dev_trees_playout_outcomes, self.dev_trees_playout_outcomes_children)
+                                                   self.dev_random_generators_playout, self.dev_trees_playout_outcomes, self.dev_trees_playout_outcomes_children, 
+                                                   self.rave, self.dev_trees_playout_amaf)
             cuda.synchronize()
-            t2_playout = time.time()
+            t2_playout = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._playout_acp_prodigal() done; time: {t2_playout - t1_playout} s]")
             self.time_playout += t2_playout - t1_playout
             
             # backups
-            t1_backup = time.time()
-            t1_backup_1 = time.time()
+            t1_backup = time.perf_counter()
+            t1_backup_1 = time.perf_counter()
             bpg = self.n_trees
             tpb = self.tpb_b1                    
             if self.verbose_debug:
@@ -1198,10 +1278,10 @@ class MCTSNC:
                                                     self.dev_trees_nodes_selected, self.dev_trees_actions_expanded, 
                                                     self.dev_trees_playout_outcomes, self.dev_trees_playout_outcomes_children)
             cuda.synchronize()            
-            t2_backup_1 = time.time()
+            t2_backup_1 = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._backup_1_acp_prodigal() done; time: {t2_backup_1 - t1_backup_1} s]")            
-            t1_backup_2 = time.time()
+            t1_backup_2 = time.perf_counter()
             bpg = self.n_trees            
             tpb = self.tpb_b2              
             if self.verbose_debug:
@@ -1211,55 +1291,108 @@ class MCTSNC:
                                            self.dev_trees_selected_paths, self.dev_trees_actions_expanded, 
                                            self.dev_trees_playout_outcomes)
             cuda.synchronize()                                    
-            t2_backup_2 = time.time()
+            t2_backup_2 = time.perf_counter()
             if self.verbose_debug:
                 print(f"[MCTSNC._backup_2_acp() done; time: {t2_backup_2 - t1_backup_2} s]")
-            t2_backup = time.time()
+            if self.rave:
+                t1_backup_rave = time.perf_counter()
+                bpg = self.n_trees
+                tpb = self.tpb_b1
+                if self.verbose_debug:
+                    print(f"[MCTSNC._backup_rave()...; bpg: {bpg}, tpb: {tpb}]")
+                MCTSNC._backup_rave[bpg, tpb](self.n_playouts, True, 
+                                              self.dev_trees, self.dev_trees_turns, self.dev_trees_selected_paths, self.dev_trees_actions_expanded, self.dev_trees_playout_outcomes, 
+                                              self.dev_trees_playout_amaf, self.dev_trees_amaf_ns, self.dev_trees_amaf_ns_wins)
+                cuda.synchronize()
+                t2_backup_rave = time.perf_counter()
+                if self.verbose_debug:
+                    print(f"[MCTSNC._backup_rave() done; time: {t2_backup_rave - t1_backup_rave} s]")
+            t2_backup = time.perf_counter()
             self.time_backup += t2_backup - t1_backup
                                                     
+            if self.tracer is not None:
+                self._trace_step(t1_select, t2_select, t1_expand, t2_expand, t1_playout, t2_playout, t1_backup, t2_backup, -1)
             self.steps += 1
-        self.time_loop = time.time() - t1_loop
-                                                        
-        # sum reduction over trees
-        t1_reduce_over_trees = time.time()
+            yield # step done
+
+    def _reduce_thrifty(self):
+        """Performs reductions (using thrifty indexing) - sum reduction over trees for each root action and max-argmax reduction over root actions - and sets the best action found so far (without altering trees)."""
+        # sum reduction over trees for each root action        
+        t1_reduce_over_trees = time.perf_counter()
+        root_actions_expanded = np.empty_like(self.dev_root_actions_expanded)
+        self.dev_root_actions_expanded.copy_to_host(ary=root_actions_expanded)
+        n_root_actions = int(root_actions_expanded[-1]) 
+        bpg = n_root_actions
+        tpb = self.tpb_rot
+        if self.verbose_debug:
+            print(f"[MCTSNC._reduce_over_trees_thrifty()...; bpg: {bpg}, tpb: {tpb}]")
+        MCTSNC._reduce_over_trees_thrifty[bpg, tpb](self.dev_trees, self.dev_trees_terminals, self.dev_trees_outcomes,
+                                                    self.dev_trees_ns, self.dev_trees_ns_wins, 
+                                                    self.dev_root_actions_expanded, self.root_turn,
+                                                    self.dev_root_ns, self.dev_actions_win_flags, self.dev_actions_ns, self.dev_actions_ns_wins)
+        cuda.synchronize()
+        t2_reduce_over_trees = time.perf_counter()
+        self.time_reduce_over_trees = t2_reduce_over_trees - t1_reduce_over_trees
+        if self.verbose_debug:
+            print(f"[MCTSNC._reduce_over_trees_thrifty() done; time: {self.time_reduce_over_trees} s]")
+            
+        # max-argmax reduction over root actions
+        t1_reduce_over_actions = time.perf_counter() 
+        bpg = 1
+        tpb = self.tpb_roa
+        if self.verbose_debug:
+            print(f"[MCTSNC._reduce_over_actions_thrifty()...; bpg: {bpg}, tpb: {tpb}]")                                                
+        MCTSNC._reduce_over_actions_thrifty[bpg, tpb](n_root_actions, 
+                                                      self.dev_actions_win_flags, self.dev_actions_ns, self.dev_actions_ns_wins, 
+                                                      self.dev_best_action, self.dev_best_win_flag, self.dev_best_n, self.dev_best_n_wins)
+        self.best_action = self.dev_best_action.copy_to_host()[0]
+        self.best_win_flag = self.dev_best_win_flag.copy_to_host()[0]                
+        self.best_n = self.dev_best_n.copy_to_host()[0]
+        self.best_n_wins = self.dev_best_n_wins.copy_to_host()[0]
+        self.best_q = self.best_n_wins / self.best_n if self.best_n > 0 else np.nan        
+        cuda.synchronize()
+        self.best_action = root_actions_expanded[self.best_action]
+        t2_reduce_over_actions = time.perf_counter()
+        self.time_reduce_over_actions = t2_reduce_over_actions - t1_reduce_over_actions 
+        if self.verbose_debug:
+            print(f"[MCTSNC._reduce_over_actions_thrifty() done; time: {self.time_reduce_over_actions} s]")
+
+    def _reduce_prodigal(self):
+        """Performs reductions (using prodigal indexing) - sum reduction over trees for each root action and max-argmax reduction over root actions - and sets the best action found so far (without altering trees)."""
+        # sum reduction over trees for each root action        
+        t1_reduce_over_trees = time.perf_counter() 
         bpg = self.state_max_actions
         tpb = self.tpb_rot
         if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_trees_prodigal()...; bpg: {bpg}, tpb: {tpb}]")            
-        MCTSNC._reduce_over_trees_prodigal[bpg, tpb](self.dev_trees, self.dev_trees_terminals, self.dev_trees_outcomes, 
+            print(f"[MCTSNC._reduce_over_trees_prodigal()...; bpg: {bpg}, tpb: {tpb}]")
+        MCTSNC._reduce_over_trees_prodigal[bpg, tpb](self.dev_trees, self.dev_trees_terminals, self.dev_trees_outcomes,
                                                      self.dev_trees_ns, self.dev_trees_ns_wins, 
-                                                     self.dev_root_actions_expanded, root_turn, 
+                                                     self.dev_root_actions_expanded, self.root_turn,
                                                      self.dev_root_ns, self.dev_actions_win_flags, self.dev_actions_ns, self.dev_actions_ns_wins)
         cuda.synchronize()
-        t2_reduce_over_trees = time.time()
+        t2_reduce_over_trees = time.perf_counter()
         self.time_reduce_over_trees = t2_reduce_over_trees - t1_reduce_over_trees
         if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_trees_prodigal() done; time: {self.time_reduce_over_trees} s]")                
-                    
+            print(f"[MCTSNC._reduce_over_trees_prodigal() done; time: {self.time_reduce_over_trees} s]")
+            
         # max-argmax reduction over root actions
-        t1_reduce_over_actions = time.time() 
+        t1_reduce_over_actions = time.perf_counter() 
         bpg = 1
         tpb = self.tpb_roa
         if self.verbose_debug:
-            print(f"[MCTSNC._reduce_over_actions_prodigal()...; bpg: {bpg}, tpb: {tpb}]")                                        
+            print(f"[MCTSNC._reduce_over_actions_prodigal()...; bpg: {bpg}, tpb: {tpb}]")                                                
         MCTSNC._reduce_over_actions_prodigal[bpg, tpb](self.dev_actions_win_flags, self.dev_actions_ns, self.dev_actions_ns_wins, 
                                                        self.dev_best_action, self.dev_best_win_flag, self.dev_best_n, self.dev_best_n_wins)        
         self.best_action = self.dev_best_action.copy_to_host()[0]
         self.best_win_flag = self.dev_best_win_flag.copy_to_host()[0]                
         self.best_n = self.dev_best_n.copy_to_host()[0]
         self.best_n_wins = self.dev_best_n_wins.copy_to_host()[0]
-        self.best_q = self.best_n_wins / self.best_n if self.best_n > 0 else np.nan      
+        self.best_q = self.best_n_wins / self.best_n if self.best_n > 0 else np.nan        
         cuda.synchronize()
-        t2_reduce_over_actions = time.time() 
-        self.time_reduce_over_actions = t2_reduce_over_actions - t1_reduce_over_actions                           
+        t2_reduce_over_actions = time.perf_counter()
+        self.time_reduce_over_actions = t2_reduce_over_actions - t1_reduce_over_actions 
         if self.verbose_debug:
             print(f"[MCTSNC._reduce_over_actions_prodigal() done; time: {self.time_reduce_over_actions} s]")
-        t2 = time.time()
-        self.time_total = t2 - t1                            
-                 
-        if self.verbose_info:
-            print(f"[actions info:\n{dict_to_str(self._make_actions_info_prodigal())}]")
-            print(f"[performance info:\n{dict_to_str(self._make_performance_info())}]")                             
 
     @staticmethod
     @cuda.jit(void(int8[:, :], int8[:], int8, int32[:, :, :], int32[:], int16[:, :], int8[:, :], boolean[:, :], boolean[:, :], int32[:, :], int32[:, :], int8[:, :, :, :], int8[:, :, :]))
@@ -1348,6 +1481,65 @@ class MCTSNC:
             trees_nodes_selected[ti] = node
             trees_selected_paths[ti, -1] = path_length      
             
+    @staticmethod
+    @cuda.jit(void(float32, float32, int32[:, :, :], boolean[:, :], int32[:, :], int32[:, :], int32[:, :], int32[:, :], int32[:], int32[:, :]))        
+    def _select_rave(ucb_c, rave_k, trees, trees_leaves, trees_ns, trees_ns_wins, trees_amaf_ns, trees_amaf_ns_wins, trees_nodes_selected, trees_selected_paths):
+        """CUDA kernel responsible for computations of stage: selections (RAVE - action-value estimates blended with AMAF estimates, weight ``sqrt(rave_k / (3 * n + rave_k))`` for AMAF)."""
+        shared_ucbs = cuda.shared.array(512, dtype=float32) # 512 - assumed limit on max actions
+        shared_best_child = cuda.shared.array(512, dtype=int32) # 512 - assumed limit on max actions (array instead of one index due to max-argmax reduction pattern)
+        shared_selected_path = cuda.shared.array(2048 + 2, dtype=int32) # 2048 - assumed equal to MAX_TREE_DEPTH 
+        ti = cuda.blockIdx.x # tree index 
+        tpb = cuda.blockDim.x
+        t = cuda.threadIdx.x
+        state_max_actions = int16(trees.shape[2] - 1)
+        node = int32(0)
+        depth = int16(0)
+        if t == 0:
+            shared_selected_path[0] = int32(0) # path always starting from root
+        while not trees_leaves[ti, node]:
+            if t < state_max_actions:
+                child = trees[ti, node, 1 + t]
+                shared_best_child[t] = child                
+                if child == int32(-1):
+                    shared_ucbs[t] = -float32(inf)
+                else:
+                    child_n = trees_ns[ti, child]             
+                    if child_n == int32(0):
+                        shared_ucbs[t] = float32(inf)
+                    else:                        
+                        q = trees_ns_wins[ti, child] / float32(child_n)
+                        child_amaf_n = trees_amaf_ns[ti, child]
+                        if child_amaf_n > int32(0):
+                            beta = math.sqrt(rave_k / (float32(3.0) * child_n + rave_k))
+                            q = (float32(1.0) - beta) * q + beta * trees_amaf_ns_wins[ti, child] / float32(child_amaf_n)
+                        shared_ucbs[t] = q + ucb_c * math.sqrt(math.log(trees_ns[ti, node]) / child_n)
+            else:
+                shared_ucbs[t] = -float32(inf)
+            cuda.syncthreads()
+            stride = tpb >> 1 # half of tpb
+            while stride > 0: # max-argmax reduction pattern
+                if t < stride:
+                    t_stride = t + stride
+                    if shared_ucbs[t] < shared_ucbs[t_stride]:
+                        shared_ucbs[t] = shared_ucbs[t_stride]
+                        shared_best_child[t] = shared_best_child[t_stride]    
+                cuda.syncthreads()
+                stride >>= 1
+            node = shared_best_child[0]
+            depth += int16(1)
+            if t == 0:
+                shared_selected_path[depth] = node                                            
+        path_length = depth + 1
+        pept = (path_length + tpb - 1) // tpb # path elements per thread
+        e = t
+        for _ in range(pept):
+            if e < path_length:
+                trees_selected_paths[ti, e] = shared_selected_path[e]
+            e += tpb
+        if t == 0:
+            trees_nodes_selected[ti] = node
+            trees_selected_paths[ti, -1] = path_length      
+            
     @staticmethod
     @cuda.jit(void(int32, int32[:, :, :], int32[:], int8[:, :], boolean[:, :], boolean[:, :], int8[:, :, :, :], int8[:, :, :], int32[:], xoroshiro128p_type[:], int16[:, :]))
     def _expand_1_ocp_thrifty(max_tree_size, trees, trees_sizes, trees_turns, trees_leaves, trees_terminals, trees_boards, trees_extra_infos, 
@@ -1790,15 +1982,17 @@ class MCTSNC:
             trees_depths[ti, child] = trees_depths[ti, selected] + 1                                                
                             
     @staticmethod
-    @cuda.jit(void(int32[:, :, :], int8[:, :], boolean[:, :], int8[:, :], int8[:, :, :, :], int8[:, :, :], int32[:], int16[:, :], xoroshiro128p_type[:], int32[:, :]))
-    def _playout_ocp(trees, trees_turns, trees_terminals, trees_outcomes, trees_boards, trees_extra_infos, trees_nodes_selected, trees_actions_expanded, random_generators_playout, trees_playout_outcomes):
+    @cuda.jit(void(int32[:, :, :], int8[:, :], boolean[:, :], int8[:, :], int8[:, :, :, :], int8[:, :, :], int32[:], int16[:, :], xoroshiro128p_type[:], int32[:, :], boolean, int32[:, :, :, :]))
+    def _playout_ocp(trees, trees_turns, trees_terminals, trees_outcomes, trees_boards, trees_extra_infos, trees_nodes_selected, trees_actions_expanded, random_generators_playout, trees_playout_outcomes, rave, trees_playout_amaf):
         """CUDA kernel responsible for computations of stage: playouts (variant ``"ocp_thrifty"`` or ``"ocp_prodigal"``)."""
-        shared_board = cuda.shared.array((32, 32), dtype=int8) # assumed max board size (for selected node in tree associated with block)
-        shared_extra_info = cuda.shared.array(4096, dtype=int8) # 4096 - assumed limit on max extra info
+        shared_board = cuda.shared.array(PLAYOUT_BOARD_SHAPE, dtype=int8) # board size fixed for the game (for selected node in tree associated with block)
+        shared_extra_info = cuda.shared.array(PLAYOUT_EXTRA_INFO_MEMORY, dtype=int8) # extra info memory fixed for the game
         shared_playout_outcomes = cuda.shared.array((512, 2), dtype=int16) # 512 - assumed max tpb for playouts, two cells for a row (-1 win, +1 win), each flagged by 0 or 1 after playout 
-        local_board = cuda.local.array((32, 32), dtype=int8)
-        local_extra_info = cuda.local.array(4096, dtype=int8)
-        local_legal_actions_with_count = cuda.local.array(512 + 1, dtype=int16) # 512 - assumed limit on max actions
+        shared_playout_amaf = cuda.shared.array((2, PLAYOUT_MAX_ACTIONS, 2), dtype=int32) # max actions fixed for the game, AMAF counts and wins (RAVE) for each player (-1, +1) and action
+        local_board = cuda.local.array(PLAYOUT_BOARD_SHAPE, dtype=int8)
+        local_extra_info = cuda.local.array(PLAYOUT_EXTRA_INFO_MEMORY, dtype=int8)
+        local_legal_actions_with_count = cuda.local.array(PLAYOUT_LEGAL_ACTIONS_WITH_COUNT_LENGTH, dtype=int16) # max actions fixed for the game, plus one cell for count
+        local_amaf_played = cuda.local.array((2, PLAYOUT_MAX_ACTIONS), dtype=boolean) # flags of actions played by each player (RAVE)
         ti = cuda.blockIdx.x # tree index
         tpb = cuda.blockDim.x
         t = cuda.threadIdx.x
@@ -1816,6 +2010,7 @@ class MCTSNC:
         else:
             t = cuda.threadIdx.x
             t_global = cuda.grid(1)
+            state_max_actions = trees.shape[2] - 1
             shared_playout_outcomes[t, 0] = np.int16(0)
             shared_playout_outcomes[t, 1] = np.int16(0)
             _, _, m, n = trees_boards.shape
@@ -1835,6 +2030,15 @@ class MCTSNC:
                 if e < extra_info_memory:
                     shared_extra_info[e] = trees_extra_infos[ti, to_be_played_out, e]
                 e += tpb
+            if rave:
+                apt = (state_max_actions + tpb - 1) // tpb # actions per thread
+                e = t
+                for _ in range(apt):
+                    if e < state_max_actions:
+                        for p in range(2):
+                            shared_playout_amaf[p, e, 0] = int32(0)
+                            shared_playout_amaf[p, e, 1] = int32(0)
+                    e += tpb
             cuda.syncthreads()
             for i in range(m):
                 for j in range(n):
@@ -1843,6 +2047,12 @@ class MCTSNC:
                 local_extra_info[i] = shared_extra_info[i]                
             local_legal_actions_with_count[-1] = 0
             turn = trees_turns[ti, to_be_played_out]
+            if rave:
+                for a in range(state_max_actions):
+                    local_amaf_played[0, a] = False
+                    local_amaf_played[1, a] = False
+                if last_action != int16(-1):
+                    local_amaf_played[(1 - turn) // 2, last_action] = True # action leading to the root for playouts (taken by the opponent)
             outcome = compute_outcome(m, n, local_board, local_extra_info, turn, last_action) if last_action != int16(-1) else int8(2) # else case only when trees not grown due to memory limit (then selected played out)
             while True: # playout loop                
                 if not (outcome == int8(-1) or outcome == int8(0) or outcome == int8(1)): # indecisive, game ongoing
@@ -1850,6 +2060,8 @@ class MCTSNC:
                     count = local_legal_actions_with_count[-1]
                     action_ord = int16(xoroshiro128p_uniform_float32(random_generators_playout, t_global) * count)
                     last_action = local_legal_actions_with_count[action_ord]
+                    if rave:
+                        local_amaf_played[(turn + 1) // 2, last_action] = True
                     take_action_playout(m, n, local_board, local_extra_info, turn, last_action, action_ord, local_legal_actions_with_count)                    
                     turn = -turn
                 else:
@@ -1858,6 +2070,21 @@ class MCTSNC:
                     break
                 outcome = compute_outcome(m, n, local_board, local_extra_info, turn, last_action)
             cuda.syncthreads()
+            if rave: # AMAF statistics summed within block, then added to the tree's ones (atomically, blocks of a tree may be many)
+                for a in range(state_max_actions):
+                    for p in range(2):
+                        if local_amaf_played[p, a]:
+                            cuda.atomic.add(shared_playout_amaf, (p, a, 0), int32(1))
+                            if outcome == int8(2 * p - 1):
+                                cuda.atomic.add(shared_playout_amaf, (p, a, 1), int32(1))
+                cuda.syncthreads()
+                e = t
+                for _ in range(apt):
+                    if e < state_max_actions:
+                        for p in range(2):
+                            cuda.atomic.add(trees_playout_amaf, (ti, p, e, 0), shared_playout_amaf[p, e, 0])
+                            cuda.atomic.add(trees_playout_amaf, (ti, p, e, 1), shared_playout_amaf[p, e, 1])
+                    e += tpb
             stride = tpb >> 1 # half of tpb
             while stride > 0: # sum reduction pattern
                 if t < stride:
@@ -1871,16 +2098,18 @@ class MCTSNC:
                 trees_playout_outcomes[ti, 1] = shared_playout_outcomes[0, 1]
         
     @staticmethod
-    @cuda.jit(void(int32[:, :, :], int8[:, :], boolean[:, :], int8[:, :], int8[:, :, :, :], int8[:, :, :], int32[:], int16[:, :], int16[:, :], xoroshiro128p_type[:], int32[:, :], int32[:, :, :]))
+    @cuda.jit(void(int32[:, :, :], int8[:, :], boolean[:, :], int8[:, :], int8[:, :, :, :], int8[:, :, :], int32[:], int16[:, :], int16[:, :], xoroshiro128p_type[:], int32[:, :], int32[:, :, :], boolean, int32[:, :, :, :]))
     def _playout_acp_thrifty(trees, trees_turns, trees_terminals, trees_outcomes, trees_boards, trees_extra_infos, trees_nodes_selected, trees_actions_expanded, trees_actions_expanded_flat, random_generators_playout, trees_playout_outcomes, 
-                             trees_playout_outcomes_children):
+                             trees_playout_outcomes_children, rave, trees_playout_amaf):
         """CUDA kernel responsible for computations of stage: playouts (variant ``"acp_thrifty"``)."""
-        shared_board = cuda.shared.array((32, 32), dtype=int8) # assumed max board size (for selected node in tree associated with block)
-        shared_extra_info = cuda.shared.array(4096, dtype=int8) # 4096 - assumed limit on max extra info
+        shared_board = cuda.shared.array(PLAYOUT_BOARD_SHAPE, dtype=int8) # board size fixed for the game (for selected node in tree associated with block)
+        shared_extra_info = cuda.shared.array(PLAYOUT_EXTRA_INFO_MEMORY, dtype=int8) # extra info memory fixed for the game
         shared_playout_outcomes = cuda.shared.array((512, 2), dtype=int16) # 1024 - assumed max tpb for playouts, two cells for a row (-1 win, +1 win), each flagged by 0 or 1 after playout 
-        local_board = cuda.local.array((32, 32), dtype=int8)
-        local_extra_info = cuda.local.array(4096, dtype=int8)
-        local_legal_actions_with_count = cuda.local.array(512 + 1, dtype=int16) # 512 - assumed limit on max actions        
+        shared_playout_amaf = cuda.shared.array((2, PLAYOUT_MAX_ACTIONS, 2), dtype=int32) # max actions fixed for the game, AMAF counts and wins (RAVE) for each player (-1, +1) and action
+        local_board = cuda.local.array(PLAYOUT_BOARD_SHAPE, dtype=int8)
+        local_extra_info = cuda.local.array(PLAYOUT_EXTRA_INFO_MEMORY, dtype=int8)
+        local_legal_actions_with_count = cuda.local.array(PLAYOUT_LEGAL_ACTIONS_WITH_COUNT_LENGTH, dtype=int16) # max actions fixed for the game, plus one cell for count
+        local_amaf_played = cuda.local.array((2, PLAYOUT_MAX_ACTIONS), dtype=boolean) # flags of actions played by each player (RAVE)
         tai = cuda.blockIdx.x # tree-action pair index
         ti = trees_actions_expanded_flat[tai, 0]
         action = trees_actions_expanded_flat[tai, 1]  
@@ -1924,6 +2153,15 @@ class MCTSNC:
                 if e < extra_info_memory:
                     shared_extra_info[e] = trees_extra_infos[ti, to_be_played_out, e]
                 e += tpb
+            if rave:
+                apt = (state_max_actions + tpb - 1) // tpb # actions per thread
+                e = t
+                for _ in range(apt):
+                    if e < state_max_actions:
+                        for p in range(2):
+                            shared_playout_amaf[p, e, 0] = int32(0)
+                            shared_playout_amaf[p, e, 1] = int32(0)
+                    e += tpb
             cuda.syncthreads()
             for i in range(m):
                 for j in range(n):
@@ -1932,6 +2170,12 @@ class MCTSNC:
                 local_extra_info[i] = shared_extra_info[i]
             local_legal_actions_with_count[-1] = 0            
             turn = trees_turns[ti, to_be_played_out]
+            if rave:
+                for a in range(state_max_actions):
+                    local_amaf_played[0, a] = False
+                    local_amaf_played[1, a] = False
+                if last_action != int16(-1):
+                    local_amaf_played[(1 - turn) // 2, last_action] = True # action leading to the root for playouts (taken by the opponent)
             outcome = compute_outcome(m, n, local_board, local_extra_info, turn, last_action) if last_action != int16(-1) else int8(2) # else case only when trees not grown due to memory limit (then selected played out)
             while True: # playout loop                
                 if not (outcome == int8(-1) or outcome == int8(0) or outcome == int8(1)): # indecisive, game ongoing
@@ -1939,6 +2183,8 @@ class MCTSNC:
                     count = local_legal_actions_with_count[-1]
                     action_ord = int16(xoroshiro128p_uniform_float32(random_generators_playout, t_global) * count)
                     last_action = local_legal_actions_with_count[action_ord]
+                    if rave:
+                        local_amaf_played[(turn + 1) // 2, last_action] = True
                     take_action_playout(m, n, local_board, local_extra_info, turn, last_action, action_ord, local_legal_actions_with_count)
                     turn = -turn
                 else:
@@ -1947,6 +2193,21 @@ class MCTSNC:
                     break
                 outcome = compute_outcome(m, n, local_board, local_extra_info, turn, last_action)
             cuda.syncthreads()
+            if rave: # AMAF statistics summed within block, then added to the tree's ones (atomically, blocks of a tree may be many)
+                for a in range(state_max_actions):
+                    for p in range(2):
+                        if local_amaf_played[p, a]:
+                            cuda.atomic.add(shared_playout_amaf, (p, a, 0), int32(1))
+                            if outcome == int8(2 * p - 1):
+                                cuda.atomic.add(shared_playout_amaf, (p, a, 1), int32(1))
+                cuda.syncthreads()
+                e = t
+                for _ in range(apt):
+                    if e < state_max_actions:
+                        for p in range(2):
+                            cuda.atomic.add(trees_playout_amaf, (ti, p, e, 0), shared_playout_amaf[p, e, 0])
+                            cuda.atomic.add(trees_playout_amaf, (ti, p, e, 1), shared_playout_amaf[p, e, 1])
+                    e += tpb
             stride = tpb >> 1 # half of tpb
             while stride > 0: # sum reduction pattern
                 if t < stride:
@@ -1960,20 +2221,22 @@ class MCTSNC:
                 trees_playout_outcomes_children[ti, action, 1] = shared_playout_outcomes[0, 1]                            
                 
     @staticmethod
-    @cuda.jit(void(int32[:, :, :], int8[:, :], boolean[:, :], int8[:, :], int8[:, :, :, :], int8[:, :, :], int32[:], int16[:, :], xoroshiro128p_type[:], int32[:, :], int32[:, :, :]))
+    @cuda.jit(void(int32[:, :, :], int8[:, :], boolean[:, :], int8[:, :], int8[:, :, :, :], int8[:, :, :], int32[:], int16[:, :], xoroshiro128p_type[:], int32[:, :], int32[:, :, :], boolean, int32[:, :, :, :]))
     def _playout_acp_prodigal(trees, trees_turns, trees_terminals, trees_outcomes, trees_boards, trees_extra_infos, trees_nodes_selected, trees_actions_expanded,  random_generators_playout, trees_playout_outcomes, 
-                              trees_playout_outcomes_children):
+                              trees_playout_outcomes_children, rave, trees_playout_amaf):
         """CUDA kernel responsible for computations of stage: playouts (variant ``"acp_prodigal"``)."""
-        shared_board = cuda.shared.array((32, 32), dtype=int8) # assumed max board size (for selected node in tree associated with block)
-        shared_extra_info = cuda.shared.array(4096, dtype=int8) # 4096 - assumed limit on max extra info
+        shared_board = cuda.shared.array(PLAYOUT_BOARD_SHAPE, dtype=int8) # board size fixed for the game (for selected node in tree associated with block)
+        shared_extra_info = cuda.shared.array(PLAYOUT_EXTRA_INFO_MEMORY, dtype=int8) # extra info memory fixed for the game
         shared_playout_outcomes = cuda.shared.array((512, 2), dtype=int16) # 1024 - assumed max tpb for playouts, two cells for a row (-1 win, +1 win), each flagged by 0 or 1 after playout        
+        shared_playout_amaf = cuda.shared.array((2, PLAYOUT_MAX_ACTIONS, 2), dtype=int32) # max actions fixed for the game, AMAF counts and wins (RAVE) for each player (-1, +1) and action
         ti = cuda.blockIdx.x
         action = cuda.blockIdx.y
         if trees_actions_expanded[ti, action] < int16(0): # prodigality
             return
-        local_board = cuda.local.array((32, 32), dtype=int8)
-        local_extra_info = cuda.local.array(4096, dtype=int8)
-        local_legal_actions_with_count = cuda.local.array(512 + 1, dtype=int16) # 512 - assumed limit on max actions          
+        local_board = cuda.local.array(PLAYOUT_BOARD_SHAPE, dtype=int8)
+        local_extra_info = cuda.local.array(PLAYOUT_EXTRA_INFO_MEMORY, dtype=int8)
+        local_legal_actions_with_count = cuda.local.array(PLAYOUT_LEGAL_ACTIONS_WITH_COUNT_LENGTH, dtype=int16) # max actions fixed for the game, plus one cell for count
+        local_amaf_played = cuda.local.array((2, PLAYOUT_MAX_ACTIONS), dtype=boolean) # flags of actions played by each player (RAVE)
         tpb = cuda.blockDim.x
         t = cuda.threadIdx.x
         to_be_played_out = trees_nodes_selected[ti] # temporarily to_be_played_out equals selected  
@@ -2014,6 +2277,15 @@ class MCTSNC:
                 if e < extra_info_memory:
                     shared_extra_info[e] = trees_extra_infos[ti, to_be_played_out, e]
                 e += tpb
+            if rave:
+                apt = (state_max_actions + tpb - 1) // tpb # actions per thread
+                e = t
+                for _ in range(apt):
+                    if e < state_max_actions:
+                        for p in range(2):
+                            shared_playout_amaf[p, e, 0] = int32(0)
+                            shared_playout_amaf[p, e, 1] = int32(0)
+                    e += tpb
             cuda.syncthreads()
             for i in range(m):
                 for j in range(n):
@@ -2022,6 +2294,12 @@ class MCTSNC:
                 local_extra_info[i] = shared_extra_info[i]
             local_legal_actions_with_count[-1] = 0
             turn = trees_turns[ti, to_be_played_out]
+            if rave:
+                for a in range(state_max_actions):
+                    local_amaf_played[0, a] = False
+                    local_amaf_played[1, a] = False
+                if last_action != int16(-1):
+                    local_amaf_played[(1 - turn) // 2, last_action] = True # action leading to the root for playouts (taken by the opponent)
             outcome = compute_outcome(m, n, local_board, local_extra_info, turn, last_action) if last_action != int16(-1) else int8(2) # else case only when trees not grown due to memory limit (then selected played out)
             while True: # playout loop                
                 if not (outcome == int8(-1) or outcome == int8(0) or outcome == int8(1)): # indecisive, game ongoing
@@ -2029,6 +2307,8 @@ class MCTSNC:
                     count = local_legal_actions_with_count[-1]
                     action_ord = int16(xoroshiro128p_uniform_float32(random_generators_playout, t_global) * count)
                     last_action = local_legal_actions_with_count[action_ord]
+                    if rave:
+                        local_amaf_played[(turn + 1) // 2, last_action] = True
                     take_action_playout(m, n, local_board, local_extra_info, turn, last_action, action_ord, local_legal_actions_with_count)
                     turn = -turn
                 else:                                                
@@ -2037,6 +2317,21 @@ class MCTSNC:
                     break
                 outcome = compute_outcome(m, n, local_board, local_extra_info, turn, last_action)
             cuda.syncthreads()
+            if rave: # AMAF statistics summed within block, then added to the tree's ones (atomically, blocks of a tree may be many)
+                for a in range(state_max_actions):
+                    for p in range(2):
+                        if local_amaf_played[p, a]:
+                            cuda.atomic.add(shared_playout_amaf, (p, a, 0), int32(1))
+                            if outcome == int8(2 * p - 1):
+                                cuda.atomic.add(shared_playout_amaf, (p, a, 1), int32(1))
+                cuda.syncthreads()
+                e = t
+                for _ in range(apt):
+                    if e < state_max_actions:
+                        for p in range(2):
+                            cuda.atomic.add(trees_playout_amaf, (ti, p, e, 0), shared_playout_amaf[p, e, 0])
+                            cuda.atomic.add(trees_playout_amaf, (ti, p, e, 1), shared_playout_amaf[p, e, 1])
+                    e += tpb
             stride = tpb >> 1 # half of tpb
             while stride > 0: # sum reduction pattern
                 if t < stride:
@@ -2188,6 +2483,55 @@ class MCTSNC:
                     trees_ns_wins[ti, node] += n_positive_wins                
             e += tpb
                 
+    @staticmethod
+    @cuda.jit(void(int16, boolean, int32[:, :, :], int8[:, :], int32[:, :], int16[:, :], int32[:, :], int32[:, :, :, :], int32[:, :], int32[:, :]))
+    def _backup_rave(n_playouts, acp, trees, trees_turns, trees_selected_paths, trees_actions_expanded, trees_playout_outcomes, trees_playout_amaf, trees_amaf_ns, trees_amaf_ns_wins):
+        """
+        CUDA kernel responsible for computations of stage: backups of AMAF statistics (RAVE, all variants). For each node along the selected path and each of its children (one thread per action), 
+        the child's AMAF statistics are increased by: all playouts of the step - if the action was taken by the player to act below the node along the path, 
+        or playouts in which the player took the action (as recorded by playout kernels) - otherwise. Statistics of children of the selected node (just expanded) are set rather than increased.
+        Playouts AMAF statistics are zeroed afterwards (for the next step).
+        """
+        ti = cuda.blockIdx.x
+        t = cuda.threadIdx.x # action index
+        state_max_actions = trees.shape[2] - 1
+        if t < state_max_actions:
+            n_playouts_total = int32(n_playouts)
+            if acp:
+                n_expanded_actions = trees_actions_expanded[ti, -1]
+                if n_expanded_actions == int16(0): # terminal was being "played out"
+                    n_expanded_actions = int16(1)
+                n_playouts_total = int32(n_playouts * n_expanded_actions)
+            path_length = trees_selected_paths[ti, -1]
+            for e in range(path_length):
+                node = trees_selected_paths[ti, e]
+                child = trees[ti, node, 1 + t]
+                if child == int32(-1):
+                    continue
+                turn = trees_turns[ti, node]
+                p = (turn + 1) // 2 # index of player to act (wins of -1, +1 stored at 0, 1)
+                taken_along_path = False
+                for k in range(e + 1, path_length):
+                    parent = trees_selected_paths[ti, k - 1]
+                    if trees_turns[ti, parent] == turn and trees[ti, parent, 1 + t] == trees_selected_paths[ti, k]:
+                        taken_along_path = True
+                        break
+                if taken_along_path:
+                    n_amaf = n_playouts_total
+                    n_amaf_wins = trees_playout_outcomes[ti, p]
+                else:
+                    n_amaf = trees_playout_amaf[ti, p, t, 0]
+                    n_amaf_wins = trees_playout_amaf[ti, p, t, 1]
+                if e == path_length - 1: # children of selected (just expanded)
+                    trees_amaf_ns[ti, child] = n_amaf
+                    trees_amaf_ns_wins[ti, child] = n_amaf_wins
+                else:
+                    trees_amaf_ns[ti, child] += n_amaf
+                    trees_amaf_ns_wins[ti, child] += n_amaf_wins
+            for p in range(2):
+                trees_playout_amaf[ti, p, t, 0] = int32(0)
+                trees_playout_amaf[ti, p, t, 1] = int32(0)
+
     @staticmethod
     @cuda.jit(void(int32[:, :, :], boolean[:, :], int8[:, :], int32[:, :], int32[:, :], int16[:], int8, int64[:], boolean[:], int64[:], int64[:]))
     def _reduce_over_trees_thrifty(trees, trees_terminals, trees_outcomes, trees_ns, trees_ns_wins, root_actions_expanded, root_turn, root_ns, actions_win_flags, actions_ns, actions_ns_wins):
@@ -2343,18 +2687,15 @@ class MCTSNC:
             best_n[0] = shared_actions_ns[0]
             best_n_wins[0] = shared_actions_ns_wins[0]                    
             
-    def _json_dump(self, fname):
-        """Dumps (saves) device-side arrays, copied to host, representing trees and MCTS elements from the last run to a text file in json format."""        
-        if self.verbose_info:
-            print(f"JSON DUMP... [to file: {fname}]")
-        t1 = time.time()                
+    def _snapshot(self):
+        """Returns a dictionary with parameters and device-side arrays, copied to host (and trimmed to used sizes), representing trees and MCTS elements from the last run."""
         d = {}
                 
         d["n_trees"] = self.n_trees
         d["n_playouts"] = self.n_playouts
         d["variant"] = self.variant
-        d["search_time_limit"] = self.search_time_limit if self.search_time_limit < np.inf else "inf" 
-        d["search_steps_limit"] = self.search_steps_limit if self.search_steps_limit < np.inf else "inf"
+        d["search_time_limit"] = self.search_time_limit
+        d["search_steps_limit"] = self.search_steps_limit
         d["ucb_c"] = self.ucb_c
         d["seed"] = self.seed
         d["device_memory"] = self.device_memory
@@ -2406,19 +2747,31 @@ class MCTSNC:
             trees_playout_outcomes_children = np.empty_like(self.dev_trees_playout_outcomes_children)
             self.dev_trees_playout_outcomes_children.copy_to_host(ary=trees_playout_outcomes_children)
         
-        d["trees"] = trees.tolist()
-        d["trees"] = trees.tolist()
-        d["trees_sizes"] = trees_sizes.tolist()
-        d["trees_depths"] = trees_depths.tolist()
-        d["trees_turns"] = trees_turns.tolist()
-        d["trees_ns"] = trees_ns.tolist()
-        d["trees_ns_wins"] = trees_ns_wins.tolist()
-        d["trees_nodes_selected"] = trees_nodes_selected.tolist()
-        d["trees_selected_paths"] = trees_selected_paths.tolist()
-        d["trees_actions_expanded"] = trees_actions_expanded.tolist()
-        d["trees_playout_outcomes"] = trees_playout_outcomes.tolist()
+        d["trees"] = trees
+        d["trees_sizes"] = trees_sizes
+        d["trees_depths"] = trees_depths
+        d["trees_turns"] = trees_turns
+        d["trees_ns"] = trees_ns
+        d["trees_ns_wins"] = trees_ns_wins
+        d["trees_nodes_selected"] = trees_nodes_selected
+        d["trees_selected_paths"] = trees_selected_paths
+        d["trees_actions_expanded"] = trees_actions_expanded
+        d["trees_playout_outcomes"] = trees_playout_outcomes
         if trees_playout_outcomes_children is not None:
-            d["trees_playout_outcomes_children"] = trees_playout_outcomes_children.tolist()    
+            d["trees_playout_outcomes_children"] = trees_playout_outcomes_children
+        return d
+
+    def _json_dump(self, fname):
+        """Dumps (saves) device-side arrays, copied to host, representing trees and MCTS elements from the last run to a text file in json format."""        
+        if self.verbose_info:
+            print(f"JSON DUMP... [to file: {fname}]")
+        t1 = time.perf_counter()                
+        d = self._snapshot()
+        for key in ["search_time_limit", "search_steps_limit"]:
+            d[key] = d[key] if d[key] < np.inf else "inf"
+        for key in d:
+            if isinstance(d[key], np.ndarray):
+                d[key] = d[key].tolist()
         
         try:
             f = open(fname, "w+")
@@ -2426,6 +2779,74 @@ class MCTSNC:
             f.close()
         except IOError:
             sys.exit(f"[error occurred when trying to dump MCTSNC as json to file: {fname}]")
-        t2 = time.time()
+        t2 = time.perf_counter()
         if self.verbose_info:
-            print(f"JSON DUMP DONE. [time: {t2 - t1} s]")
\ No newline at end of file
+            print(f"JSON DUMP DONE. [time: {t2 - t1} s]")
+
+    def _npz_dump(self, fname, compressed=True):
+        """
+        Dumps (saves) device-side arrays, copied to host, representing trees and MCTS elements from the last run to a binary file in npz format
+        (a compact and fast alternative to ``_json_dump``; arrays are saved directly, parameters as zero-dimensional arrays). 
+        See ``load_npz_dump`` for loading.
+        
+        Args:
+            fname (str):
+                name of the file (``np.savez`` appends extension .npz if missing).
+            compressed (bool):
+                flag stating whether arrays should be compressed; if ``False`` arrays of the dump can be memory-mapped when loaded, defaults to ``True``.
+        """
+        if self.verbose_info:
+            print(f"NPZ DUMP... [to file: {fname}]")
+        t1 = time.perf_counter()
+        d = self._snapshot()
+        try:
+            (np.savez_compressed if compressed else np.savez)(fname, **d)
+        except IOError:
+            sys.exit(f"[error occurred when trying to dump MCTSNC as npz to file: {fname}]")
+        t2 = time.perf_counter()
+        if self.verbose_info:
+            print(f"NPZ DUMP DONE. [time: {t2 - t1} s]")
+
+    @staticmethod
+    def load_npz_dump(fname, mmap=False):
+        """
+        Loads a dump written by ``_npz_dump`` (for offline inspection) and returns a dictionary with parameters (as Python scalars) and arrays representing trees and MCTS elements.
+        
+        Args:
+            fname (str):
+                name of the .npz file.
+            mmap (bool):
+                flag stating whether arrays should be memory-mapped (read-only) instead of read into memory; applicable only to dumps saved with ``compressed=False``, defaults to ``False``.
+                
+        Returns:
+            d (dict):
+                dictionary with parameters and arrays, keyed as in the dump.
+        """
+        d = {}
+        try:
+            if mmap:
+                with open(fname, "rb") as f, zipfile.ZipFile(f, "r") as archive:
+                    for info in archive.infolist():
+                        if info.compress_type != zipfile.ZIP_STORED:
+                            sys.exit(f"[error occurred when trying to memory-map MCTSNC npz dump with compressed arrays: {fname}]")
+                        f.seek(info.header_offset)
+                        local_header = f.read(30) # fixed-size part of zip local file header
+                        name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+                        f.seek(info.header_offset + 30 + name_length + extra_length)
+                        version = np.lib.format.read_magic(f)
+                        shape, fortran_order, dtype = (np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0)(f)
+                        key = info.filename[:-len(".npy")]
+                        if len(shape) == 0:
+                            d[key] = np.frombuffer(f.read(dtype.itemsize), dtype=dtype).reshape(shape)
+                        else:
+                            d[key] = np.memmap(fname, dtype=dtype, mode="r", offset=f.tell(), shape=shape, order="F" if fortran_order else "C")
+            else:
+                with np.load(fname) as npz:
+                    for key in npz.files:
+                        d[key] = npz[key]
+        except (IOError, zipfile.BadZipFile):
+            sys.exit(f"[error occurred when trying to load MCTSNC npz dump from file: {fname}]")
+        for key in d:
+            if d[key].ndim == 0:
+                d[key] = d[key].item()
+        return d
\ No newline at end of file
@@ -54,6 +54,12 @@ __version__ = "1.0.1"
 __author__ = "Przemysław Klęsk"
 __email__ = "pklesk@zut.edu.pl" 
 
+# sizes of per-thread scratch arrays used by ``_playout_*`` kernels of ``MCTSNC`` class; they must be compile-time constants,
+# hence they are fixed here, together with the choice of game mechanics made below (entries for other games given in comments)
+PLAYOUT_BOARD_SHAPE = (2, 6) # Kallah; Connect 4: (6, 7); Gomoku: (15, 15)
+PLAYOUT_EXTRA_INFO_MEMORY = 6 # Kallah; Connect 4: 7; Gomoku: 1
+PLAYOUT_MAX_ACTIONS = 7 # Kallah; Connect 4: 7; Gomoku: 225
+
 @cuda.jit(device=True)
 def is_action_legal(m, n, board, extra_info, turn, action, legal_actions):
     """Checks whether action defined by index ``action`` is legal and leaves the result (a boolean indicator) in array ``legal_actions`` under that index."""
@@ -157,7 +163,7 @@ def take_action_kallah(m, n, board, extra_info, turn, action):
         idx = action + counter
         if idx == board.shape[1]:
             idx = board.shape[1]-1
-            #action = board.shape[1]-1
+            action = board.shape[1]-1
             counter = 0
             current_row = 0
             if player_row == 1:
@@ -169,7 +175,7 @@ def take_action_kallah(m, n, board, extra_info, turn, action):
             continue      
         elif idx < 0:
             idx = 0
-            #action = 0
+            action = 0
             counter = 0
             current_row = 1
             if player_row == 0:
@@ -192,7 +198,7 @@ def take_action_kallah(m, n, board, extra_info, turn, action):
                 #steal only if the enemy has what to steal
                 extra_info[player_row] += board[enemy_row, idx] + 1
                 board[enemy_row, idx] = 0
-                board[current_row, idx] = 0
+                board[current_row, idx] -= 1
         board[current_row, idx] += 1
         if current_row == 1:
             counter += 1
@@ -0,0 +1,281 @@
+"""
+Script running a local move server - serving best actions of an AI (identified by its short name, see :doc:`ais`) for positions of many concurrent games.
+The server is based on ``asyncio`` and listens on a local TCP socket; the protocol is line-delimited JSON: each request line describes a position, e.g.
+
+.. code-block:: json
+
+    {"id": 17, "board": [[4, 4, 4, 4, 4, 4], [4, 4, 4, 4, 4, 4]], "extra_info": [0, 0, 0, 0, 0], "turn": 1}
+
+and each response line (for that request) carries its best action and information on actions (as in ``actions_info`` attribute of AIs), or an error message:
+
+.. code-block:: json
+
+    {"id": 17, "best_action": 2, "best_action_name": "2", "actions_info": {...}}
+    {"id": 18, "error": "..."}
+
+A client may send many requests over one connection without waiting for responses (responses come as soon as searches finish, matched by ``"id"``).
+Searches are carried out by a fixed pool of engine workers (processes, each owning one AI instance): ``N_WORKERS`` processes for ``MCTS`` (``None`` for the number of CPUs),
+a single process for ``MCTSNC`` (one GPU). Pending requests, from all connections, are queued and taken by workers in batches of up to ``MAX_BATCH_SIZE`` positions,
+so that the overhead of passing work to processes is shared within a batch. Hence, the throughput depends on the number of workers kept busy (scaling with concurrent games),
+not on the number of engine instances (one per worker). If an opening book is given (``OPENING_BOOK_FPATH``, see :doc:`opening_book`), workers consult it before searching;
+a book hit is answered at once, with ``"book_hit": true`` and the book entry as the best action's information.
+
+The following variables allow to define the settings of the server:
+
+.. code-block:: python
+
+    STATE_CLASS = Kalah # C4, Gomoku or Kalah
+    AI_SHORTNAME = "mcts_1_inf_vanilla"
+    HOST = "127.0.0.1"
+    PORT = 8765
+    N_WORKERS = None # engine worker processes for MCTS (None for the number of CPUs); MCTSNC always uses one
+    MAX_BATCH_SIZE = 8
+    OPENING_BOOK_FPATH = None # path of an .npy opening book file or None
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from kalah import Kalah
+from ais import parse_ai_shortname, make_ai, is_mctsnc
+from opening_book import OpeningBook
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+# server settings
+STATE_CLASS = Kalah # C4, Gomoku or Kalah
+AI_SHORTNAME = "mcts_1_inf_vanilla"
+HOST = "127.0.0.1"
+PORT = 8765
+N_WORKERS = None # engine worker processes for MCTS (None for the number of CPUs); MCTSNC always uses one
+MAX_BATCH_SIZE = 8
+OPENING_BOOK_FPATH = None # path of an .npy opening book file or None
+
+_engine = None # (state_class, ai, opening_book) owned by an engine worker process
+
+def _json_default(value):
+    """Converts numpy scalars and arrays (e.g. within ``actions_info``) to built-in types for JSON serialization."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"object of type {type(value).__name__} is not JSON serializable")
+
+def _init_engine_worker(state_class, ai_shortname, opening_book_fpath):
+    """Initializer of an engine worker process - constructs and warms up its AI instance and opens the opening book, if given (console output of the worker discarded)."""
+    global _engine
+    sys.stdout = open(os.devnull, "w")
+    ai = make_ai(ai_shortname, state_class)
+    ai.verbose_info = False
+    if is_mctsnc(ai):
+        ai.init_device_side_arrays()
+    ai.warm_up(state_class)
+    _engine = (state_class, ai, OpeningBook(opening_book_fpath) if opening_book_fpath is not None else None)
+
+def _search(board, extra_info, turn):
+    """Searches a position by the AI of an engine worker (unless found in the opening book) and returns a response dictionary (best action and actions information)."""
+    state_class, ai, opening_book = _engine
+    board = np.array(board, dtype=np.int8)
+    extra_info = np.array(extra_info, dtype=np.int8) if extra_info is not None else None
+    if opening_book is not None:
+        book_entry = opening_book.lookup(state_class.from_position(board, extra_info, turn))
+        if book_entry is not None:
+            best_action = book_entry["index"]
+            return {"best_action": best_action, "best_action_name": state_class.action_index_to_name(best_action), "book_hit": True, "actions_info": {"best": book_entry}}
+    if is_mctsnc(ai):
+        best_action = ai.run(board, extra_info, turn)
+    else:
+        best_action = ai.run(state_class.from_position(board, extra_info, turn))
+    response = {"best_action": int(best_action), "best_action_name": state_class.action_index_to_name(best_action), "actions_info": ai.actions_info}
+    return json.loads(json.dumps(response, default=_json_default))
+
+def _search_batch(positions):
+    """Searches a batch of positions within an engine worker and returns the list of response dictionaries (with error messages for failed searches)."""
+    responses = []
+    for board, extra_info, turn in positions:
+        try:
+            responses.append(_search(board, extra_info, turn))
+        except Exception as e:
+            responses.append({"error": f"search failed: {type(e).__name__}: {e}"})
+    return responses
+
+class MoveServer:
+    """Local move server (``asyncio``-based) serving best actions of an AI for positions sent as line-delimited JSON requests, searched in batches by a pool of engine workers."""
+
+    def __init__(self, state_class, ai_shortname, n_workers=N_WORKERS, max_batch_size=MAX_BATCH_SIZE, opening_book_fpath=OPENING_BOOK_FPATH):
+        """
+        Constructor of ``MoveServer`` instances.
+
+        Args:
+            state_class (class):
+                class of states (game) to be searched, e.g. ``Kalah``.
+            ai_shortname (str):
+                short name of the AI carrying out searches, e.g. ``"mcts_1_inf_vanilla"`` or ``"mctsnc_1_inf_4_128_acp_prodigal"``.
+            n_workers (int):
+                number of engine worker processes for ``MCTS``, ``None`` for the number of CPUs (ignored for ``MCTSNC`` - one worker), defaults to ``None``.
+            max_batch_size (int):
+                maximum number of positions passed to a worker at once, defaults to ``8``.
+            opening_book_fpath (str):
+                path of an opening book file consulted by workers before searching, ``None`` for no book, defaults to ``None``.
+        """
+        self.state_class = state_class
+        self.ai_shortname = ai_shortname
+        on_gpu = parse_ai_shortname(ai_shortname)["class"] == "MCTSNC"
+        self.n_workers = 1 if on_gpu else (n_workers if n_workers is not None else os.cpu_count())
+        self.max_batch_size = max_batch_size
+        self.opening_book_fpath = opening_book_fpath
+        self.executor = None
+        self.queue = None
+        self.dispatchers = []
+        self.server = None
+        self.n_requests = 0
+        self.n_batches = 0
+
+    def __str__(self):
+        """Returns a string representation of this ``MoveServer`` instance."""
+        return f"MoveServer(game: {self.state_class.class_repr()}, ai: {self.ai_shortname}, n_workers={self.n_workers}, max_batch_size={self.max_batch_size}, opening_book_fpath={self.opening_book_fpath})"
+
+    def __repr__(self):
+        """Returns a string representation of this ``MoveServer`` instance (equivalent to ``__str__`` method)."""
+        return self.__str__()
+
+    async def start(self, host=HOST, port=PORT):
+        """Starts engine workers (waiting until all of them are warmed up), dispatchers of batches and the listening socket."""
+        print(f"MOVE SERVER START... [{self}]")
+        t1 = time.time()
+        # spawned (not forked) workers - CUDA cannot be used in forked processes
+        self.executor = ProcessPoolExecutor(max_workers=self.n_workers, mp_context=multiprocessing.get_context("spawn"),
+                                            initializer=_init_engine_worker, initargs=(self.state_class, self.ai_shortname, self.opening_book_fpath))
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[loop.run_in_executor(self.executor, _search_batch, []) for _ in range(self.n_workers)]) # workers started and warmed up
+        self.queue = asyncio.Queue()
+        self.dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.n_workers)]
+        self.server = await asyncio.start_server(self._handle_client, host, port)
+        t2 = time.time()
+        print(f"MOVE SERVER START DONE. [listening on: {host}:{port}, time: {t2 - t1} s]")
+
+    async def serve_forever(self):
+        """Serves requests until cancelled."""
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        """Stops listening, cancels dispatchers and shuts down engine workers."""
+        print(f"MOVE SERVER CLOSE... [requests served: {self.n_requests}, batches: {self.n_batches}]")
+        self.server.close()
+        await self.server.wait_closed()
+        for dispatcher in self.dispatchers:
+            dispatcher.cancel()
+        await asyncio.gather(*self.dispatchers, return_exceptions=True)
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        print("MOVE SERVER CLOSE DONE.")
+
+    async def search(self, board, extra_info, turn):
+        """Queues a position for search and returns (when ready) the response dictionary: best action and actions information, or an error message."""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put(((board, extra_info, turn), future))
+        return await future
+
+    async def _dispatch(self):
+        """Takes pending requests from the queue in batches (up to ``max_batch_size``) and passes them to an engine worker; one dispatcher per worker."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                responses = await loop.run_in_executor(self.executor, _search_batch, [position for position, _ in batch])
+            except Exception as e:
+                responses = [{"error": f"engine worker failed: {type(e).__name__}: {e}"}] * len(batch)
+            self.n_batches += 1
+            for (_, future), response in zip(batch, responses):
+                if not future.cancelled():
+                    future.set_result(response)
+
+    async def _handle_request(self, line, writer, write_lock):
+        """Parses a request line, searches its position and writes the response line."""
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            response = await self.search(request["board"], request.get("extra_info"), int(request["turn"]))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            response = {"error": f"invalid request: {type(e).__name__}: {e}"}
+        self.n_requests += 1
+        async with write_lock:
+            writer.write((json.dumps({"id": request_id, **response}) + "\n").encode("utf-8"))
+            await writer.drain()
+
+    async def _handle_client(self, reader, writer):
+        """Serves a client connection: each request line is handled concurrently (responses written as soon as ready)."""
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    task = asyncio.create_task(self._handle_request(line, writer, write_lock))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+async def request_moves(positions, host=HOST, port=PORT):
+    """
+    Client-side coroutine: sends positions to a move server over one connection (all at once) and returns responses in the order of positions.
+
+    Args:
+        positions (list(tuple)):
+            positions as tuples ``(board, extra_info, turn)``, with arrays given as numpy arrays or (nested) lists.
+        host (str):
+            host of the server, defaults to ``"127.0.0.1"``.
+        port (int):
+            port of the server, defaults to ``8765``.
+
+    Returns:
+        responses (list(dict)):
+            response dictionaries (best action and actions information, or an error message).
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    for i, (board, extra_info, turn) in enumerate(positions):
+        request = {"id": i, "board": board, "extra_info": extra_info, "turn": int(turn)}
+        writer.write((json.dumps(request, default=_json_default) + "\n").encode("utf-8"))
+    await writer.drain()
+    responses = [None] * len(positions)
+    for _ in range(len(positions)):
+        response = json.loads(await reader.readline())
+        responses[response.pop("id")] = response
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+async def serve(state_class, ai_shortname, host, port, n_workers, max_batch_size, opening_book_fpath):
+    """Starts a move server and serves requests until interrupted."""
+    move_server = MoveServer(state_class, ai_shortname, n_workers, max_batch_size, opening_book_fpath)
+    await move_server.start(host, port)
+    try:
+        await move_server.serve_forever()
+    finally:
+        await move_server.close()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(serve(STATE_CLASS, AI_SHORTNAME, HOST, PORT, N_WORKERS, MAX_BATCH_SIZE, OPENING_BOOK_FPATH))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,196 @@
+"""
+Script building opening books offline, and a class for lookups in them. All games of a kind start from the same position, hence the first plies need not be searched anew in every game:
+an opening book stores, for positions of the first ``N_PLIES`` plies, best actions and their statistics found by deep searches of an AI (identified by its short name, see :doc:`ais`).
+Positions are visited as in self-play, for each side of the book: when it is the book side to act, only the best action found is followed; for the opponent, all legal actions are followed.
+Each position is searched once (positions are keyed by ``position_hash`` from :doc:`utils`).
+
+Books are stored as ``.npy`` files with structured arrays sorted by position hashes (plus ``.json`` files with meta information) and opened as memory-mapped,
+so that a lookup is a binary search (``np.searchsorted``) touching only a few pages of the file, regardless of its size, and books are shared (not copied) between processes.
+Opening books are consulted by :doc:`game_runner` before searches of AIs (book hits reported in games information) and by engine workers of :doc:`move_server`.
+
+The following variables allow to define the settings of a book to be built:
+
+.. code-block:: python
+
+    STATE_CLASS = Kalah
+    AI_SHORTNAME = "mcts_inf_20000_vanilla" # deep searches (limited by steps, so that books do not depend on the machine)
+    N_PLIES = 6
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from kalah import Kalah
+from ais import make_ai, is_mctsnc
+from utils import position_hash
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+# settings
+STATE_CLASS = Kalah
+AI_SHORTNAME = "mcts_inf_20000_vanilla" # deep searches (limited by steps, so that books do not depend on the machine)
+N_PLIES = 6
+
+# folders
+FOLDER_OPENING_BOOKS = "../opening_books/"
+
+BOOK_DTYPE = np.dtype([("hash", "<u8"), ("index", "<i2"), ("win_flag", "?"), ("n_root", "<i8"), ("n", "<i8"), ("n_wins", "<i8"), ("q", "<f8")])
+
+def opening_book_fpath(state_class, ai_shortname, n_plies, folder):
+    """Returns the path of the ``.npy`` file of an opening book for given game, AI (short name) and number of plies."""
+    return folder + f"{state_class.class_repr()}_{ai_shortname}_{n_plies}.npy"
+
+def _legal_children(state):
+    """Returns a dictionary mapping legal actions of a state to children states (generated on a fresh copy of the state, not altering the given one)."""
+    state = type(state).from_position(state.get_board(), state.get_extra_info(), state.get_turn())
+    state.expand()
+    return state.children
+
+def _deep_search(ai, state):
+    """Carries out a search of an AI from a state (console output suppressed) and returns the book entry (without hash) implied by its best action."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        if is_mctsnc(ai):
+            ai.run(state.get_board(), state.get_extra_info(), state.get_turn())
+        else:
+            ai.run(type(state).from_position(state.get_board(), state.get_extra_info(), state.get_turn()))
+    best = ai.actions_info["best"]
+    return (int(best["index"]), bool(best["win_flag"]), int(best["n_root"]), int(best["n"]), int(best["n_wins"]), float(best["q"]))
+
+def build_opening_book(state_class, ai_shortname, n_plies, folder):
+    """
+    Builds an opening book by deep searches of an AI over positions of the first plies (visited as in self-play for each side of the book) and saves it.
+
+    Args:
+        state_class (class):
+            class of states (game), e.g. ``Kalah``.
+        ai_shortname (str):
+            short name of the AI carrying out deep searches.
+        n_plies (int):
+            number of plies covered by the book.
+        folder (str):
+            folder with opening books.
+
+    Returns:
+        fpath (str):
+            path of the ``.npy`` file of the book.
+    """
+    print(f"BUILD OPENING BOOK... [game: {state_class.class_repr()}, ai: {ai_shortname}, plies: {n_plies}]")
+    t1 = time.time()
+    ai = make_ai(ai_shortname, state_class)
+    ai.verbose_info = True # actions information needed
+    with contextlib.redirect_stdout(io.StringIO()):
+        if is_mctsnc(ai):
+            ai.init_device_side_arrays()
+        ai.warm_up(state_class)
+    entries = {}
+    for book_side in [1, -1]:
+        stack = [(state_class(), 0)]
+        while stack:
+            state, ply = stack.pop()
+            if ply >= n_plies or state.compute_outcome() is not None:
+                continue
+            h = position_hash(state.get_board(), state.get_extra_info(), state.get_turn())
+            if h not in entries:
+                entries[h] = _deep_search(ai, state)
+                print(f"[position {len(entries)} -> ply: {ply}, hash: {h:016x}, best action: {state_class.action_index_to_name(entries[h][0])}, q: {entries[h][5]:.3f}]")
+            children = _legal_children(state)
+            if state.get_turn() == book_side:
+                children = {entries[h][0]: children[entries[h][0]]}
+            for child in children.values():
+                stack.append((child, ply + 1))
+    book = np.array([(h, *entry) for h, entry in sorted(entries.items())], dtype=BOOK_DTYPE)
+    fpath = opening_book_fpath(state_class, ai_shortname, n_plies, folder)
+    os.makedirs(folder, exist_ok=True)
+    with open(fpath + ".tmp", "wb") as f:
+        np.save(f, book)
+    os.replace(fpath + ".tmp", fpath)
+    meta = {"game_name": state_class.class_repr(), "ai_shortname": ai_shortname, "n_plies": n_plies, "n_entries": len(book), "date": time.strftime("%Y-%m-%d %H:%M:%S")}
+    with open(fpath[:-len(".npy")] + ".json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    t2 = time.time()
+    print(f"BUILD OPENING BOOK DONE. [entries: {len(book)}, file: {fpath}, time: {t2 - t1} s]")
+    return fpath
+
+class OpeningBook:
+    """Opening book opened as memory-mapped (read-only) file, allowing lookups of best actions for positions by binary search over their hashes."""
+
+    def __init__(self, fpath):
+        """
+        Constructor of ``OpeningBook`` instances.
+
+        Args:
+            fpath (str):
+                path of the ``.npy`` file of a book (as built by ``build_opening_book``).
+        """
+        if not os.path.isfile(fpath):
+            sys.exit(f"[OpeningBook.__init__(): exiting due to missing opening book file: {fpath}]")
+        self.fpath = fpath
+        with open(fpath[:-len(".npy")] + ".json", "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.game_name = self.meta["game_name"]
+        self.entries = np.load(fpath, mmap_mode="r")
+        self.hashes = self.entries["hash"]
+
+    def __str__(self):
+        """
+        Returns a string representation of this ``OpeningBook`` instance.
+
+        Returns:
+            str: string representation of this ``OpeningBook`` instance.
+        """
+        return f"OpeningBook(game: {self.game_name}, ai: {self.meta['ai_shortname']}, plies: {self.meta['n_plies']}, entries: {len(self.entries)})"
+
+    def __repr__(self):
+        """
+        Returns a string representation of this ``OpeningBook`` instance (equivalent to ``__str__`` method).
+
+        Returns:
+            str: string representation of this ``OpeningBook`` instance.
+        """
+        return self.__str__()
+
+    def __len__(self):
+        """Returns the number of entries (positions) in the book."""
+        return len(self.entries)
+
+    def __getstate__(self):
+        """Returns the state for pickling (e.g. for worker processes) - only the path, the file gets memory-mapped anew when unpickled."""
+        return {"fpath": self.fpath}
+
+    def __setstate__(self, state):
+        """Restores the book from its pickled state (memory-maps its file)."""
+        self.__init__(state["fpath"])
+
+    def lookup(self, state):
+        """
+        Looks the given state up in the book.
+
+        Args:
+            state (State):
+                state (position) of a game.
+
+        Returns:
+            entry (dict):
+                dictionary with the best action (``"index"``) and its statistics from the deep search (``"win_flag"``, ``"n_root"``, ``"n"``, ``"n_wins"``, ``"q"``),
+                or ``None`` if the position is not in the book (or the book is for another game).
+        """
+        if type(state).class_repr() != self.game_name:
+            return None
+        h = np.uint64(position_hash(state.get_board(), state.get_extra_info(), state.get_turn()))
+        i = int(np.searchsorted(self.hashes, h))
+        if i == len(self.hashes) or self.hashes[i] != h:
+            return None
+        row = self.entries[i]
+        return {"index": int(row["index"]), "win_flag": bool(row["win_flag"]), "n_root": int(row["n_root"]), "n": int(row["n"]), "n_wins": int(row["n_wins"]), "q": float(row["q"])}
+
+if __name__ == "__main__":
+    build_opening_book(STATE_CLASS, AI_SHORTNAME, N_PLIES, FOLDER_OPENING_BOOKS)
@@ -9,7 +9,11 @@ Link to project repository
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator, FixedLocator
 import numpy as np
-from utils import unzip_and_load_experiment, dict_to_str
+import sys
+from functools import partial
+from utils import dict_to_str
+from experiment_store import load_experiment_columns, map_experiments
+from experiment_index import query_experiments, query_experiments_array
 
 __author__ = "Przemysław Klęsk"
 __email__ = "pklesk@zut.edu.pl"
@@ -17,6 +21,8 @@ __email__ = "pklesk@zut.edu.pl"
 FOLDER_EXPERIMENTS = "../experiments/"
 FOLDER_EXTRAS = "../extras/"
 
+N_WORKERS = None # number of processes loading and reducing experiments for generators, None for the number of CPUs
+
 def scores_array_plot(data, details, label_x, label_y, ticks_x, ticks_y, title):
     """Displays an array-like plot - a color map with averages of: scores, steps and depths - based on data from several experiments."""     
     figsize = (6, 6)
@@ -46,148 +52,66 @@ def scores_array_plot(data, details, label_x, label_y, ticks_x, ticks_y, title):
     plt.tight_layout(pad=0.0) 
     plt.show()
 
+def _scores_summary(experiment_hs, folder, initial_player_flag=None):
+    """Reduces an experiment to a summary needed by ``scores_array_plot_generator``: mean score and means of playouts, steps, depths of main player (B), and raw values of those for reference player (A)."""
+    c = load_experiment_columns(experiment_hs, ["games_outcome", "game", "side", "playouts", "steps", "mean_depth", "max_depth"], folder)
+    games = np.arange(1, c["games_outcome"].size + 1)
+    games_included = np.ones(games.size, dtype=bool)
+    if initial_player_flag is not None:
+        games_included = games % 2 == (0 if initial_player_flag else 1) # main player (B) is black in even games
+    outcomes = c["games_outcome"] * 0.5 + 0.5
+    outcomes = np.where(games % 2 == 1, 1.0 - outcomes, outcomes)[games_included]
+    rows_included = games_included[c["game"] - 1]
+    main_side = np.where(c["game"] % 2 == 1, -1, 1) # main player (B) is white in odd games
+    main_rows = rows_included & (c["side"] == main_side)
+    ref_rows = rows_included & (c["side"] == -main_side)
+    summary = {"score": np.mean(outcomes)}
+    for name in ["playouts", "steps", "mean_depth", "max_depth"]:
+        summary[name] = np.mean(c[name][main_rows])
+        summary["ref_" + name] = c[name][ref_rows]
+    return summary
+
 def scores_array_plot_generator(experiments_hs_array, label_x, label_y, ticks_x, ticks_y, title, initial_player_flag=None):
     """Reads data from several experiments computes averages of scores, steps and depths and generates an array-like plot by calling ``scores_array_plot`` function."""
     print("SCORES-ARRAY-PLOT GENERATOR...")    
+    summaries = map_experiments(partial(_scores_summary, initial_player_flag=initial_player_flag), experiments_hs_array, FOLDER_EXPERIMENTS, N_WORKERS)
     data = np.zeros(experiments_hs_array.shape)
     details_playouts_steps = np.empty(experiments_hs_array.shape, dtype=object) 
     details_depths = np.empty(experiments_hs_array.shape, dtype=object)    
-    ref_playouts = []
-    ref_steps = []            
-    ref_mean_depths = []
-    ref_max_depths = []    
     for i in range(experiments_hs_array.shape[0]):
         for j in range(experiments_hs_array.shape[1]):
-            experiment_info = unzip_and_load_experiment(experiments_hs_array[i, j], FOLDER_EXPERIMENTS)
-            outcomes = []
-            if False:
-                data[i, j] = experiment_info["stats"]["score_b_mean"]
-            n_games = experiment_info["matchup_info"]["n_games"]
-            playouts = []
-            steps = []            
-            mean_depths = []
-            max_depths = []
-            for g in range(n_games):
-                if initial_player_flag is not None:
-                    if (initial_player_flag and g % 2 == 0) or (not initial_player_flag and g % 2 == 1):
-                        continue
-                outcome = int(experiment_info["games_infos"][str(g + 1)]["outcome"]) * 0.5 + 0.5
-                if g % 2 == 0:
-                    outcome = 1.0 - outcome
-                outcomes.append(outcome)  
-                moves_rounds = experiment_info["games_infos"][str(g + 1)]["moves_rounds"]
-                main_player_prefix = "white_" if g % 2 == 0 else "black_"
-                ref_player_prefix = "white_" if g % 2 == 1 else "black_"
-                for m in range(len(moves_rounds)):
-                    moves_round = moves_rounds[str(m + 1)]
-                    mppi = main_player_prefix + "performance_info"
-                    if mppi in moves_round:
-                        playouts.append(moves_round[mppi]["playouts"])
-                        steps.append(moves_round[mppi]["steps"])
-                        trees_key = "trees" if "trees" in moves_round[mppi] else "tree"
-                        mean_depths.append(moves_round[mppi][trees_key]["mean_depth"])
-                        max_depths.append(moves_round[mppi][trees_key]["max_depth"])
-                    rppi = ref_player_prefix + "performance_info"
-                    if rppi in moves_round:
-                        ref_playouts.append(moves_round[rppi]["playouts"])
-                        ref_steps.append(moves_round[rppi]["steps"])
-                        trees_key = "trees" if "trees" in moves_round[rppi] else "tree"
-                        ref_mean_depths.append(moves_round[rppi][trees_key]["mean_depth"])
-                        ref_max_depths.append(moves_round[rppi][trees_key]["max_depth"])                    
-            details_playouts_steps[i, j] = f"{np.mean(playouts) / 10**6:.2f}M/{np.mean(steps) / 10**3:.2f}k"
-            details_depths[i, j] = f"{np.mean(mean_depths):.1f}/{np.mean(max_depths):.1f}"
-            data[i, j] = np.mean(outcomes)
+            summary = summaries[i, j]
+            details_playouts_steps[i, j] = f"{summary['playouts'] / 10**6:.2f}M/{summary['steps'] / 10**3:.2f}k"
+            details_depths[i, j] = f"{summary['mean_depth']:.1f}/{summary['max_depth']:.1f}"
+            data[i, j] = summary["score"]
+    ref_means = {name: np.mean(np.concatenate([summary["ref_" + name] for summary in summaries.ravel()])) for name in ["playouts", "steps", "mean_depth", "max_depth"]}
     details = [details_playouts_steps, details_depths] 
-    print(f"[reference player details: {np.mean(ref_playouts)}/{np.mean(ref_steps)}; {np.mean(ref_mean_depths)}/{np.mean(ref_max_depths)}]")
+    print(f"[reference player details: {ref_means['playouts']}/{ref_means['steps']}; {ref_means['mean_depth']}/{ref_means['max_depth']}]")
     print("SCORES-ARRAY-PLOT GENERATOR DONE.")        
     scores_array_plot(data, details, label_x, label_y, ticks_x, ticks_y, title)
     
 def scores_array_plot_ocp_thrifty_vs_vanilla_c4(initial_player_flag=None):
     """Generates an array-like plot - a color map with averages of: scores, steps and depths - based on data from experiments: ocp_thrifty vs vanilla (Connect 4)."""
-    experiments_hs_array = np.array([
-        ["3505711246_84404_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_32_ocp_thrifty;C4_6x7;100]",
-         "2363630254_99540_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_64_ocp_thrifty;C4_6x7;100]",
-         "2779060134_98220_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_128_ocp_thrifty;C4_6x7;100]",
-         "2226899934_08164_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_256_ocp_thrifty;C4_6x7;100]"],
-        ["1674136622_62772_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_32_ocp_thrifty;C4_6x7;100]",
-         "0532055630_45204_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_64_ocp_thrifty;C4_6x7;100]",
-         "2757986856_45550_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_128_ocp_thrifty;C4_6x7;100]",
-         "2205826656_55494_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_256_ocp_thrifty;C4_6x7;100]"],
-        ["2305954670_86804_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_32_ocp_thrifty;C4_6x7;100]",
-         "1163873678_01940_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_64_ocp_thrifty;C4_6x7;100]",
-         "2715840300_72914_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_128_ocp_thrifty;C4_6x7;100]",
-         "2163680100_50154_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_256_ocp_thrifty;C4_6x7;100]"],
-        ["3569590766_67572_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_32_ocp_thrifty;C4_6x7;100]",
-         "2427509774_50004_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_64_ocp_thrifty;C4_6x7;100]",
-         "2631547188_62234_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_128_ocp_thrifty;C4_6x7;100]",
-         "2079386988_72178_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_256_ocp_thrifty;C4_6x7;100]"]
-        ])
+    experiments_hs_array = query_experiments_array(FOLDER_EXPERIMENTS, "ai_b_n_trees", [1, 2, 4, 8], "ai_b_n_playouts", [32, 64, 128, 256],
+                                                   game_name="C4_6x7", ai_a_shortname="mcts_5_inf_vanilla", ai_b_search_time_limit=1.0, ai_b_variant="ocp_thrifty")
     scores_array_plot_generator(experiments_hs_array, "$m$ (n_playouts)", "$T$ (n_trees)", [32, 64, 128, 256], [1, 2, 4, 8], "OCP-THRIFTY (1$\,$s) vs VANILLA (5$\,$s)", initial_player_flag)    
 
 def scores_array_plot_ocp_prodigal_vs_vanilla_c4(initial_player_flag=None):
     """Generates an array-like plot - a color map with averages of: scores, steps and depths - based on data from experiments: ocp_prodigal vs vanilla (Connect 4)."""    
-    experiments_hs_array = np.array([
-        ["3195982906_82784_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_32_ocp_prodigal;C4_6x7;100]",
-         "0037595196_43010_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_64_ocp_prodigal;C4_6x7;100]",
-         "0224716614_77068_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_128_ocp_prodigal;C4_6x7;100]",
-         "3595406278_71788_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_256_ocp_prodigal;C4_6x7;100]"],
-        ["3174909628_30114_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_32_ocp_prodigal;C4_6x7;100]",
-         "0016521918_90340_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_64_ocp_prodigal;C4_6x7;100]",
-         "1969956518_67564_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_128_ocp_prodigal;C4_6x7;100]",
-         "1045678886_62284_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_256_ocp_prodigal;C4_6x7;100]"],
-        ["3132763072_24774_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_32_ocp_prodigal;C4_6x7;100]",         
-         "4269342658_85000_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_64_ocp_prodigal;C4_6x7;100]",
-         "1165469030_15852_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_128_ocp_prodigal;C4_6x7;100]",
-         "0241191398_10572_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_256_ocp_prodigal;C4_6x7;100]"],
-        ["3048469960_46798_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_32_ocp_prodigal;C4_6x7;100]",
-         "4185049546_07024_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_64_ocp_prodigal;C4_6x7;100]",
-         "3851461350_45132_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_128_ocp_prodigal;C4_6x7;100]",
-         "2927183718_39852_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_256_ocp_prodigal;C4_6x7;100]"]
-        ])
+    experiments_hs_array = query_experiments_array(FOLDER_EXPERIMENTS, "ai_b_n_trees", [1, 2, 4, 8], "ai_b_n_playouts", [32, 64, 128, 256],
+                                                   game_name="C4_6x7", ai_a_shortname="mcts_5_inf_vanilla", ai_b_search_time_limit=1.0, ai_b_variant="ocp_prodigal")
     scores_array_plot_generator(experiments_hs_array, "$m$ (n_playouts)", "$T$ (n_trees)", [32, 64, 128, 256], [1, 2, 4, 8], "OCP-PRODIGAL (1$\,$s) vs VANILLA (5$\,$s)", initial_player_flag)
 
 def scores_array_plot_acp_thrifty_vs_vanilla_c4(initial_player_flag=None):
     """Generates an array-like plot - a color map with averages of: scores, steps and depths - based on data from experiments: acp_thrifty vs vanilla (Connect 4)."""
-    experiments_hs_array = np.array([
-        ["0225178830_78932_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_32_acp_thrifty;C4_6x7;100]",
-         "3378065134_94068_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_64_acp_thrifty;C4_6x7;100]",
-         "1096823050_67120_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_128_acp_thrifty;C4_6x7;100]",         
-         "0544662850_44360_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_256_acp_thrifty;C4_6x7;100]"],
-        ["2688571502_57300_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_32_acp_thrifty;C4_6x7;100]",
-         "1546490510_39732_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_64_acp_thrifty;C4_6x7;100]",
-         "1075749772_14450_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_128_acp_thrifty;C4_6x7;100]",
-         "0523589572_91690_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_256_acp_thrifty;C4_6x7;100]"],
-        ["3320389550_81332_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_32_acp_thrifty;C4_6x7;100]",         
-         "2178308558_96468_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_64_acp_thrifty;C4_6x7;100]",
-         "1033603216_09110_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_128_acp_thrifty;C4_6x7;100]",
-         "0481443016_19054_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_256_acp_thrifty;C4_6x7;100]"],
-        ["0289058350_62100_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_32_acp_thrifty;C4_6x7;100]",
-         "3441944654_44532_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_64_acp_thrifty;C4_6x7;100]",
-         "0949310104_31134_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_128_acp_thrifty;C4_6x7;100]",
-         "0397149904_08374_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_256_acp_thrifty;C4_6x7;100]"]
-        ])
+    experiments_hs_array = query_experiments_array(FOLDER_EXPERIMENTS, "ai_b_n_trees", [1, 2, 4, 8], "ai_b_n_playouts", [32, 64, 128, 256],
+                                                   game_name="C4_6x7", ai_a_shortname="mcts_5_inf_vanilla", ai_b_search_time_limit=1.0, ai_b_variant="acp_thrifty")
     scores_array_plot_generator(experiments_hs_array, "$m$ (n_playouts)", "$T$ (n_trees)", [32, 64, 128, 256], [1, 2, 4, 8], "ACP-THRIFTY (1$\,$s) vs VANILLA (5$\,$s)", initial_player_flag)
 
 def scores_array_plot_acp_prodigal_vs_vanilla_c4(initial_player_flag=None):
     """Generates an array-like plot - a color map with averages of: scores, steps and depths - based on data from experiments: acp_prodigal vs vanilla (Connect 4)."""        
-    experiments_hs_array = np.array([
-        ["2586240854_62716_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_32_acp_prodigal;C4_6x7;100]",
-         "3722820440_90238_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_64_acp_prodigal;C4_6x7;100]",
-         "2273463942_77772_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_128_acp_prodigal;C4_6x7;100]",
-         "1349186310_72492_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_256_acp_prodigal;C4_6x7;100]"],
-        ["2565167576_10046_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_32_acp_prodigal;C4_6x7;100]",
-         "3701747162_70272_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_64_acp_prodigal;C4_6x7;100]",
-         "4018703846_35564_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_128_acp_prodigal;C4_6x7;100]",
-         "3094426214_62988_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_256_acp_prodigal;C4_6x7;100]"],
-        ["2523021020_04706_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_32_acp_prodigal;C4_6x7;100]",                  
-         "3659600606_64932_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_64_acp_prodigal;C4_6x7;100]",
-         "3214216358_16556_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_128_acp_prodigal;C4_6x7;100]",
-         "2289938726_11276_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_256_acp_prodigal;C4_6x7;100]"],
-        ["2438727908_26730_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_32_acp_prodigal;C4_6x7;100]",
-         "3575307494_54252_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_64_acp_prodigal;C4_6x7;100]",
-         "1605241382_13132_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_128_acp_prodigal;C4_6x7;100]",
-         "0680963750_07852_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_256_acp_prodigal;C4_6x7;100]"]
-        ])
+    experiments_hs_array = query_experiments_array(FOLDER_EXPERIMENTS, "ai_b_n_trees", [1, 2, 4, 8], "ai_b_n_playouts", [32, 64, 128, 256],
+                                                   game_name="C4_6x7", ai_a_shortname="mcts_5_inf_vanilla", ai_b_search_time_limit=1.0, ai_b_variant="acp_prodigal")
     scores_array_plot_generator(experiments_hs_array, "$m$ (n_playouts)", "$T$ (n_trees)", [32, 64, 128, 256], [1, 2, 4, 8], "ACP-PRODIGAL (1$\,$s) vs VANILLA (5$\,$s)", initial_player_flag)    
 
 def best_action_plot(moves_rounds_black, qs_black, ucbs_black, moves_rounds_white, qs_white, ucbs_white, 
@@ -240,24 +164,15 @@ def best_action_plot_generator(experiments_hs, game_index,
                                ucbs_factor=1.0, ucbs_black_color=None, ucbs_white_color=None):
     """Reads data from an experiment and generates a 'best action plot' by calling ``best_action_plot`` function."""
     print("BEST-ACTION-PLOT GENERATOR...") 
-    experiment_info = unzip_and_load_experiment(experiments_hs, FOLDER_EXPERIMENTS)
-    moves_rounds = experiment_info["games_infos"][str(game_index)]["moves_rounds"]
-    n_rounds = len(moves_rounds)
-    moves_rounds_black = []
-    qs_black = []
-    ucbs_black = []
-    moves_rounds_white = [] 
-    qs_white = []
-    ucbs_white = []
-    for m in range(n_rounds):
-        mr = moves_rounds[str(m + 1)]
-        moves_rounds_black.append(m + 1)
-        qs_black.append(mr["black_best_action_info"]["q"])
-        ucbs_black.append(mr["black_best_action_info"]["ucb"])
-        if "white_best_action_info" in mr:
-            moves_rounds_white.append(m + 1.5)
-            qs_white.append(mr["white_best_action_info"]["q"])
-            ucbs_white.append( mr["white_best_action_info"]["ucb"])
+    c = load_experiment_columns(experiments_hs, ["game", "round", "side", "best_q", "best_ucb"], FOLDER_EXPERIMENTS)
+    black_rows = (c["game"] == game_index) & (c["side"] == 1)
+    white_rows = (c["game"] == game_index) & (c["side"] == -1)
+    moves_rounds_black = list(c["round"][black_rows])
+    qs_black = list(c["best_q"][black_rows])
+    ucbs_black = list(c["best_ucb"][black_rows])
+    moves_rounds_white = list(c["round"][white_rows] + 0.5)
+    qs_white = list(c["best_q"][white_rows])
+    ucbs_white = list(c["best_ucb"][white_rows])
     print("BEST-ACTION-PLOT GENERATOR DONE.")
     best_action_plot(moves_rounds_black, qs_black, ucbs_black, moves_rounds_white, qs_white, ucbs_white, 
                      label_qs_black, label_ucbs_black, label_qs_white, label_ucbs_white, label_x, label_y, title_1, title_2, ucbs_factor, ucbs_black_color, ucbs_white_color)    
@@ -302,152 +217,89 @@ def depths_plot(moves_rounds_black, mean_depths_black, max_depths_black, moves_r
 def depths_plot_generator(experiments_hs, game_index, 
                           label_mean_depths_black, label_max_depths_black, label_mean_depths_white, label_max_depths_white, label_x, label_y, title_1, title_2):
     """Reads data from an experiment and generates a 'depths plot' by calling ``best_action_plot`` function."""    
-    experiment_info = unzip_and_load_experiment(experiments_hs, FOLDER_EXPERIMENTS)
-    moves_rounds = experiment_info["games_infos"][str(game_index)]["moves_rounds"]
-    n_rounds = len(moves_rounds)
-    moves_rounds_black = []
-    mean_depths_black = []
-    max_depths_black = []
-    moves_rounds_white = []     
-    mean_depths_white = []
-    max_depths_white = []
-    for m in range(n_rounds):
-        mr = moves_rounds[str(m + 1)]
-        moves_rounds_black.append(m + 1)
-        trees_key = "trees" if "trees" in mr["black_performance_info"] else "tree"        
-        mean_depths_black.append(mr["black_performance_info"][trees_key]["mean_depth"])
-        max_depths_black.append(mr["black_performance_info"][trees_key]["max_depth"])
-        if "white_best_action_info" in mr:
-            moves_rounds_white.append(m + 1.5)
-            trees_key = "trees" if "trees" in mr["white_performance_info"] else "tree"        
-            mean_depths_white.append(mr["white_performance_info"][trees_key]["mean_depth"])
-            max_depths_white.append(mr["white_performance_info"][trees_key]["max_depth"])
+    c = load_experiment_columns(experiments_hs, ["game", "round", "side", "mean_depth", "max_depth"], FOLDER_EXPERIMENTS)
+    black_rows = (c["game"] == game_index) & (c["side"] == 1)
+    white_rows = (c["game"] == game_index) & (c["side"] == -1)
+    moves_rounds_black = list(c["round"][black_rows])
+    mean_depths_black = list(c["mean_depth"][black_rows])
+    max_depths_black = list(c["max_depth"][black_rows])
+    moves_rounds_white = list(c["round"][white_rows] + 0.5)
+    mean_depths_white = list(c["mean_depth"][white_rows])
+    max_depths_white = list(c["max_depth"][white_rows])
     depths_plot(moves_rounds_black, mean_depths_black, max_depths_black, moves_rounds_white, mean_depths_white, max_depths_white, 
                 label_mean_depths_black, label_max_depths_black, label_mean_depths_white, label_max_depths_white, label_x, label_y, title_1, title_2)
 
+def _main_player_columns(experiment_hs, folder, ai_instance_name):
+    """Reduces an experiment to columns: playouts, steps, mean and maximum depths, restricted to moves of the player with given string representation (for ``averages_printout_generator``)."""
+    c = load_experiment_columns(experiment_hs, ["games_white", "game", "side", "playouts", "steps", "mean_depth", "max_depth"], folder)
+    games_main_side = np.where(c["games_white"] == ai_instance_name, -1, 1)
+    main_rows = c["side"] == games_main_side[c["game"] - 1]
+    return {name: c[name][main_rows] for name in ["playouts", "steps", "mean_depth", "max_depth"]}
+
+def _query_experiments_of_series(ai_shortname, game_name, search_time_limit):
+    """Returns the array of hash strings of experiments (100 games each) in which an AI given by its short name plays against any AI, both with the given search time limit."""
+    experiments_hs = query_experiments(FOLDER_EXPERIMENTS, ai_shortname=ai_shortname, game_name=game_name, n_games=100, 
+                                       ai_a_search_time_limit=search_time_limit, ai_b_search_time_limit=search_time_limit)
+    if len(experiments_hs) == 0:
+        sys.exit(f"[_query_experiments_of_series(): exiting due to no experiments matching: {ai_shortname}, {game_name}, {search_time_limit}]")
+    return np.array(experiments_hs)
+
 def averages_printout_generator(experiments_hs_array, ai_instance_name):
     """Prints out averages of: playouts / steps and mean / maximum depths for a given series of experiments.""" 
     print("AVERAGES PRINTOUT...")
-    playouts = []
-    steps = []            
-    mean_depths = []
-    max_depths = []            
-    for i in range(experiments_hs_array.shape[0]):
-        experiment_info = unzip_and_load_experiment(experiments_hs_array[i], FOLDER_EXPERIMENTS)
-        n_games = experiment_info["matchup_info"]["n_games"]
-        for g in range(n_games):            
-            main_player_prefix = "white_" if experiment_info["games_infos"][str(g + 1)]["white"] == ai_instance_name else "black_"            
-            moves_rounds = experiment_info["games_infos"][str(g + 1)]["moves_rounds"]
-            for m in range(len(moves_rounds)):
-                moves_round = moves_rounds[str(m + 1)]
-                mppi = main_player_prefix + "performance_info"
-                if mppi in moves_round:
-                    playouts.append(moves_round[mppi]["playouts"])
-                    steps.append(moves_round[mppi]["steps"])
-                    trees_key = "trees" if "trees" in moves_round[mppi] else "tree"
-                    mean_depths.append(moves_round[mppi][trees_key]["mean_depth"])
-                    max_depths.append(moves_round[mppi][trees_key]["max_depth"])
-    print(f"THE AVERAGES -> PLAYOUTS/STEPS: {np.mean(playouts)}/{np.mean(steps)}, MEAN DEPTH/MAX DEPTH: {np.mean(mean_depths)}/{np.mean(max_depths)}")
+    columns = map_experiments(partial(_main_player_columns, ai_instance_name=ai_instance_name), experiments_hs_array, FOLDER_EXPERIMENTS, N_WORKERS)
+    means = {name: np.mean(np.concatenate([c[name] for c in columns])) for name in ["playouts", "steps", "mean_depth", "max_depth"]}
+    print(f"THE AVERAGES -> PLAYOUTS/STEPS: {means['playouts']}/{means['steps']}, MEAN DEPTH/MAX DEPTH: {means['mean_depth']}/{means['max_depth']}")
     print("AVERAGES PRINTOUT GENERATOR DONE.")
 
 def averages_printout_5s_vanilla_c4():
     """Prints out averages of: playouts / steps and mean / maximum depths for experiments involving: 5s vanilla (Connect 4)."""    
-    averages_printout_generator(np.array([
-        "2959981740_01490_048_[mcts_5_inf_vanilla;mctsnc_5_inf_4_128_ocp_thrifty;C4_6x7;100]",
-        "2749967598_89204_048_[mcts_5_inf_vanilla;mctsnc_5_inf_4_256_ocp_prodigal;C4_6x7;100]",
-        "0725584456_47630_048_[mcts_5_inf_vanilla;mctsnc_5_inf_4_256_acp_thrifty;C4_6x7;100]",
-        "0503747630_89908_048_[mcts_5_inf_vanilla;mctsnc_5_inf_4_256_acp_prodigal;C4_6x7;100]"
-        ]), 
+    averages_printout_generator(_query_experiments_of_series("mcts_5_inf_vanilla", "C4_6x7", 5.0), 
         "MCTS(search_time_limit=5.0, search_steps_limit=inf, vanilla=True, ucb_c=2.0, seed: 0)")    
     
 def averages_printout_5s_ocp_thrifty_c4():
     """Prints out averages of: playouts / steps and mean / maximum depths for experiments involving: 5s ocp_thrifty (Connect 4)."""    
-    averages_printout_generator(np.array([
-        "2959981740_01490_048_[mcts_5_inf_vanilla;mctsnc_5_inf_4_128_ocp_thrifty;C4_6x7;100]",
-        "1311471072_93670_048_[mctsnc_5_inf_4_128_ocp_thrifty;mctsnc_5_inf_4_256_ocp_prodigal;C4_6x7;100]",
-        "3070453690_29088_048_[mctsnc_5_inf_4_128_ocp_thrifty;mctsnc_5_inf_4_256_acp_thrifty;C4_6x7;100]",
-        "3360218400_94374_048_[mctsnc_5_inf_4_128_ocp_thrifty;mctsnc_5_inf_4_256_acp_prodigal;C4_6x7;100]"
-        ]), 
+    averages_printout_generator(_query_experiments_of_series("mctsnc_5_inf_4_128_ocp_thrifty", "C4_6x7", 5.0), 
         "MCTSNC(search_time_limit=5.0, search_steps_limit=inf, n_trees=4, n_playouts=128, variant='ocp_thrifty', device_memory=2.0, ucb_c=2.0, seed: 0)")  
 
 def averages_printout_5s_ocp_prodigal_c4():
     """Prints out averages of: playouts / steps and mean / maximum depths for experiments involving: 5s ocp_prodigal (Connect 4)."""    
-    averages_printout_generator(np.array([
-        "2749967598_89204_048_[mcts_5_inf_vanilla;mctsnc_5_inf_4_256_ocp_prodigal;C4_6x7;100]",
-        "1311471072_93670_048_[mctsnc_5_inf_4_128_ocp_thrifty;mctsnc_5_inf_4_256_ocp_prodigal;C4_6x7;100]",
-        "0995822742_91740_048_[mctsnc_5_inf_4_256_ocp_prodigal;mctsnc_5_inf_4_256_acp_thrifty;C4_6x7;100]",
-        "2504702716_35906_048_[mctsnc_5_inf_4_256_ocp_prodigal;mctsnc_5_inf_4_256_acp_prodigal;C4_6x7;100]"
-        ]), 
+    averages_printout_generator(_query_experiments_of_series("mctsnc_5_inf_4_256_ocp_prodigal", "C4_6x7", 5.0), 
         "MCTSNC(search_time_limit=5.0, search_steps_limit=inf, n_trees=4, n_playouts=256, variant='ocp_prodigal', device_memory=2.0, ucb_c=2.0, seed: 0)")
     
 def averages_printout_5s_acp_thrifty_c4():
     """Prints out averages of: playouts / steps and mean / maximum depths for experiments involving: 5s acp_thrifty (Connect 4)."""    
-    averages_printout_generator(np.array([        
-        "0725584456_47630_048_[mcts_5_inf_vanilla;mctsnc_5_inf_4_256_acp_thrifty;C4_6x7;100]",
-        "3070453690_29088_048_[mctsnc_5_inf_4_128_ocp_thrifty;mctsnc_5_inf_4_256_acp_thrifty;C4_6x7;100]",
-        "0995822742_91740_048_[mctsnc_5_inf_4_256_ocp_prodigal;mctsnc_5_inf_4_256_acp_thrifty;C4_6x7;100]",
-        "3763533572_41898_048_[mctsnc_5_inf_4_256_acp_thrifty;mctsnc_5_inf_4_256_acp_prodigal;C4_6x7;100]"
-        ]), 
+    averages_printout_generator(_query_experiments_of_series("mctsnc_5_inf_4_256_acp_thrifty", "C4_6x7", 5.0), 
         "MCTSNC(search_time_limit=5.0, search_steps_limit=inf, n_trees=4, n_playouts=256, variant='acp_thrifty', device_memory=2.0, ucb_c=2.0, seed: 0)")    
 
 def averages_printout_5s_acp_prodigal_c4():
     """Prints out averages of: playouts / steps and mean / maximum depths for experiments involving: 5s acp_prodigal (Connect 4)."""    
-    averages_printout_generator(np.array([
-        "0503747630_89908_048_[mcts_5_inf_vanilla;mctsnc_5_inf_4_256_acp_prodigal;C4_6x7;100]",
-        "3360218400_94374_048_[mctsnc_5_inf_4_128_ocp_thrifty;mctsnc_5_inf_4_256_acp_prodigal;C4_6x7;100]",
-        "2504702716_35906_048_[mctsnc_5_inf_4_256_ocp_prodigal;mctsnc_5_inf_4_256_acp_prodigal;C4_6x7;100]",
-        "3763533572_41898_048_[mctsnc_5_inf_4_256_acp_thrifty;mctsnc_5_inf_4_256_acp_prodigal;C4_6x7;100]"
-        ]), 
+    averages_printout_generator(_query_experiments_of_series("mctsnc_5_inf_4_256_acp_prodigal", "C4_6x7", 5.0), 
         "MCTSNC(search_time_limit=5.0, search_steps_limit=inf, n_trees=4, n_playouts=256, variant='acp_prodigal', device_memory=2.0, ucb_c=2.0, seed: 0)")
 
 def averages_printout_30s_vanilla_gomoku():
     """Prints out averages of: playouts / steps and mean / maximum depths for experiments involving: 30s vanilla (Gomoku)."""
-    averages_printout_generator(np.array([
-        "3014955156_02650_048_[mcts_30_inf_vanilla;mctsnc_30_inf_4_128_ocp_thrifty_16g;Gomoku_15x15;100]",
-        "1681612016_34230_048_[mcts_30_inf_vanilla;mctsnc_30_inf_4_256_ocp_prodigal_16g;Gomoku_15x15;100]",
-        "4070724948_30746_048_[mcts_30_inf_vanilla;mctsnc_30_inf_4_256_acp_thrifty_16g;Gomoku_15x15;100]",
-        "3240654036_09850_048_[mcts_30_inf_vanilla;mctsnc_30_inf_4_256_acp_prodigal_16g;Gomoku_15x15;100]"
-        ]), 
+    averages_printout_generator(_query_experiments_of_series("mcts_30_inf_vanilla", "Gomoku_15x15", 30.0), 
         "MCTS(search_time_limit=30.0, search_steps_limit=inf, vanilla=True, ucb_c=2.0, seed: 0)")
 
 def averages_printout_30s_ocp_thrifty_gomoku():
     """Prints out averages of: playouts / steps and mean / maximum depths for experiments involving: 30s ocp_thrifty (Gomoku)."""
-    averages_printout_generator(np.array([
-        "3014955156_02650_048_[mcts_30_inf_vanilla;mctsnc_30_inf_4_128_ocp_thrifty_16g;Gomoku_15x15;100]",
-        "4039933000_53870_048_[mctsnc_30_inf_4_128_ocp_thrifty_16g;mctsnc_30_inf_4_256_ocp_prodigal_16g;Gomoku_15x15;100]",
-        "2602789548_96434_048_[mctsnc_30_inf_4_128_ocp_thrifty_16g;mctsnc_30_inf_4_256_acp_thrifty_16g;Gomoku_15x15;100]",
-        "1304007724_29490_048_[mctsnc_30_inf_4_128_ocp_thrifty_16g;mctsnc_30_inf_4_256_acp_prodigal_16g;Gomoku_15x15;100]"
-        ]), 
+    averages_printout_generator(_query_experiments_of_series("mctsnc_30_inf_4_128_ocp_thrifty_16g", "Gomoku_15x15", 30.0), 
         "MCTSNC(search_time_limit=30.0, search_steps_limit=inf, n_trees=4, n_playouts=128, variant='ocp_thrifty', device_memory=16.0, ucb_c=2.0, seed: 0)")
 
 def averages_printout_30s_ocp_prodigal_gomoku():
     """Prints out averages of: playouts / steps and mean / maximum depths for experiments involving: 30s ocp_prodigal (Gomoku)."""
-    averages_printout_generator(np.array([
-        "1681612016_34230_048_[mcts_30_inf_vanilla;mctsnc_30_inf_4_256_ocp_prodigal_16g;Gomoku_15x15;100]",
-        "4039933000_53870_048_[mctsnc_30_inf_4_128_ocp_thrifty_16g;mctsnc_30_inf_4_256_ocp_prodigal_16g;Gomoku_15x15;100]",
-        "1988707178_17328_048_[mctsnc_30_inf_4_256_ocp_prodigal_16g;mctsnc_30_inf_4_256_acp_thrifty_16g;Gomoku_15x15;100]",
-        "3876337002_15280_048_[mctsnc_30_inf_4_256_ocp_prodigal_16g;mctsnc_30_inf_4_256_acp_prodigal_16g;Gomoku_15x15;100]"
-        ]), 
+    averages_printout_generator(_query_experiments_of_series("mctsnc_30_inf_4_256_ocp_prodigal_16g", "Gomoku_15x15", 30.0), 
         "MCTSNC(search_time_limit=30.0, search_steps_limit=inf, n_trees=4, n_playouts=256, variant='ocp_prodigal', device_memory=16.0, ucb_c=2.0, seed: 0)")
 
 def averages_printout_30s_acp_thrifty_gomoku():
     """Prints out averages of: playouts / steps and mean / maximum depths for experiments involving: 30s acp_thrifty (Gomoku)."""
-    averages_printout_generator(np.array([
-        "4070724948_30746_048_[mcts_30_inf_vanilla;mctsnc_30_inf_4_256_acp_thrifty_16g;Gomoku_15x15;100]",
-        "2602789548_96434_048_[mctsnc_30_inf_4_128_ocp_thrifty_16g;mctsnc_30_inf_4_256_acp_thrifty_16g;Gomoku_15x15;100]",
-        "1988707178_17328_048_[mctsnc_30_inf_4_256_ocp_prodigal_16g;mctsnc_30_inf_4_256_acp_thrifty_16g;Gomoku_15x15;100]",
-        "2094160108_21298_048_[mctsnc_30_inf_4_256_acp_thrifty_16g;mctsnc_30_inf_4_256_acp_prodigal_16g;Gomoku_15x15;100]"
-        ]), 
+    averages_printout_generator(_query_experiments_of_series("mctsnc_30_inf_4_256_acp_thrifty_16g", "Gomoku_15x15", 30.0), 
         "MCTSNC(search_time_limit=30.0, search_steps_limit=inf, n_trees=4, n_playouts=256, variant='acp_thrifty', device_memory=16.0, ucb_c=2.0, seed: 0)")
 
 def averages_printout_30s_acp_prodigal_gomoku():
     """Prints out averages of: playouts / steps and mean / maximum depths for experiments involving: 30s acp_prodigal (Gomoku)."""
-    averages_printout_generator(np.array([
-        "3240654036_09850_048_[mcts_30_inf_vanilla;mctsnc_30_inf_4_256_acp_prodigal_16g;Gomoku_15x15;100]",
-        "1304007724_29490_048_[mctsnc_30_inf_4_128_ocp_thrifty_16g;mctsnc_30_inf_4_256_acp_prodigal_16g;Gomoku_15x15;100]",
-        "3876337002_15280_048_[mctsnc_30_inf_4_256_ocp_prodigal_16g;mctsnc_30_inf_4_256_acp_prodigal_16g;Gomoku_15x15;100]",
-        "2094160108_21298_048_[mctsnc_30_inf_4_256_acp_thrifty_16g;mctsnc_30_inf_4_256_acp_prodigal_16g;Gomoku_15x15;100]"
-        ]), 
+    averages_printout_generator(_query_experiments_of_series("mctsnc_30_inf_4_256_acp_prodigal_16g", "Gomoku_15x15", 30.0), 
         "MCTSNC(search_time_limit=30.0, search_steps_limit=inf, n_trees=4, n_playouts=256, variant='acp_prodigal', device_memory=16.0, ucb_c=2.0, seed: 0)")
     
 def playouts_per_second_plot(n_plots, label_x, label_y, ticks_x, n_trees_values, title, label_prefix, label_suffix, data_pps, ref_label, ref_pps_avg):
@@ -484,99 +336,47 @@ def playouts_per_second_plot(n_plots, label_x, label_y, ticks_x, n_trees_values,
     plt.tight_layout(pad=0.4) 
     plt.show()    
 
+def _playouts_per_second_summary(experiment_hs, folder):
+    """Reduces an experiment to a summary needed by ``playouts_per_second_plot_generator``: mean playouts per second of main player (B) and raw values for reference player (A)."""
+    c = load_experiment_columns(experiment_hs, ["game", "side", "playouts_per_second"], folder)
+    main_side = np.where(c["game"] % 2 == 1, -1, 1) # main player (B) is white in odd games
+    return {"pps": np.mean(c["playouts_per_second"][c["side"] == main_side]), "ref_pps": c["playouts_per_second"][c["side"] == -main_side]}
+
 def playouts_per_second_plot_generator(experiments_hs_array, label_x, label_y, ticks_x, n_trees_values, title, label_prefix, label_suffix, ref_label):
     """Reads data from several experiments, computes averages of 'playouts per second' quantity, and generates a plot by calling ``playouts_per_second_plot`` function."""
     print("PLAYOUTS-PER-SECOND-PLOT GENERATOR...")    
-    data_pps = np.zeros(experiments_hs_array.shape)     
-    ref_pps = []
-    for i in range(experiments_hs_array.shape[0]):
-        for j in range(experiments_hs_array.shape[1]):
-            experiment_info = unzip_and_load_experiment(experiments_hs_array[i, j], FOLDER_EXPERIMENTS)
-            n_games = experiment_info["matchup_info"]["n_games"]
-            pps = []
-            for g in range(n_games):
-                moves_rounds = experiment_info["games_infos"][str(g + 1)]["moves_rounds"]
-                main_player_prefix = "white_" if g % 2 == 0 else "black_"
-                ref_player_prefix = "white_" if g % 2 == 1 else "black_"
-                for m in range(len(moves_rounds)):
-                    moves_round = moves_rounds[str(m + 1)]
-                    mppi = main_player_prefix + "performance_info"
-                    if mppi in moves_round:
-                        pps.append(moves_round[mppi]["playouts_per_second"])
-                    rppi = ref_player_prefix + "performance_info"
-                    if rppi in moves_round:
-                        ref_pps.append(moves_round[rppi]["playouts_per_second"])
-            data_pps[i, j] = np.mean(pps) 
-    ref_pps_avg = np.mean(ref_pps)
+    summaries = map_experiments(_playouts_per_second_summary, experiments_hs_array, FOLDER_EXPERIMENTS, N_WORKERS)
+    data_pps = np.vectorize(lambda summary: summary["pps"], otypes=[np.float64])(summaries)
+    ref_pps_avg = np.mean(np.concatenate([summary["ref_pps"] for summary in summaries.ravel()]))
     print(f"[reference player playouts per second: {ref_pps_avg}]")
     print("PLAYOUTS-PER-SECOND-PLOT GENERATOR DONE.")
     playouts_per_second_plot(experiments_hs_array.shape[0], label_x, label_y, ticks_x, n_trees_values, title, label_prefix, label_suffix, data_pps, ref_label, ref_pps_avg)
 
 def playouts_per_second_plot_acp_prodigal_vs_vanilla_c4():
     """Generates a series of plots with 'playouts per second' quantity (in logarithmic scale) based on data from experiments: acp_prodigal vs vanilla (Connect 4)."""        
-    experiments_hs_array = np.array([
-        ["2586240854_62716_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_32_acp_prodigal;C4_6x7;100]",
-         "3722820440_90238_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_64_acp_prodigal;C4_6x7;100]",
-         "2273463942_77772_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_128_acp_prodigal;C4_6x7;100]",
-         "1349186310_72492_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_256_acp_prodigal;C4_6x7;100]"],
-        ["2565167576_10046_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_32_acp_prodigal;C4_6x7;100]",
-         "3701747162_70272_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_64_acp_prodigal;C4_6x7;100]",
-         "4018703846_35564_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_128_acp_prodigal;C4_6x7;100]",
-         "3094426214_62988_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_256_acp_prodigal;C4_6x7;100]"],
-        ["2523021020_04706_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_32_acp_prodigal;C4_6x7;100]",                  
-         "3659600606_64932_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_64_acp_prodigal;C4_6x7;100]",
-         "3214216358_16556_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_128_acp_prodigal;C4_6x7;100]",
-         "2289938726_11276_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_256_acp_prodigal;C4_6x7;100]"],
-        ["2438727908_26730_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_32_acp_prodigal;C4_6x7;100]",
-         "3575307494_54252_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_64_acp_prodigal;C4_6x7;100]",
-         "1605241382_13132_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_128_acp_prodigal;C4_6x7;100]",
-         "0680963750_07852_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_256_acp_prodigal;C4_6x7;100]"]
-        ])
+    experiments_hs_array = query_experiments_array(FOLDER_EXPERIMENTS, "ai_b_n_trees", [1, 2, 4, 8], "ai_b_n_playouts", [32, 64, 128, 256],
+                                                   game_name="C4_6x7", ai_a_shortname="mcts_5_inf_vanilla", ai_b_search_time_limit=1.0, ai_b_variant="acp_prodigal")
     playouts_per_second_plot_generator(experiments_hs_array, "$m$ (n_playouts)", "AVGS. OF PLAYOUTS PER SECOND", [32, 64, 128, 256], [1, 2, 4, 8], 
                                        "CONNECT 4: ACP-PRODIGAL (1$\,$s) vs VANILLA (5$\,$s)", "MCTS-NC_1_INF", "ACP_PRODIGAL", "MCTS_5_INF_VANILLA (REFERENCE)")    
 
 def playouts_per_second_plot_ocp_prodigal_vs_vanilla_c4():
     """Generates a series of plots with 'playouts per second' quantity (in logarithmic scale) based on data from experiments: ocp_prodigal vs vanilla (Connect 4)."""    
-    experiments_hs_array = np.array([
-        ["3195982906_82784_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_32_ocp_prodigal;C4_6x7;100]",
-         "0037595196_43010_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_64_ocp_prodigal;C4_6x7;100]",
-         "0224716614_77068_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_128_ocp_prodigal;C4_6x7;100]",
-         "3595406278_71788_048_[mcts_5_inf_vanilla;mctsnc_1_inf_1_256_ocp_prodigal;C4_6x7;100]"],
-        ["3174909628_30114_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_32_ocp_prodigal;C4_6x7;100]",
-         "0016521918_90340_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_64_ocp_prodigal;C4_6x7;100]",
-         "1969956518_67564_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_128_ocp_prodigal;C4_6x7;100]",
-         "1045678886_62284_048_[mcts_5_inf_vanilla;mctsnc_1_inf_2_256_ocp_prodigal;C4_6x7;100]"],
-        ["3132763072_24774_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_32_ocp_prodigal;C4_6x7;100]",         
-         "4269342658_85000_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_64_ocp_prodigal;C4_6x7;100]",
-         "1165469030_15852_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_128_ocp_prodigal;C4_6x7;100]",
-         "0241191398_10572_048_[mcts_5_inf_vanilla;mctsnc_1_inf_4_256_ocp_prodigal;C4_6x7;100]"],
-        ["3048469960_46798_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_32_ocp_prodigal;C4_6x7;100]",
-         "4185049546_07024_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_64_ocp_prodigal;C4_6x7;100]",
-         "3851461350_45132_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_128_ocp_prodigal;C4_6x7;100]",
-         "2927183718_39852_048_[mcts_5_inf_vanilla;mctsnc_1_inf_8_256_ocp_prodigal;C4_6x7;100]"]
-        ])
+    experiments_hs_array = query_experiments_array(FOLDER_EXPERIMENTS, "ai_b_n_trees", [1, 2, 4, 8], "ai_b_n_playouts", [32, 64, 128, 256],
+                                                   game_name="C4_6x7", ai_a_shortname="mcts_5_inf_vanilla", ai_b_search_time_limit=1.0, ai_b_variant="ocp_prodigal")
     playouts_per_second_plot_generator(experiments_hs_array, "$m$ (n_playouts)", "AVGS. OF PLAYOUTS PER SECOND", [32, 64, 128, 256], [1, 2, 4, 8], 
                                        "CONNECT 4: OCP-PRODIGAL (1$\,$s) vs VANILLA (5$\,$s)", "MCTS-NC_1_INF", "OCP_PRODIGAL", "MCTS_5_INF_VANILLA (REFERENCE)")
     
 def stats_detailed_printout(experiment_hs):
     """Prints out stats (with side-dependency distinction) for a given experiment.""" 
     print("STATS DETAILED PRINTOUT...")
-    a_first_outcomes = []
-    a_second_outcomes = []
-    b_first_outcomes = []
-    b_second_outcomes = []    
-    experiment_info = unzip_and_load_experiment(experiment_hs, FOLDER_EXPERIMENTS)
-    print("MATCH-UP INFO:\n" + dict_to_str(experiment_info["matchup_info"]))
-    print("STATS:\n" + dict_to_str(experiment_info["stats"]))
-    n_games = experiment_info["matchup_info"]["n_games"]
-    for g in range(n_games):            
-        outcome = int(experiment_info["games_infos"][str(g + 1)]["outcome"]) * 0.5 + 0.5
-        if g % 2 == 0:            
-            a_first_outcomes.append(outcome)
-            b_second_outcomes.append(1.0 - outcome)
-        else:
-            a_second_outcomes.append(1.0 - outcome)
-            b_first_outcomes.append(outcome)            
+    c = load_experiment_columns(experiment_hs, ["meta", "games_outcome"], FOLDER_EXPERIMENTS)
+    print("MATCH-UP INFO:\n" + dict_to_str(c["meta"]["matchup_info"]))
+    print("STATS:\n" + dict_to_str(c["meta"]["stats"]))
+    outcomes = c["games_outcome"] * 0.5 + 0.5
+    a_first_outcomes = outcomes[0::2]
+    b_second_outcomes = 1.0 - outcomes[0::2]
+    a_second_outcomes = 1.0 - outcomes[1::2]
+    b_first_outcomes = outcomes[1::2]
     print(f"SIDE A STATS DETAILED -> FIRST: {np.mean(a_first_outcomes)}, SECOND: {np.mean(a_second_outcomes)}")
     print(f"SIDE B STATS DETAILED -> FIRST: {np.mean(b_first_outcomes)}, SECOND: {np.mean(b_second_outcomes)}")
     print("STATS DETAILED PRINTOUT DONE.")    
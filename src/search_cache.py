@@ -0,0 +1,200 @@
+"""
+Auxiliary module with a cache of search results (``actions_info`` of AIs) across games, keyed by positions and engine configurations.
+In matches of many games between engines with deterministic seeds, identical positions (especially early ones) recur across games; with the cache, a repeated position
+(searched before by an equally configured AI) gets its answer at once - at the price of the exact reproducibility of search budgets (hence, reproduced experiments do not use it).
+
+Keys combine the game (class representation), the engine configuration (string representation of the AI instance, i.e. its limits, variant, seed, etc.) and the 64-bit hash
+of the position (``position_hash`` from :doc:`utils`). Class ``SearchCache`` keeps up to ``capacity`` entries in memory with LRU (least recently used) eviction;
+optionally (``fpath`` given), evicted entries spill to a ``shelve`` file on disk, consulted on misses in memory, and all entries are flushed to it on ``close`` - so that the cache persists across runs.
+The cache is consulted by :doc:`game_runner` (book moves, see :doc:`opening_book`, taking precedence). Copies of the cache passed to worker processes (pickled) open the file read-only
+and keep their own memory entries; entries put into a copy are also collected as new ones, sent back to the main process along with results of each game and merged into the owner cache
+(see :doc:`match_runner`). While workers run, the owner keeps its file closed (``suspend_file``, ``resume_file``), so that there are no concurrent writes and readers.
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import dbm
+import shelve
+from collections import OrderedDict
+from utils import position_hash
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+class SearchCache:
+    """
+    Cache of search results (``actions_info`` of AIs) keyed by positions and engine configurations, with LRU eviction and optional spilling to a ``shelve`` file.
+    """
+
+    DEFAULT_CAPACITY = 4096
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, fpath=None, read_only=False):
+        """
+        Constructor of ``SearchCache`` instances.
+
+        Args:
+            capacity (int):
+                maximum number of entries kept in memory, defaults to ``4096``.
+            fpath (str):
+                path of the ``shelve`` file for spilled (and persisted) entries or ``None`` for a memory-only cache, defaults to ``None``.
+            read_only (bool):
+                flag indicating whether the file is only read (no spilling, no flushing), e.g. for copies of the cache in worker processes, defaults to ``False``.
+        """
+        self.capacity = capacity
+        self.fpath = fpath
+        self.read_only = read_only
+        self.entries = OrderedDict()
+        self.shelf = None
+        if fpath is not None:
+            if not read_only:
+                self.shelf = shelve.open(fpath, flag="c")
+            elif dbm.whichdb(fpath):
+                self.shelf = shelve.open(fpath, flag="r")
+        self.new_entries = [] # entries put into a read-only copy, to be sent to the owner of the cache
+        self.evicted = {} # entries evicted while the file is suspended, to be spilled on resume
+        self.n_hits = 0
+        self.n_misses = 0
+
+    def __str__(self):
+        """
+        Returns a string representation of this ``SearchCache`` instance.
+
+        Returns:
+            str: string representation of this ``SearchCache`` instance.
+        """
+        return f"SearchCache(capacity={self.capacity}, fpath={self.fpath})"
+
+    def __repr__(self):
+        """
+        Returns a string representation of this ``SearchCache`` instance (equivalent to ``__str__`` method).
+
+        Returns:
+            str: string representation of this ``SearchCache`` instance.
+        """
+        return self.__str__()
+
+    def __len__(self):
+        """Returns the number of entries kept in memory."""
+        return len(self.entries)
+
+    def __getstate__(self):
+        """Returns the state for pickling (e.g. for worker processes) - settings only, the copy opens the file read-only and starts with no memory entries."""
+        return {"capacity": self.capacity, "fpath": self.fpath}
+
+    def __setstate__(self, state):
+        """Restores the cache from its pickled state (read-only file)."""
+        self.__init__(state["capacity"], state["fpath"], read_only=True)
+
+    def read_only_copy(self):
+        """Returns a copy of the cache with no memory entries, opening the file (if any) read-only - as a pickled copy, also when worker processes are forked rather than spawned."""
+        return SearchCache(self.capacity, self.fpath, read_only=True)
+
+    @staticmethod
+    def make_key(state, ai):
+        """
+        Returns the key of a position (state) searched by an AI.
+
+        Args:
+            state (State):
+                state (position) of a game.
+            ai (object):
+                AI instance (``MCTS`` or ``MCTSNC``), its configuration identified by its string representation.
+
+        Returns:
+            key (str):
+                key of the cache entry.
+        """
+        return f"{type(state).class_repr()}|{ai}|{position_hash(state.get_board(), state.get_extra_info(), state.get_turn()):016x}"
+
+    def get(self, key):
+        """
+        Returns the cached actions information for a key (marked as recently used) or ``None`` on a miss.
+
+        Args:
+            key (str):
+                key of the cache entry (see ``make_key``).
+
+        Returns:
+            actions_info (dict):
+                cached actions information or ``None``.
+        """
+        actions_info = self.entries.get(key)
+        if actions_info is not None:
+            self.entries.move_to_end(key)
+        elif key in self.evicted:
+            actions_info = self.evicted.pop(key)
+            self._insert(key, actions_info)
+        elif self.shelf is not None and key in self.shelf:
+            actions_info = self.shelf[key]
+            self._insert(key, actions_info)
+        if actions_info is None:
+            self.n_misses += 1
+        else:
+            self.n_hits += 1
+        return actions_info
+
+    def put(self, key, actions_info):
+        """
+        Caches actions information for a key, evicting the least recently used entry (spilled to the file, if any) when the capacity is exceeded.
+        In a read-only copy, the entry is also collected as a new one (see ``take_new_entries``).
+
+        Args:
+            key (str):
+                key of the cache entry (see ``make_key``).
+            actions_info (dict):
+                actions information resulting from a search.
+        """
+        self._insert(key, actions_info)
+        if self.read_only:
+            self.new_entries.append((key, actions_info))
+
+    def take_new_entries(self):
+        """Returns the list of (key, actions information) pairs put into this (read-only) copy since the last call, and forgets them."""
+        new_entries = self.new_entries
+        self.new_entries = []
+        return new_entries
+
+    def merge(self, entries):
+        """Caches (key, actions information) pairs, e.g. new entries of a copy in a worker process (see ``take_new_entries``)."""
+        for key, actions_info in entries:
+            self._insert(key, actions_info)
+
+    def _insert(self, key, actions_info):
+        """Inserts (or refreshes) an entry in memory and evicts the least recently used one if over capacity."""
+        self.entries[key] = actions_info
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            evicted_key, evicted_actions_info = self.entries.popitem(last=False)
+            if self.shelf is not None and not self.read_only:
+                self.shelf[evicted_key] = evicted_actions_info
+            elif self.fpath is not None and not self.read_only: # file suspended
+                self.evicted[evicted_key] = evicted_actions_info
+
+    def suspend_file(self):
+        """Flushes memory entries to the file (if any, and not read-only) and closes it, e.g. before worker processes open it for reading; entries evicted meanwhile are kept in memory."""
+        if self.shelf is not None and not self.read_only:
+            for key, actions_info in self.entries.items():
+                self.shelf[key] = actions_info
+            self.shelf.close()
+            self.shelf = None
+
+    def resume_file(self):
+        """Reopens the file suspended by ``suspend_file`` and spills entries evicted meanwhile to it."""
+        if self.fpath is not None and not self.read_only and self.shelf is None:
+            self.shelf = shelve.open(self.fpath, flag="c")
+            for key, actions_info in self.evicted.items():
+                self.shelf[key] = actions_info
+            self.evicted = {}
+
+    def close(self):
+        """Flushes memory entries to the file (if any, and not read-only) and closes it."""
+        print(f"SEARCH CACHE CLOSE... [{self}, hits: {self.n_hits}, misses: {self.n_misses}]")
+        if self.shelf is not None:
+            if not self.read_only:
+                for key, actions_info in self.entries.items():
+                    self.shelf[key] = actions_info
+            self.shelf.close()
+            self.shelf = None
+        print("SEARCH CACHE CLOSE DONE.")
@@ -0,0 +1,94 @@
+"""
+Auxiliary module with the sequential probability ratio test (SPRT) allowing to stop a match early, as soon as the results of games played so far
+are significant enough to decide between two hypotheses on the Elo difference between AI A and AI B:
+H0: ``elo = elo0`` against H1: ``elo = elo1`` (typically ``elo0 < elo1``), with error probabilities ``alpha`` (of accepting H1 when H0 holds) and ``beta`` (of accepting H0 when H1 holds).
+The log-likelihood ratio is computed by means of the normal (trinomial) approximation with respect to scores of games (1 - win, 0.5 - draw, 0 - loss),
+as commonly used in engine testing frameworks.
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+def elo_to_score(elo):
+    """Returns the expected score (in [0, 1]) for a player with given Elo advantage (logistic model)."""
+    return 1.0 / (1.0 + 10.0**(-elo / 400.0))
+
+def sprt_bounds(alpha, beta):
+    """Returns the lower and upper bounds for the log-likelihood ratio (Wald's bounds); crossing the lower one accepts H0, crossing the upper one accepts H1."""
+    return np.log(beta / (1.0 - alpha)), np.log((1.0 - beta) / alpha)
+
+def sprt_llr(wins, draws, losses, elo0, elo1):
+    """
+    Returns the log-likelihood ratio of H1: ``elo = elo1`` against H0: ``elo = elo0`` for given results of games (normal approximation).
+    The variance of scores is computed with half a game added to each kind of result, so that the ratio stays finite for uniform results (e.g. wins only).
+
+    Args:
+        wins (int):
+            number of games won (by the player under test).
+        draws (int):
+            number of games drawn.
+        losses (int):
+            number of games lost.
+        elo0 (float):
+            Elo difference under hypothesis H0.
+        elo1 (float):
+            Elo difference under hypothesis H1.
+
+    Returns:
+        llr (float):
+            log-likelihood ratio.
+    """
+    n = wins + draws + losses
+    if n == 0:
+        return 0.0
+    score = (wins + 0.5 * draws) / n
+    counts = np.array([wins, draws, losses], dtype=np.float64) + 0.5
+    values = np.array([1.0, 0.5, 0.0])
+    score_reg = np.sum(counts * values) / np.sum(counts)
+    var = np.sum(counts * (values - score_reg)**2) / np.sum(counts)
+    score0 = elo_to_score(elo0)
+    score1 = elo_to_score(elo1)
+    return float((score1 - score0) * (2.0 * score - score0 - score1) * n / (2.0 * var))
+
+def sprt_decision(scores, elo0, elo1, alpha, beta, min_games=1):
+    """
+    Evaluates the sequential probability ratio test on scores of games played so far.
+
+    Args:
+        scores (array-like):
+            scores of games played so far by the player under test (1.0 - win, 0.5 - draw, 0.0 - loss).
+        elo0 (float):
+            Elo difference under hypothesis H0.
+        elo1 (float):
+            Elo difference under hypothesis H1.
+        alpha (float):
+            probability of accepting H1 when H0 holds.
+        beta (float):
+            probability of accepting H0 when H1 holds.
+        min_games (int):
+            minimal number of games before any decision can be made, defaults to ``1``.
+
+    Returns:
+        sprt_info (dict):
+            dictionary with the log-likelihood ratio (``"llr"``), its bounds (``"lower_bound"``, ``"upper_bound"``), the number of games (``"n_games"``)
+            and the decision (``"decision"``): ``"H0"``, ``"H1"`` or ``None`` if the match should go on.
+    """
+    scores = np.asarray(scores)
+    wins = int(np.sum(scores == 1.0))
+    draws = int(np.sum(scores == 0.5))
+    losses = int(np.sum(scores == 0.0))
+    llr = sprt_llr(wins, draws, losses, elo0, elo1)
+    lower_bound, upper_bound = sprt_bounds(alpha, beta)
+    decision = None
+    if scores.size >= min_games:
+        if llr <= lower_bound:
+            decision = "H0"
+        elif llr >= upper_bound:
+            decision = "H1"
+    return {"llr": llr, "lower_bound": float(lower_bound), "upper_bound": float(upper_bound), "n_games": int(scores.size), "decision": decision}
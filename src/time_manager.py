@@ -0,0 +1,175 @@
+"""
+Auxiliary module with time management for AIs (``MCTS`` from :doc:`mcts` or ``MCTSNC`` from :doc:`mctsnc`) playing with a total game clock, rather than with a fixed ``search_time_limit`` per move.
+Class ``TimeManager`` drives searches via the anytime API of AIs (``start``, ``step``, ``current_actions_info``, ``stop``) and decides, for each move, how long to search:
+
+- the base budget is the remaining clock divided by the estimated number of moves left (``estimate_moves_left`` of states, e.g. implied by stones left in Kalah),
+- the base budget is scaled by the branching factor (number of root actions) - the fewer actions, the less time (a forced move is played at once),
+- once the soft budget (scaled base) is used, the search stops unless the decision is unsettled (the second best action's visit count close to the best one's),
+  in which case it is extended up to the hard budget (``extension_factor`` times the base, but never more than ``max_move_fraction`` of the remaining clock),
+- at any moment, the search stops early if the gap between visit counts of the best and the second best action exceeds the number of root visits still achievable within the hard budget
+  (projected from the visits rate so far), i.e. when the decision cannot change anymore.
+
+Root visits are checked periodically (every ``check_fraction`` of the soft budget, and at the hard budget at the latest), so that snapshots of actions information (cheap, but involving kernel launches for ``MCTSNC``) stay rare.
+For each move, the allocation and its outcome are returned as a dictionary (logged by :doc:`game_runner` into moves rounds information).
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+import time
+from ais import is_mctsnc
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+class TimeManager:
+    """
+    Time manager allocating per-move search budgets of an AI from a total game clock (for one player, one game).
+    """
+
+    DEFAULT_MIN_MOVE_TIME = 0.05 # [s]
+    DEFAULT_MAX_MOVE_FRACTION = 0.25 # of remaining clock
+    DEFAULT_EXTENSION_FACTOR = 2.0
+    DEFAULT_CHECK_FRACTION = 0.1 # of soft budget
+    DEFAULT_MOVES_LEFT = 20 # horizon if a state gives no estimate
+    MIN_MOVES_LEFT = 4
+    UNSETTLED_RATIO = 0.9 # second best visits to best visits ratio above which the decision is unsettled
+
+    def __init__(self, game_clock,
+                 min_move_time=DEFAULT_MIN_MOVE_TIME, max_move_fraction=DEFAULT_MAX_MOVE_FRACTION,
+                 extension_factor=DEFAULT_EXTENSION_FACTOR, check_fraction=DEFAULT_CHECK_FRACTION):
+        """
+        Constructor of ``TimeManager`` instances.
+
+        Args:
+            game_clock (float):
+                total time [s] for all moves of a player in one game.
+            min_move_time (float):
+                minimum time [s] of a search (also when the clock has run out), defaults to ``0.05``.
+            max_move_fraction (float):
+                maximum fraction of the remaining clock to be used for a single move, defaults to ``0.25``.
+            extension_factor (float):
+                ratio of the hard budget (for unsettled decisions) to the base budget, defaults to ``2.0``.
+            check_fraction (float):
+                fraction of the soft budget between consecutive checks of root visits, defaults to ``0.1``.
+        """
+        self.game_clock = game_clock
+        self.min_move_time = min_move_time
+        self.max_move_fraction = max_move_fraction
+        self.extension_factor = extension_factor
+        self.check_fraction = check_fraction
+        self.new_game()
+
+    def __str__(self):
+        """
+        Returns a string representation of this ``TimeManager`` instance.
+
+        Returns:
+            str: string representation of this ``TimeManager`` instance.
+        """
+        return f"TimeManager(game_clock={self.game_clock}, min_move_time={self.min_move_time}, max_move_fraction={self.max_move_fraction}, extension_factor={self.extension_factor}, check_fraction={self.check_fraction})"
+
+    def __repr__(self):
+        """
+        Returns a string representation of this ``TimeManager`` instance (equivalent to ``__str__`` method).
+
+        Returns:
+            str: string representation of this ``TimeManager`` instance.
+        """
+        return self.__str__()
+
+    def new_game(self):
+        """Resets the clock for a new game."""
+        self.clock_left = self.game_clock
+
+    def allocate(self, state):
+        """
+        Returns the base budget [s] for a move from the given state (remaining clock spread over the estimated number of moves left) and the estimate of moves left.
+
+        Args:
+            state (State):
+                current state of the game (player to act being the one managed).
+
+        Returns:
+            base_time (float):
+                base budget [s] for the move.
+            moves_left (int):
+                estimated number of moves left for the player.
+        """
+        moves_left = state.estimate_moves_left()
+        if moves_left is None:
+            moves_left = TimeManager.DEFAULT_MOVES_LEFT
+        base_time = max(self.clock_left, 0.0) / max(moves_left, TimeManager.MIN_MOVES_LEFT)
+        return base_time, moves_left
+
+    def _budgets(self, base_time, n_actions, max_actions):
+        """Returns the soft and the hard budget [s] of a move, given its base budget and the branching factor (number of root actions against the maximum number of actions)."""
+        cap = max(self.min_move_time, self.max_move_fraction * self.clock_left)
+        branching_factor = 0.5 + 0.5 * np.log(n_actions) / np.log(max(max_actions, 2)) if n_actions > 1 else 0.0 # forced move -> no search beyond the minimum
+        soft_time = min(max(self.min_move_time, branching_factor * base_time), cap)
+        hard_time = min(max(soft_time, self.extension_factor * base_time), cap)
+        return float(soft_time), float(hard_time)
+
+    @staticmethod
+    def _best_two(actions_info):
+        """Returns visit counts of the best and the second best root action and the total of root visits, given a snapshot of actions information."""
+        ns = sorted([entry["n"] for key, entry in actions_info.items() if key != "best"], reverse=True)
+        best_n = actions_info["best"]["n"]
+        second_n = ns[1] if len(ns) > 1 else 0
+        return best_n, second_n, actions_info["best"]["n_root"]
+
+    def search(self, ai, state):
+        """
+        Carries out a time-managed search of an AI from the given state and charges the time used to the clock.
+
+        Args:
+            ai (object):
+                AI instance (``MCTS`` or ``MCTSNC``).
+            state (State):
+                current state of the game.
+
+        Returns:
+            best_action (int):
+                best action resulting from search.
+            allocation_info (dict):
+                dictionary with information on the allocation: clock left before the move, estimate of moves left, number of root actions, base, soft and hard budgets,
+                time used, steps and the reason for stopping (``"forced"``, ``"gap"``, ``"soft"`` or ``"hard"``).
+        """
+        t1 = time.perf_counter()
+        base_time, moves_left = self.allocate(state)
+        print(f"TIME MANAGER SEARCH... [clock left: {self.clock_left} s, moves left (estimate): {moves_left}, base time: {base_time} s]")
+        if is_mctsnc(ai):
+            ai.start(state.get_board(), state.get_extra_info(), state.get_turn())
+        else:
+            ai.start(state)
+        ai.step()
+        actions_info = ai.current_actions_info()
+        n_actions = len(actions_info) - 1 if actions_info is not None else 1
+        soft_time, hard_time = self._budgets(base_time, n_actions, state.get_max_actions())
+        check_time = max(self.check_fraction * soft_time, 1e-3)
+        stop_reason = "forced" if n_actions <= 1 else None
+        t_next_check = min(t1 + check_time, t1 + hard_time)
+        while stop_reason is None:
+            t = time.perf_counter()
+            if t < t_next_check:
+                ai.step()
+                continue
+            t_next_check = min(t + check_time, t1 + hard_time) # hard budget not overrun by more than one step
+            elapsed = t - t1
+            best_n, second_n, n_root = TimeManager._best_two(ai.current_actions_info())
+            visits_achievable = n_root / elapsed * (hard_time - elapsed) # projected from visits rate so far
+            if elapsed >= hard_time:
+                stop_reason = "hard"
+            elif best_n - second_n > visits_achievable:
+                stop_reason = "gap"
+            elif elapsed >= soft_time and second_n <= TimeManager.UNSETTLED_RATIO * best_n:
+                stop_reason = "soft"
+        best_action = ai.stop()
+        time_used = time.perf_counter() - t1
+        allocation_info = {"clock_left": self.clock_left, "moves_left": moves_left, "n_actions": n_actions,
+                           "base_time": base_time, "soft_time": soft_time, "hard_time": hard_time, "time_used": time_used, "steps": int(ai.steps), "stop_reason": stop_reason}
+        self.clock_left -= time_used
+        print(f"TIME MANAGER SEARCH DONE. [time: {time_used} s; soft time: {soft_time} s, hard time: {hard_time} s, steps: {ai.steps}, stop reason: {stop_reason}, clock left: {self.clock_left} s]")
+        return best_action, allocation_info
@@ -0,0 +1,137 @@
+"""
+Script to carry out a round-robin tournament between AIs identified by short names (see :doc:`ais`), i.e. matches of multiple games for all pairings.
+Each pairing is carried out as a regular experiment (see ``run_match`` in :doc:`match_runner`), hence saved and zipped under its hash string.
+Pairings whose experiments already exist (zip files with the same hash string) are skipped and interrupted ones are resumed from their checkpoints, 
+so that an interrupted tournament can be continued by a rerun.
+Pairings involving only CPU-based AIs are distributed across a pool of processes, pairings involving GPU-based AIs are carried out one after another in the main process.
+Finally, a crosstable of mean scores is printed.
+
+The following variables allow to define the settings of a tournament:
+
+.. code-block:: python
+
+    STATE_CLASS = C4 # C4 or Gomoku or Kalah
+    N_GAMES = 10 # per pairing
+    AIS_SHORTNAMES = ["mcts_1_inf_vanilla", "mcts_5_inf_vanilla", "mctsnc_1_inf_4_128_ocp_thrifty", "mctsnc_1_inf_4_128_acp_prodigal"]
+    N_WORKERS = None # None for the number of CPUs
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from c4 import C4
+from gomoku import Gomoku
+from kalah import Kalah
+from ais import parse_ai_shortname, make_ai
+from match_runner import make_matchup_info, run_match, LINE_SEPARATOR
+from utils import cpu_and_system_props, gpu_props, experiment_hash_str, unzip_and_load_experiment
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+# tournament settings
+STATE_CLASS = C4 # C4 or Gomoku or Kalah
+N_GAMES = 10 # per pairing
+AIS_SHORTNAMES = ["mcts_1_inf_vanilla", "mcts_5_inf_vanilla", "mctsnc_1_inf_4_128_ocp_thrifty", "mctsnc_1_inf_4_128_acp_prodigal"]
+N_WORKERS = None # None for the number of CPUs
+
+# folders
+FOLDER_EXPERIMENTS = "../experiments/"
+
+def pairings(shortnames):
+    """Returns the list of all pairings (pairs of short names, each pair once) for a round-robin tournament."""
+    return [(shortnames[i], shortnames[j]) for i in range(len(shortnames)) for j in range(i + 1, len(shortnames))]
+
+def pairing_hash_str(state_class, ai_a_shortname, ai_b_shortname, n_games, c_props, g_props):
+    """Returns the hash string of the experiment for a pairing (the same as the one a direct run of the match-up would produce)."""
+    ai_a = make_ai(ai_a_shortname, state_class)
+    ai_b = make_ai(ai_b_shortname, state_class)
+    matchup_info = make_matchup_info(state_class, ai_a_shortname, ai_a, ai_b_shortname, ai_b, n_games)
+    return experiment_hash_str(matchup_info, c_props, g_props)
+
+def _run_pairing(state_class, ai_a_shortname, ai_b_shortname, n_games, folder):
+    """Carries out the match for a pairing (in a worker process or in the main process), with own AI instances; returns the experiment's hash string."""
+    ai_a = make_ai(ai_a_shortname, state_class)
+    ai_b = make_ai(ai_b_shortname, state_class)
+    experiment_hs, _ = run_match(state_class, ai_a_shortname, ai_a, ai_b_shortname, ai_b, n_games, folder, resume=True)
+    return experiment_hs
+
+def run_tournament(state_class, shortnames, n_games, folder, n_workers=None):
+    """
+    Carries out a round-robin tournament between AIs defined by short names, skipping pairings with already existing experiments, and returns the crosstable of mean scores.
+
+    Args:
+        state_class (class):
+            class of states (game) to be played (e.g. ``C4``, ``Gomoku``, ``Kalah``).
+        shortnames (list(str)):
+            short names of AIs taking part in the tournament.
+        n_games (int):
+            number of games in the match of each pairing.
+        folder (str):
+            folder with experiments.
+        n_workers (int):
+            number of processes for pairings of CPU-based AIs, ``None`` for the number of CPUs, defaults to ``None``.
+
+    Returns:
+        crosstable (ndarray[np.float64, ndim=2]):
+            array of mean scores, entry ``[i, j]`` is the mean score of AI ``shortnames[i]`` against AI ``shortnames[j]`` (``np.nan`` on the diagonal).
+        experiments_hs (dict):
+            dictionary mapping pairings (pairs of short names) to hash strings of their experiments.
+    """
+    print(f"TOURNAMENT... [game: {state_class.class_repr()}, AIs: {len(shortnames)}, games per pairing: {n_games}]")
+    t1 = time.time()
+    c_props = cpu_and_system_props()
+    g_props = gpu_props()
+    experiments_hs = {}
+    pairings_cpu = []
+    pairings_gpu = []
+    for ai_a_shortname, ai_b_shortname in pairings(shortnames):
+        experiment_hs = pairing_hash_str(state_class, ai_a_shortname, ai_b_shortname, n_games, c_props, g_props)
+        if os.path.isfile(folder + experiment_hs + ".zip"):
+            print(f"[pairing: {ai_a_shortname} vs {ai_b_shortname} skipped, experiment exists: {experiment_hs}]")
+            experiments_hs[(ai_a_shortname, ai_b_shortname)] = experiment_hs
+            continue
+        on_gpu = parse_ai_shortname(ai_a_shortname)["class"] == "MCTSNC" or parse_ai_shortname(ai_b_shortname)["class"] == "MCTSNC"
+        (pairings_gpu if on_gpu else pairings_cpu).append((ai_a_shortname, ai_b_shortname))
+    print(f"[pairings to be played -> CPU only: {len(pairings_cpu)}, with GPU: {len(pairings_gpu)}]")
+    if len(pairings_cpu) > 0:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = {executor.submit(_run_pairing, state_class, ai_a_shortname, ai_b_shortname, n_games, folder): (ai_a_shortname, ai_b_shortname) for ai_a_shortname, ai_b_shortname in pairings_cpu}
+            for future in as_completed(futures):
+                experiments_hs[futures[future]] = future.result()
+                print(f"[pairing: {futures[future][0]} vs {futures[future][1]} done]")
+    for ai_a_shortname, ai_b_shortname in pairings_gpu:
+        experiments_hs[(ai_a_shortname, ai_b_shortname)] = _run_pairing(state_class, ai_a_shortname, ai_b_shortname, n_games, folder)
+        print(f"[pairing: {ai_a_shortname} vs {ai_b_shortname} done]")
+    crosstable = np.full((len(shortnames), len(shortnames)), np.nan)
+    for (ai_a_shortname, ai_b_shortname), experiment_hs in experiments_hs.items():
+        stats = unzip_and_load_experiment(experiment_hs, folder)["stats"]
+        i = shortnames.index(ai_a_shortname)
+        j = shortnames.index(ai_b_shortname)
+        crosstable[i, j] = stats["score_a_mean"]
+        crosstable[j, i] = stats["score_b_mean"]
+    t2 = time.time()
+    print(f"TOURNAMENT DONE. [time: {t2 - t1} s]")
+    return crosstable, experiments_hs
+
+def crosstable_to_str(crosstable, shortnames):
+    """Returns a string representation of a tournament crosstable (mean scores of row AIs against column AIs), with overall mean scores in the last column."""
+    width = max(len(shortname) for shortname in shortnames) + len(str(len(shortnames))) + 4
+    crosstable_str = "".ljust(width) + "".join(str(j + 1).rjust(8) for j in range(len(shortnames))) + "MEAN".rjust(8)
+    for i, shortname in enumerate(shortnames):
+        row = crosstable[i]
+        crosstable_str += "\n" + f"{i + 1}. {shortname}".ljust(width)
+        crosstable_str += "".join(("-" if np.isnan(score) else f"{score:.3f}").rjust(8) for score in row)
+        crosstable_str += f"{np.nanmean(row):.3f}".rjust(8)
+    return crosstable_str
+
+if __name__ == "__main__":
+    crosstable, _ = run_tournament(STATE_CLASS, AIS_SHORTNAMES, N_GAMES, FOLDER_EXPERIMENTS, N_WORKERS)
+    print(LINE_SEPARATOR)
+    print(f"CROSSTABLE [game: {STATE_CLASS.class_repr()}, games per pairing: {N_GAMES}]:")
+    print(crosstable_to_str(crosstable, AIS_SHORTNAMES))
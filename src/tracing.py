@@ -0,0 +1,161 @@
+"""
+Auxiliary module with a low-overhead tracer of search stages, meant to find out where the time of search steps goes.
+A ``Tracer`` instance can be passed to ``MCTS`` (see :doc:`mcts`) or ``MCTSNC`` (see :doc:`mctsnc`) constructors; for each step the search then records events
+(name of stage, start, duration, step index and a stage-specific value) into a preallocated ring buffer (numpy arrays), with timestamps from ``time.perf_counter_ns``
+(the clock of ``time.perf_counter``). With no tracer (default) the only overhead is a check against ``None`` per stage.
+
+Values recorded for stages:
+
+- ``"select"``: depth of the selected node (``MCTS``), ``-1`` if not available at host side (``MCTSNC``),
+- ``"expand"``: number of children expanded (``MCTS``, thrifty variants of ``MCTSNC`` - total over trees), ``-1`` if not available at host side,
+- ``"playout"``: length of playout in moves (``MCTS``), number of playouts (``MCTSNC``),
+- ``"backup"``: number of nodes updated (``MCTS``), ``-1`` for ``MCTSNC``.
+
+Recorded events can be exported to JSON in Chrome trace event format (viewable in ``chrome://tracing`` or Perfetto UI) or summarized per stage.
+
+Link to project repository
+--------------------------
+`https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_
+"""
+
+import numpy as np
+import json
+import os
+import sys
+import time
+
+__author__ = "Przemysław Klęsk"
+__email__ = "pklesk@zut.edu.pl"
+
+class Tracer:
+    """Tracer recording events (stages of search steps) into a preallocated ring buffer; when full, the oldest events are overwritten."""
+
+    DEFAULT_CAPACITY = 2**18 # number of events
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Constructor of ``Tracer`` instances.
+
+        Args:
+            capacity (int):
+                capacity of the ring buffer (number of most recent events kept), defaults to ``2**18``.
+        """
+        self.capacity = capacity
+        self.names = []
+        self.names_ids = {}
+        self.events_names_ids = np.zeros(capacity, dtype=np.int16)
+        self.events_starts = np.zeros(capacity, dtype=np.int64) # [ns]
+        self.events_durations = np.zeros(capacity, dtype=np.int64) # [ns]
+        self.events_steps = np.zeros(capacity, dtype=np.int64)
+        self.events_values = np.zeros(capacity, dtype=np.int64)
+        self.count = 0 # number of events recorded so far (including overwritten ones)
+
+    def __str__(self):
+        """Returns a string representation of this ``Tracer`` instance."""
+        return f"Tracer(capacity={self.capacity}, events recorded: {self.count})"
+
+    def __repr__(self):
+        """Returns a string representation of this ``Tracer`` instance (equivalent to ``__str__`` method)."""
+        return self.__str__()
+
+    def _name_id(self, name):
+        """Returns the identifier of an event name (registering it, if new)."""
+        name_id = self.names_ids.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            self.names.append(name)
+            self.names_ids[name] = name_id
+        return name_id
+
+    def record(self, name, t1_ns, t2_ns, step=-1, value=-1):
+        """
+        Records an event.
+
+        Args:
+            name (str):
+                name of the event (e.g. stage of search).
+            t1_ns (int):
+                start of the event [ns] (as returned by ``time.perf_counter_ns``).
+            t2_ns (int):
+                end of the event [ns] (as returned by ``time.perf_counter_ns``).
+            step (int):
+                index of search step, defaults to ``-1``.
+            value (int):
+                event-specific value (e.g. depth, number of children, length of playout), defaults to ``-1``.
+        """
+        i = self.count % self.capacity
+        self.events_names_ids[i] = self._name_id(name)
+        self.events_starts[i] = t1_ns
+        self.events_durations[i] = t2_ns - t1_ns
+        self.events_steps[i] = step
+        self.events_values[i] = value
+        self.count += 1
+
+    def record_s(self, name, t1, t2, step=-1, value=-1):
+        """Records an event given its start and end in seconds (as returned by ``time.perf_counter``, the same clock as ``time.perf_counter_ns``)."""
+        self.record(name, int(t1 * 1e9), int(t2 * 1e9), step, value)
+
+    def clear(self):
+        """Discards all recorded events."""
+        self.count = 0
+
+    def events(self):
+        """
+        Returns the recorded events (those kept in the ring buffer) in chronological order.
+
+        Returns:
+            events (dict):
+                dictionary with arrays: ``"name"`` (names of events), ``"start"`` [ns], ``"duration"`` [ns], ``"step"``, ``"value"``.
+        """
+        n = min(self.count, self.capacity)
+        order = (np.arange(n) + (self.count - n)) % self.capacity
+        names = np.array(self.names + [""], dtype=str)
+        return {"name": names[self.events_names_ids[order]] if n > 0 else np.array([], dtype=str),
+                "start": self.events_starts[order], "duration": self.events_durations[order], "step": self.events_steps[order], "value": self.events_values[order]}
+
+    def summary(self):
+        """
+        Returns a summary of recorded events (kept in the ring buffer) per name: count, total and mean duration, mean value.
+
+        Returns:
+            summary (dict):
+                dictionary mapping names of events to dictionaries with summaries.
+        """
+        events = self.events()
+        summary = {}
+        for name in self.names:
+            indexes = events["name"] == name
+            durations = events["duration"][indexes]
+            if durations.size > 0:
+                summary[name] = {"count": int(durations.size), "total_[ms]": float(np.sum(durations)) * 1e-6, "mean_[us]": float(np.mean(durations)) * 1e-3,
+                                 "mean_value": float(np.mean(events["value"][indexes]))}
+        return summary
+
+    def summary_str(self):
+        """Returns a string representation of the summary of recorded events (one line per name)."""
+        return "\n".join(f"{name}: " + ", ".join(f"{key}: {value}" for key, value in s.items()) for name, s in self.summary().items())
+
+    def to_chrome_trace(self, fname, process_name="mcts"):
+        """
+        Exports the recorded events (kept in the ring buffer) to a JSON file in Chrome trace event format (complete events, timestamps in microseconds).
+
+        Args:
+            fname (str):
+                name of the JSON file.
+            process_name (str):
+                name of the process shown by trace viewers, defaults to ``"mcts"``.
+        """
+        print(f"TO CHROME TRACE... [to file: {fname}]")
+        t1 = time.time()
+        events = self.events()
+        pid = os.getpid()
+        trace_events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": process_name}}]
+        for name, start, duration, step, value in zip(events["name"].tolist(), events["start"].tolist(), events["duration"].tolist(), events["step"].tolist(), events["value"].tolist()):
+            trace_events.append({"name": name, "ph": "X", "pid": pid, "tid": 0, "ts": start * 1e-3, "dur": duration * 1e-3, "args": {"step": step, "value": value}})
+        try:
+            with open(fname, "w") as f:
+                json.dump({"traceEvents": trace_events, "displayTimeUnit": "ns"}, f)
+        except IOError:
+            sys.exit(f"[error occurred when trying to export trace to file: {fname}]")
+        t2 = time.time()
+        print(f"TO CHROME TRACE DONE. [events: {len(trace_events) - 1}, time: {t2 - t1} s]")
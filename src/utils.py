@@ -1,25 +1,30 @@
 """
 Auxiliary module with simple utility and informative functions.
+Modules ``cpuinfo``, ``psutil`` and ``numba`` are imported on demand (within functions needing them), so that importing this module (and modules of games) is fast.
 
 Link to project repository
 --------------------------
 `https://github.com/pklesk/mcts_numba_cuda <https://github.com/pklesk/mcts_numba_cuda>`_ 
 """
 
-import cpuinfo
 import platform
-import psutil
-from numba import cuda
 import pickle
+import hashlib
 import time
 import zipfile as zf
 import os
 import json
 import sys
+import io
+import queue
+import threading
+from functools import lru_cache, wraps
  
 __author__ = "Przemysław Klęsk"
 __email__ = "pklesk@zut.edu.pl"
 
+EXPERIMENTS_CACHE_SIZE = 8 # max. number of experiments kept in the LRU cache of unzip_and_load_experiment(...)
+
 def dict_to_str(d, indent=0):
     """Returns a vertically formatted string representation of a dictionary."""
     indent_str = indent * " "
@@ -66,8 +71,11 @@ def unpickle_objects(fname):
     print(f"UNPICKLE OBJECTS DONE. [time: {t2 - t1} s]")
     return some_list
 
-def cpu_and_system_props():
-    """Returns a dictionary with properties of CPU and OS."""
+@lru_cache(maxsize=1)
+def _cpu_and_system_props_cached():
+    """Returns a dictionary with properties of CPU and OS (computed once per process, as querying CPU information is slow)."""
+    import cpuinfo
+    import psutil
     props = {}    
     info = cpuinfo.get_cpu_info()
     un = platform.uname()
@@ -78,8 +86,15 @@ def cpu_and_system_props():
     props["os_machine"] = f"{un.machine}"    
     return props    
 
+def cpu_and_system_props():
+    """Returns a dictionary with properties of CPU and OS."""
+    return dict(_cpu_and_system_props_cached())
+
 def gpu_props():
-    """Returns a dictionary with properties of GPU device."""
+    """Returns a dictionary with properties of GPU device (only with ``None`` name if CUDA is not available, e.g. for matches of CPU-based AIs)."""
+    from numba import cuda
+    if not cuda.is_available():
+        return {"name": None}
     gpu = cuda.get_current_device()
     props = {}
     #props["name"] = gpu.name.decode("ASCII")
@@ -138,6 +153,30 @@ def gpu_props():
     props["cores_total"] = props["cores_per_SM"] * gpu.MULTIPROCESSOR_COUNT
     return props
 
+def lazy_jit(signature, **jit_kwargs):
+    """
+    Decorator equivalent to ``numba.jit(signature, **jit_kwargs)``, but deferring the import of ``numba`` and the compilation (or loading from cache) until the first call.
+    The original Python function remains available via ``py_func`` attribute of the decorated function.
+
+    Args:
+        signature (str):
+            signature of the function in numba's string format, e.g. ``"int8(int8[:, :], int8[:])"``.
+        jit_kwargs (dict):
+            keyword arguments for ``numba.jit``, e.g. ``nopython=True, cache=True``.
+    """
+    def decorator(py_func):
+        dispatcher = None
+        @wraps(py_func)
+        def wrapper(*args):
+            nonlocal dispatcher
+            if dispatcher is None:
+                from numba import jit
+                dispatcher = jit(signature, **jit_kwargs)(py_func)
+            return dispatcher(*args)
+        wrapper.py_func = py_func
+        return wrapper
+    return decorator
+
 def hash_function(s):
     """Returns a hash code (integer) for given string as a base 31 expansion."""
     h = 0
@@ -149,22 +188,105 @@ def hash_function(s):
 def hash_str(params, digits):
     return str((hash_function(str(params)) & ((1 << 32) - 1)) % 10**digits).rjust(digits, "0") 
 
+def position_hash(board, extra_info, turn):
+    """Returns a 64-bit hash code (unsigned integer) of a position given by its board, extra information (or ``None``) and turn, e.g. as a key in opening books."""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(str(board.shape).encode())
+    h.update(board.tobytes())
+    if extra_info is not None:
+        h.update(extra_info.tobytes())
+    h.update(b"+" if turn > 0 else b"-")
+    return int.from_bytes(h.digest(), "little")
+
 class Logger:
-    """Class for simultaneous logging to console and a log file (for purposes of experiments)."""
+    """
+    Class for simultaneous logging to console and a log file (for purposes of experiments).
+    Messages are collected in an in-memory buffer and handed over in chunks (via a bounded queue) to a background thread writing them, in order, 
+    so that printing does not wait for I/O. The buffer is handed over when it exceeds ``BUFFER_SIZE`` characters or on ``flush``; 
+    if no chunk arrives for ``FLUSH_INTERVAL`` seconds, the writer thread takes the buffer over and writes it directly.
+    Hand-overs are serialized by a separate lock (keeping chunks in order), and waiting for room in the queue never happens with the buffer's lock held,
+    so printing threads are not blocked by a full queue; the writer thread never waits for the hand-over lock (it would wait for itself).
+    """
+    BUFFER_SIZE = 2**16 # number of characters collected before handing them over to the writer thread
+    QUEUE_SIZE = 64 # max. number of chunks waiting to be written (when reached, handing over waits for the writer thread)
+    FLUSH_INTERVAL = 0.5 # [s]
+    
     def __init__(self, fname):
-        """Constructor of ``MCTSNC`` instances."""
-        self.logfile = open(fname, "a", encoding="utf-8")  
+        """Constructor of ``Logger`` instances, opens the log file (for appending) and starts the writer thread."""
+        self.logfile = open(fname, "a", encoding="utf-8")
+        self.buffer = []
+        self.buffer_size = 0
+        self.lock = threading.Lock() # guards the buffer
+        self.hand_over_lock = threading.Lock() # serializes hand-overs (taking the buffer and putting it into the queue)
+        self.queue = queue.Queue(maxsize=Logger.QUEUE_SIZE)
+        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.writer_thread.start()
+    
+    def _take_buffer(self):
+        """Returns the buffered messages as one chunk (or ``None`` if there are none) and empties the buffer."""
+        with self.lock:
+            if self.buffer_size == 0:
+                return None
+            chunk = "".join(self.buffer)
+            self.buffer = []
+            self.buffer_size = 0
+            return chunk
+        
+    def _hand_over(self):
+        """Hands over the buffered messages, as one chunk, to the writer thread (waits for room in the queue if it is full; not to be called by the writer thread)."""
+        with self.hand_over_lock:
+            chunk = self._take_buffer()
+            if chunk is not None:
+                self.queue.put(chunk)
+    
+    def _write_chunk(self, chunk):
+        """Writes a chunk to the log file and console."""
+        self.logfile.write(chunk)
+        self.logfile.flush()
+        sys.__stdout__.write(chunk)
+        
+    def _writer_loop(self):
+        """Loop of the writer thread: writes chunks taken from the queue to the log file and console, until ``None`` is taken; periodically takes over the buffer if no chunk arrives."""
+        while True:
+            try:
+                chunk = self.queue.get(timeout=Logger.FLUSH_INTERVAL)
+            except queue.Empty:
+                if self.hand_over_lock.acquire(blocking=False): # hand-over in progress otherwise (its chunk to be taken from the queue)
+                    try:
+                        chunk = self._take_buffer() if self.queue.empty() else None # chunks already queued are earlier than the buffer
+                        if chunk is not None:
+                            self._write_chunk(chunk) # with hand-over lock held, so that a concurrent flush waits for it
+                    finally:
+                        self.hand_over_lock.release()
+                continue
+            if chunk is not None:
+                self._write_chunk(chunk)
+            self.queue.task_done()
+            if chunk is None:
+                break
         
     def write(self, message):
-        """Writes a message to console and a log file.""" 
-        self.logfile.write(message)
-        self.logfile.flush() 
-        sys.__stdout__.write(message)
+        """Buffers a message to be written to console and a log file.""" 
+        with self.lock:
+            self.buffer.append(message)
+            self.buffer_size += len(message)
+            full = self.buffer_size >= Logger.BUFFER_SIZE
+        if full:
+            self._hand_over()
 
     def flush(self):
-        """Empty function required for buffering."""
-        pass  
-    
+        """Hands over the buffered messages and waits until all of them are written to console and a log file."""
+        self._hand_over()
+        self.queue.join()
+        sys.__stdout__.flush()
+        
+    def close(self):
+        """Writes all buffered messages, stops the writer thread and closes the log file."""
+        self.flush()
+        self.queue.put(None)
+        self.writer_thread.join()
+        self.logfile.close()
+
 def experiment_hash_str(matchup_info, c_props, g_props, main_hs_digits=10, matchup_hs_digits=5, env_hs_digits=3):
     """Returns a hash string for an experiment, based on its settings and properties."""
     matchup_hs = hash_str(matchup_info, digits=matchup_hs_digits)
@@ -175,8 +297,60 @@ def experiment_hash_str(matchup_info, c_props, g_props, main_hs_digits=10, match
     hs = f"{all_hs}_{matchup_hs}_{env_hs}_[{matchup_info['ai_a_shortname']};{matchup_info['ai_b_shortname']};{matchup_info['game_name']};{matchup_info['n_games']}]"
     return hs
 
+def checkpoint_fpath(experiment_hs, folder):
+    """Returns the path of the checkpoint file (JSON lines, one per finished game) for an experiment given its hash string."""
+    return folder + experiment_hs + ".checkpoint.jsonl"
+
+def append_game_checkpoint(experiment_hs, game_index, outcome, game_info, folder):
+    """Appends a line with results of a finished game to the checkpoint file of an experiment and forces it to disk."""
+    line = json.dumps({"game_index": int(game_index), "outcome": int(outcome), "game_info": game_info}) + "\n"
+    try:
+        with open(checkpoint_fpath(experiment_hs, folder), "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+    except IOError:
+        sys.exit(f"[error occurred when trying to append game checkpoint: {experiment_hs}]")
+
+def reset_game_checkpoints(experiment_hs, folder, checkpoints=None):
+    """Atomically replaces the checkpoint file of an experiment with one containing only the given (game_index, outcome, game_info) tuples (none by default)."""
+    fpath = checkpoint_fpath(experiment_hs, folder)
+    try:
+        with open(fpath + ".tmp", "w", encoding="utf-8") as f:
+            for game_index, outcome, game_info in checkpoints or []:
+                f.write(json.dumps({"game_index": int(game_index), "outcome": int(outcome), "game_info": game_info}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(fpath + ".tmp", fpath)
+    except IOError:
+        sys.exit(f"[error occurred when trying to reset game checkpoints: {experiment_hs}]")
+
+def load_game_checkpoints(experiment_hs, folder):
+    """Returns a list of (game_index, outcome, game_info) tuples for consecutive games (from the first one) found in the checkpoint file of an experiment; an incomplete trailing line is ignored."""
+    fpath = checkpoint_fpath(experiment_hs, folder)
+    checkpoints = []
+    if not os.path.isfile(fpath):
+        return checkpoints
+    print(f"LOAD GAME CHECKPOINTS... [hash string: {experiment_hs}]")
+    t1 = time.time()
+    try:
+        with open(fpath, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break # game interrupted while its checkpoint was being written
+                if entry["game_index"] != len(checkpoints) + 1:
+                    break
+                checkpoints.append((entry["game_index"], entry["outcome"], entry["game_info"]))
+    except IOError:
+        sys.exit(f"[error occurred when trying to load game checkpoints: {experiment_hs}]")
+    t2 = time.time()
+    print(f"LOAD GAME CHECKPOINTS DONE. [games: {len(checkpoints)}, time: {t2 - t1} s]")
+    return checkpoints
+
 def save_and_zip_experiment(experiment_hs, experiment_info, folder):
-    """Saves and zips .json and .log files for an experiment given its hash string and information stored in a dictionary."""
+    """Saves and zips .json and .log files for an experiment given its hash string and information stored in a dictionary (removes its checkpoint file, if any)."""
     print(f"SAVE AND ZIP EXPERIMENT... [hash string: {experiment_hs}]")
     t1 = time.time()
     fpath = folder + experiment_hs    
@@ -189,25 +363,112 @@ def save_and_zip_experiment(experiment_hs, experiment_info, folder):
                 archive.write(fpath + ".log", arcname=experiment_hs + ".log")
         os.remove(fpath + ".json")
         os.remove(fpath + ".log") 
+        if os.path.isfile(checkpoint_fpath(experiment_hs, folder)):
+            os.remove(checkpoint_fpath(experiment_hs, folder))
     except IOError:
         pass
         #sys.exit(f"[error occurred when trying to save and zip experiment info: {fname}]")            
     t2 = time.time()
     print(f"SAVE AND ZIP EXPERIMENT DONE. [time: {t2 - t1} s]")
 
-def unzip_and_load_experiment(experiment_hs, folder):
-    """Unzips, loads an experiment given its hash string, and returns a dictionary with experiments' information."""
+class ExperimentWriter:
+    """
+    Class for streaming an experiment into its zip file while the match goes on (an alternative to ``save_and_zip_experiment``, with memory usage not growing with the number of games).
+    Information on each game is compressed into the .json member as soon as the game is finished, then discarded.
+    The zip file is built under a temporary name and gets its final name (the one checked by ``unzip_and_load_experiment``) only once complete.
+    The layout of the .json member is the same as the one written by ``save_and_zip_experiment``.
+    """
+    
+    INDENT = 2
+    
+    def __init__(self, experiment_hs, folder, matchup_info, c_props, g_props):
+        """
+        Constructor of ``ExperimentWriter`` instances, opens the (temporary) zip file and writes the leading part of .json member.
+        
+        Args:
+            experiment_hs (str):
+                hash string of the experiment.
+            folder (str):
+                folder with experiments.
+            matchup_info (dict):
+                match-up information.
+            c_props (dict):
+                CPU and system properties.
+            g_props (dict):
+                GPU properties.
+        """
+        self.experiment_hs = experiment_hs
+        self.folder = folder
+        self.fpath = folder + experiment_hs
+        self.n_games_written = 0
+        self.archive = zf.ZipFile(self.fpath + ".zip.part", mode="w", compression=zf.ZIP_DEFLATED)
+        self.json_member = io.TextIOWrapper(self.archive.open(experiment_hs + ".json", mode="w", force_zip64=True), encoding="utf-8")
+        self.json_member.write("{\n")
+        for key, value in [("matchup_info", matchup_info), ("cpu_and_system_props", c_props), ("gpu_props", g_props)]:
+            self.json_member.write(self._entry_str(key, value, 1) + ",\n")
+        self.json_member.write(ExperimentWriter.INDENT * " " + "\"games_infos\": {")
+        
+    def _entry_str(self, key, value, level):
+        """Returns a string with a key-value entry of a JSON object nested at given level (formatted as by ``json.dump`` with the class indent)."""
+        indent_str = level * ExperimentWriter.INDENT * " "
+        return indent_str + json.dumps(key) + ": " + json.dumps(value, indent=ExperimentWriter.INDENT).replace("\n", "\n" + indent_str)
+    
+    def write_game(self, game_index, game_info):
+        """Writes (compresses) information on a finished game into the .json member; games are expected to be written in order of their indexes."""
+        self.json_member.write(("," if self.n_games_written > 0 else "") + "\n" + self._entry_str(str(game_index), game_info, 2))
+        self.n_games_written += 1
+    
+    def close(self, stats):
+        """Writes the trailing part of .json member (with given stats), adds the .log file, gives the zip file its final name and removes the log file and the checkpoint file (if any)."""
+        print(f"SAVE AND ZIP EXPERIMENT... [hash string: {self.experiment_hs}]")
+        t1 = time.time()
+        indent_str = ExperimentWriter.INDENT * " "
+        self.json_member.write(("\n" + indent_str + "}" if self.n_games_written > 0 else "}") + ",\n" + self._entry_str("stats", stats, 1) + "\n}")
+        self.json_member.close()
+        try:
+            if os.path.isfile(self.fpath + ".log"):
+                self.archive.write(self.fpath + ".log", arcname=self.experiment_hs + ".log")
+            self.archive.close()
+            os.replace(self.fpath + ".zip.part", self.fpath + ".zip")
+            if os.path.isfile(self.fpath + ".log"):
+                os.remove(self.fpath + ".log")
+            if os.path.isfile(checkpoint_fpath(self.experiment_hs, self.folder)):
+                os.remove(checkpoint_fpath(self.experiment_hs, self.folder))
+        except IOError:
+            sys.exit(f"[error occurred when trying to save and zip experiment info: {self.experiment_hs}]")
+        t2 = time.time()
+        print(f"SAVE AND ZIP EXPERIMENT DONE. [time: {t2 - t1} s]")
+
+def _load_zipped_experiment(experiment_hs, folder):
+    """Loads an experiment given its hash string by parsing the .json member of its zip file straight from the decompressed stream (no extraction to disk)."""
+    try:
+        with zf.ZipFile(folder + experiment_hs + ".zip", "r") as zip_ref:
+            with zip_ref.open(experiment_hs + ".json", "r") as json_member:
+                return json.load(io.TextIOWrapper(json_member, encoding="utf-8"))
+    except (IOError, KeyError, zf.BadZipFile):
+        sys.exit(f"[error occurred when trying to unzip and load experiment info: {experiment_hs}]")
+
+@lru_cache(maxsize=EXPERIMENTS_CACHE_SIZE)
+def _load_zipped_experiment_cached(experiment_hs, folder, zip_mtime):
+    """Loads an experiment (see ``_load_zipped_experiment``) caching the result; the modification time of the zip file is a part of the key, so that modified experiments are reloaded."""
+    return _load_zipped_experiment(experiment_hs, folder)
+
+def unzip_and_load_experiment(experiment_hs, folder, use_cache=True):
+    """
+    Unzips, loads an experiment given its hash string, and returns a dictionary with experiments' information.
+    With ``use_cache`` set, recently loaded experiments are kept in an LRU cache (keyed by hash string and modification time of the zip file) and the same dictionary 
+    is returned for repeated loads - it should then be treated as read-only.
+    """
     print(f"UNZIP AND LOAD EXPERIMENT... [hash string: {experiment_hs}]")
     t1 = time.time()
-    fpath = folder + experiment_hs    
-    try:        
-        with zf.ZipFile(fpath + ".zip", "r") as zip_ref:
-            zip_ref.extract(experiment_hs + ".json", path=os.path.dirname(fpath + ".json"))            
-        with open(fpath + ".json", 'r', encoding="utf-8") as json_file:
-            experiment_info = json.load(json_file) 
-        os.remove(fpath + ".json") # TODO uncomment this back, to have extracted file removed once used
-    except IOError:
-        sys.exit(f"[error occurred when trying to unzip and load experiment info: {experiment_hs}]")            
+    if use_cache:
+        try:
+            zip_mtime = os.path.getmtime(folder + experiment_hs + ".zip")
+        except OSError:
+            sys.exit(f"[error occurred when trying to unzip and load experiment info: {experiment_hs}]")
+        experiment_info = _load_zipped_experiment_cached(experiment_hs, folder, zip_mtime)
+    else:
+        experiment_info = _load_zipped_experiment(experiment_hs, folder)
     t2 = time.time()
     print(f"UNZIP AND LOAD EXPERIMENT DONE. [time: {t2 - t1} s]")
     return experiment_info
\ No newline at end of file